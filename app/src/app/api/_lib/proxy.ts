@@ -21,6 +21,8 @@ interface ProxyOptions {
   sanitize?: boolean
   /** Request timeout in milliseconds */
   timeout?: number
+  /** Forward If-None-Match and pass the backend ETag / 304 through (browser may store, must revalidate) */
+  revalidate?: boolean
 }
 
 /**
@@ -71,7 +73,7 @@ export async function proxyToBackend(
   backendPath: string,
   options: ProxyOptions = {}
 ): Promise<NextResponse> {
-  const { sanitize = true, timeout = TIMEOUT_MS } = options
+  const { sanitize = true, timeout = TIMEOUT_MS, revalidate = false } = options
 
   try {
     // Get query params from request
@@ -91,12 +93,15 @@ export async function proxyToBackend(
     const timeoutId = setTimeout(() => controller.abort(), timeout)
     request.signal.addEventListener('abort', () => controller.abort(), { once: true })
 
+    const ifNoneMatch = revalidate ? request.headers.get('if-none-match') : null
+
     try {
       const response = await fetch(url, {
         method: 'GET',
         headers: {
           'Accept': 'application/json',
           ...(BFF_SECRET && { 'X-BFF-Secret': BFF_SECRET }),
+          ...(ifNoneMatch && { 'If-None-Match': ifNoneMatch }),
         },
         signal: controller.signal,
         cache: 'no-store',  // Never cache API proxy responses — always hit backend
@@ -104,6 +109,14 @@ export async function proxyToBackend(
 
       clearTimeout(timeoutId)
 
+      const etag = revalidate ? response.headers.get('etag') : null
+      if (revalidate && response.status === 304) {
+        return new NextResponse(null, {
+          status: 304,
+          headers: { 'Cache-Control': 'private, no-cache', ...(etag && { 'ETag': etag }) },
+        })
+      }
+
       if (!response.ok) {
         const errorText = await response.text()
         console.error(`[BFF] Backend ${response.status}: ${errorText}`)
@@ -122,7 +135,12 @@ export async function proxyToBackend(
 
       const data = JSON.parse(text)
       const nextResponse = NextResponse.json(data)
-      nextResponse.headers.set('Cache-Control', 'private, no-cache, no-store, must-revalidate')
+      if (etag) {
+        nextResponse.headers.set('ETag', etag)
+        nextResponse.headers.set('Cache-Control', 'private, no-cache')
+      } else {
+        nextResponse.headers.set('Cache-Control', 'private, no-cache, no-store, must-revalidate')
+      }
       return nextResponse
 
     } finally {
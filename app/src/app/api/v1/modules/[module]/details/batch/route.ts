@@ -0,0 +1,125 @@
+/**
+ * POST /api/v1/modules/{module}/details/batch
+ *
+ * Details and grouping counts for one or more rows in one request.
+ * Body: { primary_values, group_by?, jaar?, q?, filters?, include_grouping_counts? }
+ * Response: { success, module, results: { [primary_value]: { details, grouping_counts } } }
+ */
+
+import { NextRequest, NextResponse } from 'next/server'
+import { validateModule, BACKEND_API_URL, TIMEOUT_MS, BFF_SECRET } from '../../../../../_lib/proxy'
+import { getAuthenticatedUser, unauthorizedResponse } from '../../../../../_lib/auth'
+
+// Force dynamic — never cache API proxy responses server-side
+export const dynamic = 'force-dynamic'
+
+// Same limits as the backend (100 values of max 500 characters)
+const MAX_BODY_BYTES = 65536
+const MAX_VALUES = 100
+const MAX_VALUE_LENGTH = 500
+
+interface RouteParams {
+  params: Promise<{ module: string }>
+}
+
+export async function POST(request: NextRequest, { params }: RouteParams) {
+  const session = await getAuthenticatedUser()
+  if (!session) return unauthorizedResponse()
+
+  const { module } = await params
+
+  if (!validateModule(module)) {
+    return NextResponse.json(
+      { error: 'Invalid module name' },
+      { status: 400 }
+    )
+  }
+
+  try {
+    // Body size check — read actual body bytes, not trust Content-Length header
+    const rawBody = await request.text()
+    if (rawBody.length > MAX_BODY_BYTES) {
+      return NextResponse.json({ error: 'Payload too large' }, { status: 413 })
+    }
+
+    let body: unknown
+    try {
+      body = JSON.parse(rawBody)
+    } catch {
+      return NextResponse.json({ error: 'Invalid JSON' }, { status: 400 })
+    }
+
+    // Schema validation (backend validates the rest)
+    const values = body && typeof body === 'object' ? (body as Record<string, unknown>).primary_values : undefined
+    if (
+      !Array.isArray(values) || values.length === 0 || values.length > MAX_VALUES ||
+      values.some((v) => typeof v !== 'string' || v.length === 0 || v.length > MAX_VALUE_LENGTH)
+    ) {
+      return NextResponse.json({ error: 'Invalid request body' }, { status: 400 })
+    }
+
+    const filters = (body as Record<string, unknown>).filters
+    if (filters !== undefined) {
+      if (!filters || typeof filters !== 'object') {
+        return NextResponse.json({ error: 'Invalid request body' }, { status: 400 })
+      }
+      for (const filterValues of Object.values(filters as Record<string, unknown>)) {
+        if (Array.isArray(filterValues) && filterValues.length > 100) {
+          return NextResponse.json({ error: 'Too many filter values per key (max 100)' }, { status: 400 })
+        }
+      }
+    }
+
+    const controller = new AbortController()
+    const timeoutId = setTimeout(() => controller.abort(), TIMEOUT_MS)
+
+    try {
+      const response = await fetch(
+        `${BACKEND_API_URL}/api/v1/modules/${module}/details/batch`,
+        {
+          method: 'POST',
+          headers: {
+            'Content-Type': 'application/json',
+            'Accept': 'application/json',
+            ...(BFF_SECRET && { 'X-BFF-Secret': BFF_SECRET }),
+          },
+          body: JSON.stringify(body),
+          signal: controller.signal,
+        }
+      )
+
+      clearTimeout(timeoutId)
+
+      if (!response.ok) {
+        const errorText = await response.text()
+        console.error(`[BFF] Backend ${response.status}: ${errorText}`)
+        return NextResponse.json(
+          { error: 'Request failed' },
+          { status: response.status >= 500 ? 502 : response.status }
+        )
+      }
+
+      const data = await response.json()
+      return NextResponse.json(data, {
+        headers: { 'Cache-Control': 'private, no-cache, no-store, must-revalidate' },
+      })
+
+    } finally {
+      clearTimeout(timeoutId)
+    }
+
+  } catch (error) {
+    if (error instanceof Error && error.name === 'AbortError') {
+      return NextResponse.json(
+        { error: 'Request timeout' },
+        { status: 504 }
+      )
+    }
+
+    console.error('[BFF Proxy] details batch error:', error)
+    return NextResponse.json(
+      { error: 'Internal server error' },
+      { status: 500 }
+    )
+  }
+}
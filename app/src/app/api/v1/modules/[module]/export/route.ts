@@ -0,0 +1,84 @@
+/**
+ * GET /api/v1/modules/{module}/export
+ *
+ * Full result set as CSV or XLSX (same query parameters as the module table,
+ * plus format=csv|xlsx). The backend streams the file from a database cursor;
+ * the body is passed through as a stream, so no full file is held here.
+ */
+
+import { NextRequest, NextResponse } from 'next/server'
+import { validateModule, BACKEND_API_URL, TIMEOUT_MS, BFF_SECRET } from '../../../../_lib/proxy'
+import { getAuthenticatedUser, unauthorizedResponse } from '../../../../_lib/auth'
+
+// Force dynamic — never cache API proxy responses server-side
+export const dynamic = 'force-dynamic'
+
+interface RouteParams {
+  params: Promise<{ module: string }>
+}
+
+export async function GET(request: NextRequest, { params }: RouteParams) {
+  const session = await getAuthenticatedUser()
+  if (!session) return unauthorizedResponse()
+
+  const { module } = await params
+
+  if (!validateModule(module)) {
+    return NextResponse.json(
+      { error: 'Invalid module name' },
+      { status: 400 }
+    )
+  }
+
+  const queryString = request.nextUrl.searchParams.toString()
+  const url = `${BACKEND_API_URL}/api/v1/modules/${module}/export${queryString ? `?${queryString}` : ''}`
+
+  // Timeout applies until the backend starts the download, not to the transfer;
+  // a closed browser connection cancels the backend stream
+  const controller = new AbortController()
+  const timeoutId = setTimeout(() => controller.abort(), TIMEOUT_MS)
+  request.signal.addEventListener('abort', () => controller.abort(), { once: true })
+
+  try {
+    const response = await fetch(url, {
+      method: 'GET',
+      headers: {
+        ...(BFF_SECRET && { 'X-BFF-Secret': BFF_SECRET }),
+      },
+      signal: controller.signal,
+      cache: 'no-store',
+    })
+
+    if (!response.ok || !response.body) {
+      const errorText = await response.text()
+      console.error(`[BFF] Backend ${response.status}: ${errorText}`)
+      return NextResponse.json(
+        { error: 'Request failed' },
+        { status: response.status >= 500 || response.ok ? 502 : response.status }
+      )
+    }
+
+    const headers = new Headers({ 'Cache-Control': 'private, no-store' })
+    for (const name of ['Content-Type', 'Content-Disposition']) {
+      const value = response.headers.get(name)
+      if (value) headers.set(name, value)
+    }
+    return new NextResponse(response.body, { status: 200, headers })
+
+  } catch (error) {
+    if (error instanceof Error && error.name === 'AbortError') {
+      return NextResponse.json(
+        { error: 'Request timeout' },
+        { status: 504 }
+      )
+    }
+
+    console.error('[BFF Proxy] export error:', error instanceof Error ? error.message : 'Unknown error')
+    return NextResponse.json(
+      { error: 'Internal server error' },
+      { status: 500 }
+    )
+  } finally {
+    clearTimeout(timeoutId)
+  }
+}
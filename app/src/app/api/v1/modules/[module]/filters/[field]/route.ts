@@ -2,6 +2,7 @@
  * GET /api/v1/modules/{module}/filters/{field}
  *
  * Fetches filter options for a specific field in a module.
+ * Passes the backend ETag through, so repeat dropdown opens revalidate (304).
  */
 
 import { NextRequest, NextResponse } from 'next/server'
@@ -40,5 +41,6 @@ export async function GET(request: NextRequest, { params }: RouteParams) {
     )
   }
 
-  return proxyToBackend(request, `/api/v1/modules/${module}/filters/${field}`, { sanitize: true })
+  // Values change only with the dataset generation: revalidate with the backend ETag
+  return proxyToBackend(request, `/api/v1/modules/${module}/filters/${field}`, { sanitize: true, revalidate: true })
 }
@@ -219,76 +219,59 @@ export function ExpandedRow({
   const extraCols = isSearching ? 1 : extraColumnsCount
   const contentColSpan = 2 + extraCols
 
-  // Fetch grouping counts once when the row expands (not on grouping change)
-  useEffect(() => {
-    if (module === 'integraal' || groupableFields.length <= 1) return
-
-    const abortController = new AbortController()
-
-    async function fetchCounts() {
-      try {
-        const encodedValue = encodeURIComponent(encodeURIComponent(row.primary_value))
-        const url = `${API_BASE_URL}/api/v1/modules/${module}/${encodedValue}/grouping-counts`
-        const response = await fetch(url, { signal: abortController.signal })
-        if (!response.ok) return
-        const data = await response.json()
-        if (!abortController.signal.aborted) {
-          setGroupingCounts(data)
-        }
-      } catch (err) {
-        if (abortController.signal.aborted) return
-        // Track error but don't break UX — counts are a nice-to-have enhancement
-        track('error', module, { message: err instanceof Error ? err.message : 'Grouping counts fetch failed', trigger: 'row_expand' })
-      }
-    }
+  // Grouping counts belong to the row, not the grouping: they come with the
+  // first details request and are kept when only the grouping changes
+  const countsLoadedFor = useRef<string | null>(null)
 
-    fetchCounts()
-    return () => { abortController.abort() }
-  }, [row.primary_value, module, groupableFields.length])
-
-  // Fetch details when row is expanded or grouping changes
+  // Fetch details when row is expanded or grouping changes. One batch request
+  // returns the details and, on first expand, the grouping counts.
   useEffect(() => {
     const abortController = new AbortController()
+    const countsKey = `${module}:${row.primary_value}`
+    const needsCounts = module !== 'integraal' && groupableFields.length > 1 && countsLoadedFor.current !== countsKey
 
     async function fetchDetails() {
       setIsLoading(true)
       setError(null)
 
       try {
-        // Double-encode to preserve %2F through Next.js routing (slashes in kostensoort like "Vaklit/abonn/overig")
-        const encodedValue = encodeURIComponent(encodeURIComponent(row.primary_value))
-
-        // Build scoped URL: search term (for secondary matches) + active filters
-        let detailUrl = `${API_BASE_URL}/api/v1/modules/${module}/${encodedValue}/details?group_by=${grouping}`
-
-        // If this row is a secondary match (amounts from filtered source table),
-        // scope detail query to search term. Note: primary matches can also have
-        // matchedField set (after enrichment for "Komt ook voor in" display),
-        // but their amounts are full aggregated totals — don't filter their details.
-        if (row.isSecondaryMatch && searchQuery) {
-          detailUrl += `&q=${encodeURIComponent(searchQuery)}`
-        }
-
         // Always pass active multiselect filters (scopes detail rows to match parent)
+        const filters: Record<string, string[]> = {}
         if (activeFilters) {
           for (const [field, values] of Object.entries(activeFilters)) {
             if (Array.isArray(values) && values.length > 0) {
-              for (const v of values) {
-                detailUrl += `&${encodeURIComponent(field)}=${encodeURIComponent(v)}`
-              }
+              filters[field] = values
             }
           }
         }
 
-        const url = detailUrl
-
-        const response = await fetch(url, { signal: abortController.signal })
+        const response = await fetch(`${API_BASE_URL}/api/v1/modules/${module}/details/batch`, {
+          method: 'POST',
+          headers: { 'Content-Type': 'application/json' },
+          body: JSON.stringify({
+            primary_values: [row.primary_value],
+            group_by: grouping,
+            // If this row is a secondary match (amounts from filtered source table),
+            // scope detail query to search term. Note: primary matches can also have
+            // matchedField set (after enrichment for "Komt ook voor in" display),
+            // but their amounts are full aggregated totals — don't filter their details.
+            q: row.isSecondaryMatch && searchQuery ? searchQuery : null,
+            filters,
+            include_grouping_counts: needsCounts,
+          }),
+          signal: abortController.signal,
+        })
         if (!response.ok) {
           throw new Error('Fout bij laden details')
         }
 
         const data = await response.json()
-        setDetails(data.details || [])
+        const result = data.results?.[row.primary_value]
+        setDetails(result?.details || [])
+        if (needsCounts && result) {
+          countsLoadedFor.current = countsKey
+          setGroupingCounts(result.grouping_counts)
+        }
       } catch (err) {
         if (abortController.signal.aborted) return
         console.error('[ExpandedRow]', err instanceof Error ? err.message : err)
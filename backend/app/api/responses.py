@@ -0,0 +1,110 @@
+"""
+Fast JSON responses for endpoints with a pydantic response model.
+
+FastAPI's default path builds a model per row (AggregatedRow(**row) for up to
+500 table rows), validates the response model and serializes it again. The
+fast path writes the service-layer dicts straight to JSON with orjson, shaped
+the way the response model dumps them:
+
+- model field order, defaults filled in for missing fields
+- keys the model does not declare dropped
+- int dict keys (years) as strings
+
+Values are not converted: the service layer already returns the model types
+(int amounts, str values). The routes keep response_model=..., so the OpenAPI
+schema does not change. tests/test_response_contract.py checks that both paths
+produce the same bytes.
+
+Without orjson (optional dependency) or with ORJSON_RESPONSES=false, and when
+a value cannot be written (e.g. a Decimal), the response model is validated
+and serialized by FastAPI as before.
+"""
+import logging
+import typing
+from functools import lru_cache
+from typing import Any
+
+from fastapi.responses import Response
+from pydantic import BaseModel
+
+from app.config import get_settings
+
+try:
+    import orjson
+except ImportError:  # Optional dependency (requirements.txt), pydantic serialization only
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+
+class FastJSONResponse(Response):
+    """JSON body written by orjson (compact, UTF-8, non-str keys as strings)."""
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+def _nested_model(annotation) -> tuple[str, type[BaseModel]] | None:
+    """("model" | "list" | "dict", model) for fields holding response models."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return "model", annotation
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+    if origin is list and args and isinstance(args[0], type) and issubclass(args[0], BaseModel):
+        return "list", args[0]
+    if origin is dict and len(args) == 2 and isinstance(args[1], type) and issubclass(args[1], BaseModel):
+        return "dict", args[1]
+    return None
+
+
+@lru_cache(maxsize=None)
+def _model_plan(model: type[BaseModel]) -> tuple:
+    """Per field: (name, field info, nested model or None), in model field order."""
+    return tuple(
+        (name, field, _nested_model(field.annotation))
+        for name, field in model.model_fields.items()
+    )
+
+
+def shape_model(model: type[BaseModel], data: dict) -> dict:
+    """
+    data as model.model_validate(data) dumps it: field order, defaults, nested
+    models. Raises KeyError when a required field is missing.
+    """
+    result = {}
+    for name, field, nested in _model_plan(model):
+        if name in data:
+            value = data[name]
+        elif field.is_required():
+            raise KeyError(name)
+        else:
+            value = field.get_default(call_default_factory=True, validated_data=result)
+
+        if nested is not None and value is not None:
+            kind, inner = nested
+            if kind == "model":
+                value = shape_model(inner, value)
+            elif kind == "list":
+                value = [shape_model(inner, item) for item in value]
+            else:
+                value = {key: shape_model(inner, item) for key, item in value.items()}
+        result[name] = value
+    return result
+
+
+def model_response(model: type[BaseModel], data: dict) -> Response | BaseModel:
+    """
+    Response for an endpoint declared with response_model=model.
+
+    Returns a FastJSONResponse when the fast path is available, else the
+    validated model (serialized by FastAPI). Validation errors of the model
+    path are raised as usual.
+    """
+    if orjson is not None and get_settings().orjson_responses:
+        try:
+            return FastJSONResponse(shape_model(model, data))
+        except (KeyError, TypeError, AttributeError) as e:
+            # Missing field or value orjson cannot write: let pydantic validate/convert
+            logger.warning(f"Fast JSON path skipped for {model.__name__}: {type(e).__name__}: {e}")
+    return model.model_validate(data)
@@ -7,6 +7,11 @@ from pydantic import BaseModel
 
 from app.config import Settings, get_settings
 from app.services.database import check_connection
+from app.services.cache import get_cache_stats, get_singleflight_stats
+from app.services.columnar import get_columnar_stats
+from app.services.facets import get_facet_stats
+from app.services.rate_limit import get_rate_limit_stats
+from app.services.typesense import get_typesense_stats
 
 logger = logging.getLogger(__name__)
 
@@ -45,3 +50,32 @@ async def health_check(settings: Settings = Depends(get_settings)):
         database=db_status,
         typesense=ts_status,
     )
+
+
+@router.get("/health/cache")
+async def cache_stats():
+    """
+    In-process result cache statistics (hits, misses, evictions per cache)
+    and request coalescing (executions vs coalesced callers), plus the
+    columnar engine's loaded tables, the facet index and the rate limiter.
+
+    Counters are per replica and reset on restart.
+    """
+    return {
+        "caches": get_cache_stats(),
+        "singleflight": get_singleflight_stats(),
+        "columnar": get_columnar_stats(),
+        "facets": get_facet_stats(),
+        "rate_limit": get_rate_limit_stats(),
+    }
+
+
+@router.get("/health/typesense")
+async def typesense_stats():
+    """
+    Typesense client statistics: connection pool utilization, circuit breaker
+    state, per-operation request/error/timeout counters and hedging.
+
+    Counters are per replica and reset on restart.
+    """
+    return get_typesense_stats()
@@ -10,27 +10,45 @@ Modules:
 - publiek: Publieke uitvoeringsorganisaties (115K rows)
 - integraal: Cross-module search (universal_search)
 """
+import asyncio
 import logging
 from typing import Optional
 from enum import Enum
+from datetime import date
 import time
 
 from fastapi import APIRouter, Query, HTTPException, Path, Request
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 
 logger = logging.getLogger(__name__)
 from pydantic import BaseModel, Field
 
+from app.api.responses import model_response
+from app.services.export import (
+    export_headers,
+    stream_csv,
+    stream_xlsx,
+    CSV_MEDIA_TYPE,
+    XLSX_MEDIA_TYPE,
+)
 from app.services.modules import (
     get_module_data,
     get_row_details,
     get_grouping_counts,
+    get_row_details_batch,
+    get_grouping_counts_batch,
     get_integraal_data,
     get_integraal_details,
+    get_integraal_details_batch,
     get_filter_options,
+    filter_options_etag,
     get_cascading_filter_options,
     get_module_autocomplete,
     get_integraal_autocomplete,
     get_module_stats,
+    get_export_plan,
+    iter_export_rows,
+    export_slots_available,
     MODULE_CONFIG,
     YEARS,
 )
@@ -200,32 +218,20 @@ async def module_autocomplete(
         else:
             data = await get_module_autocomplete(module.value, q, limit)
 
-        return AutocompleteResponse(
-            success=True,
-            current_module=[
-                CurrentModuleResult(
-                    name=r["name"],
-                    totaal=r.get("totaal", 0),
-                    modules=r.get("modules", []),  # Pass modules for integraal badges
-                    match_type=r.get("match_type"),  # "exact" or "prefix"
-                )
+        return model_response(AutocompleteResponse, {
+            "success": True,
+            "current_module": [
+                {
+                    "name": r["name"],
+                    "totaal": r.get("totaal", 0),
+                    "modules": r.get("modules", []),  # Pass modules for integraal badges
+                    "match_type": r.get("match_type"),  # "exact" or "prefix"
+                }
                 for r in data.get("current_module", [])
             ],
-            field_matches=[
-                FieldMatchResult(
-                    value=r["value"],
-                    field=r["field"],
-                )
-                for r in data.get("field_matches", [])
-            ],
-            other_modules=[
-                OtherModulesResult(
-                    name=r["name"],
-                    modules=r.get("modules", []),
-                )
-                for r in data.get("other_modules", [])
-            ],
-        )
+            "field_matches": data.get("field_matches", []),
+            "other_modules": data.get("other_modules", []),
+        })
     except ValueError as e:
         logger.warning(f"Validation error: {e}")
         raise HTTPException(status_code=400, detail="Ongeldige parameter")
@@ -234,6 +240,98 @@ async def module_autocomplete(
         raise HTTPException(status_code=500, detail="Er ging iets mis bij het zoeken")
 
 
+# =============================================================================
+# Export Endpoint
+# =============================================================================
+
+class ExportFormat(str, Enum):
+    """Export file formats."""
+    csv = "csv"
+    xlsx = "xlsx"
+
+
+@router.get("/{module}/export")
+async def export_module(
+    request: Request,
+    module: ModuleName,
+    format: ExportFormat = Query(ExportFormat.csv, description="File format: csv or xlsx"),
+    q: Optional[str] = Query(None, min_length=1, max_length=200, description="Search query"),
+    jaar: Optional[int] = Query(None, ge=2016, le=2025, description="Filter by year"),
+    min_bedrag: Optional[float] = Query(None, ge=0, description="Minimum amount"),
+    max_bedrag: Optional[float] = Query(None, ge=0, description="Maximum amount"),
+    sort_by: str = Query("totaal", description="Sort field: totaal, primary, or year (e.g., y2024)"),
+    sort_order: SortOrder = Query(SortOrder.desc, description="Sort direction"),
+    min_years: Optional[int] = Query(None, ge=1, le=9, description="Minimum years with data"),
+    modules: Optional[list[str]] = Query(None, description="Filter by modules recipient appears in (integraal only)"),
+    betalingen: Optional[str] = Query(None, description="Filter by payment record count bracket (integraal only)"),
+    columns: Optional[list[str]] = Query(None, description="Extra columns to include (max 2)"),
+):
+    """
+    Download ALL rows of a module table as CSV or XLSX.
+
+    Takes the same filters as the module endpoint (filter fields such as
+    regeling=X&artikel=Y included). Unlike the in-browser export (max 500
+    loaded rows), the full result set is streamed from the database, so the
+    file can be any size. Random sort is exported by totaal.
+    """
+    # Extract filter fields from query params (same format as main endpoint)
+    filter_fields: dict[str, list[str]] = {}
+    if module != ModuleName.integraal:
+        for field in MODULE_CONFIG[module.value].get("filter_fields", []):
+            values = request.query_params.getlist(field)
+            if values:
+                if len(values) > 100:
+                    raise HTTPException(status_code=400, detail="Ongeldige parameter")
+                filter_fields[field] = values
+
+    if betalingen and betalingen not in ("1", "2-10", "11-50", "50+"):
+        raise HTTPException(status_code=400, detail="Invalid betalingen value. Must be one of: 1, 2-10, 11-50, 50+")
+
+    if not export_slots_available():
+        raise HTTPException(
+            status_code=429,
+            detail="Er lopen al exports, probeer het zo opnieuw",
+            headers={"Retry-After": "10"},
+        )
+
+    try:
+        # Build the query up front: validation errors must be a 400, not a broken download
+        plan = await get_export_plan(
+            module=module.value,
+            search=q,
+            jaar=jaar,
+            min_bedrag=min_bedrag,
+            max_bedrag=max_bedrag,
+            sort_by=sort_by,
+            sort_order=sort_order.value,
+            min_years=min_years,
+            filter_fields=filter_fields,
+            columns=columns,
+            filter_modules=modules,
+            betalingen=betalingen,
+        )
+    except ValueError as e:
+        logger.warning(f"Validation error: {e}")
+        raise HTTPException(status_code=400, detail="Ongeldige parameter")
+    except Exception as e:
+        logger.error(f"Export failed for {module}: {type(e).__name__}: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail="Er ging iets mis bij het exporteren")
+
+    extra_columns = [name for name, _ in plan.extra_columns]
+    headers = export_headers(module.value, plan.primary_field, extra_columns)
+    if format == ExportFormat.xlsx:
+        body, media_type = stream_xlsx(iter_export_rows(plan), headers, extra_columns), XLSX_MEDIA_TYPE
+    else:
+        body, media_type = stream_csv(iter_export_rows(plan), headers, extra_columns), CSV_MEDIA_TYPE
+
+    filename = f"rijksuitgaven-{module.value}-{date.today().isoformat()}.{format.value}"
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
 # =============================================================================
 # Module Data Endpoint
 # =============================================================================
@@ -246,6 +344,7 @@ async def get_module(
     # Pagination
     limit: int = Query(25, ge=1, le=500, description="Results per page (max 500)"),
     offset: int = Query(0, ge=0, le=10000, description="Pagination offset (max 10,000)"),
+    cursor: Optional[str] = Query(None, max_length=1000, description="Keyset cursor from meta.next_cursor (replaces offset, no depth limit)"),
     # Filtering
     jaar: Optional[int] = Query(None, ge=2016, le=2025, description="Filter by year"),
     min_bedrag: Optional[float] = Query(None, ge=0, description="Minimum amount"),
@@ -296,6 +395,8 @@ async def get_module(
 
     - **q**: Search query (searches recipient/kostensoort and related fields)
     - **limit/offset**: Pagination (max 100 per page)
+    - **cursor**: Keyset pagination — pass meta.next_cursor to get the next page
+      (browsing with totaal/year/primary sort; offset is ignored)
     - **jaar**: Filter to specific year
     - **min_bedrag/max_bedrag**: Filter by amount range
     - **sort_by**: Field to sort by: totaal, primary, random, or year (default: totaal)
@@ -361,7 +462,7 @@ async def get_module(
         # Handle integraal separately (uses universal_search table)
         totals = None
         if module == ModuleName.integraal:
-            data, total, totals = await get_integraal_data(
+            data, total, totals, next_cursor = await get_integraal_data(
                 search=q,
                 jaar=jaar,
                 min_bedrag=min_bedrag,
@@ -374,10 +475,11 @@ async def get_module(
                 filter_modules=modules,
                 betalingen=betalingen,
                 columns=columns,
+                cursor=cursor,
             )
             primary_field = "ontvanger"
         else:
-            data, total, totals = await get_module_data(
+            data, total, totals, next_cursor = await get_module_data(
                 module=module.value,
                 search=q,
                 jaar=jaar,
@@ -390,6 +492,7 @@ async def get_module(
                 min_years=min_years,
                 filter_fields=filter_fields,
                 columns=columns,
+                cursor=cursor,
             )
             primary_field = MODULE_CONFIG[module.value]["primary_field"]
 
@@ -402,18 +505,20 @@ async def get_module(
             "query": q,
             "elapsed_ms": round(elapsed_ms, 2),
             "years": YEARS,
+            # Opaque token for the next page (None: last page, or search/random sort)
+            "next_cursor": next_cursor,
         }
         # Include totals (year sums and grand total) when searching/filtering
         if totals:
             meta["totals"] = totals
 
-        return ModuleResponse(
-            success=True,
-            module=module.value,
-            primary_field=primary_field,
-            data=[AggregatedRow(**row) for row in data],
-            meta=meta,
-        )
+        return model_response(ModuleResponse, {
+            "success": True,
+            "module": module.value,
+            "primary_field": primary_field,
+            "data": data,
+            "meta": meta,
+        })
 
     except ValueError as e:
         # Validation errors (e.g., invalid filter field) - safe to show
@@ -486,12 +591,12 @@ async def get_details(
                 filter_fields=filter_fields if filter_fields else None,
             )
 
-        return DetailResponse(
-            success=True,
-            module=module.value,
-            primary_value=primary_value,
-            details=[DetailRow(**row) for row in details],
-        )
+        return model_response(DetailResponse, {
+            "success": True,
+            "module": module.value,
+            "primary_value": primary_value,
+            "details": details,
+        })
 
     except ValueError as e:
         logger.warning(f"Validation error: {e}")
@@ -534,8 +639,117 @@ async def get_grouping_counts_endpoint(
         raise HTTPException(status_code=500, detail="Er ging iets mis")
 
 
+# =============================================================================
+# Batch Row Expansion Endpoint
+# =============================================================================
+
+class BatchDetailsRequest(BaseModel):
+    """Request body for expanding many rows at once (same scoping as /details)."""
+    primary_values: list[str] = Field(..., min_length=1, max_length=100)
+    group_by: Optional[str] = None
+    jaar: Optional[int] = Field(None, ge=2016, le=2025)
+    q: Optional[str] = Field(None, max_length=200)
+    filters: dict[str, list[str]] = Field(default_factory=dict)
+    include_grouping_counts: bool = True
+
+
+class BatchDetailItem(BaseModel):
+    """Details and grouping counts for one primary value."""
+    details: list[DetailRow]
+    grouping_counts: dict[str, int] = Field(default_factory=dict)
+
+
+class BatchDetailsResponse(BaseModel):
+    """Response keyed by requested primary value."""
+    success: bool = True
+    module: str
+    results: dict[str, BatchDetailItem]
+
+
+@router.post("/{module}/details/batch", response_model=BatchDetailsResponse)
+async def get_details_batch(
+    module: ModuleName,
+    body: BatchDetailsRequest,
+):
+    """
+    Expand many rows in one request ("expand all" on a table page).
+
+    Returns the same detail rows as `/{module}/{primary_value}/details` and the
+    same counts as `/{module}/{primary_value}/grouping-counts` for every value
+    in `primary_values`, computed with one query each for the whole batch
+    instead of two requests per row.
+
+    For integraal: the module breakdown of every value (only jaar applies,
+    no grouping counts).
+    """
+    # Same limits as the single-row endpoints
+    if any(not pv or len(pv) > 500 for pv in body.primary_values):
+        raise HTTPException(status_code=400, detail="Ongeldige parameter")
+    if any(len(values) > 100 for values in body.filters.values()):
+        raise HTTPException(status_code=400, detail="Ongeldige parameter")
+
+    primary_values = list(dict.fromkeys(body.primary_values))
+
+    try:
+        if module == ModuleName.integraal:
+            details = await get_integraal_details_batch(primary_values, jaar=body.jaar)
+            return model_response(BatchDetailsResponse, {
+                "success": True,
+                "module": module.value,
+                "results": {pv: {"details": details.get(pv, [])} for pv in primary_values},
+            })
+
+        q = body.q if body.q and body.q.strip() else None
+        valid_filter_fields = MODULE_CONFIG[module.value].get("filter_fields", [])
+        filter_fields = {
+            field: values for field, values in body.filters.items()
+            if field in valid_filter_fields and values
+        }
+
+        details_coro = get_row_details_batch(
+            module=module.value,
+            primary_values=primary_values,
+            group_by=body.group_by,
+            jaar=body.jaar,
+            search=q,
+            filter_fields=filter_fields if filter_fields else None,
+        )
+        if body.include_grouping_counts:
+            details, counts = await asyncio.gather(
+                details_coro,
+                get_grouping_counts_batch(module.value, primary_values),
+            )
+        else:
+            details, counts = await details_coro, {}
+
+        return model_response(BatchDetailsResponse, {
+            "success": True,
+            "module": module.value,
+            "results": {
+                pv: {"details": details.get(pv, []), "grouping_counts": counts.get(pv, {})}
+                for pv in primary_values
+            },
+        })
+
+    except ValueError as e:
+        logger.warning(f"Validation error: {e}")
+        raise HTTPException(status_code=400, detail="Ongeldige parameter")
+    except Exception as e:
+        logger.error(f"Batch details query failed for {module}: {type(e).__name__}: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail="Er ging iets mis bij het ophalen van de details")
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """True when an If-None-Match header lists etag (or *)."""
+    if not if_none_match:
+        return False
+    candidates = [c.strip() for c in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
+
+
 @router.get("/{module}/filters/{field}", response_model=list[str])
 async def get_filter_values(
+    request: Request,
     module: ModuleName,
     field: str,
 ):
@@ -545,6 +759,10 @@ async def get_filter_values(
     Used for auto-populating multi-select dropdowns.
     Returns sorted list of unique values.
 
+    Responses carry a strong ETag that changes with the dataset generation
+    (once one is loaded); a request with a matching If-None-Match gets
+    304 Not Modified.
+
     ## Examples
 
     - `GET /api/v1/modules/provincie/filters/provincie` → ["Drenthe", "Friesland", ...]
@@ -557,9 +775,19 @@ async def get_filter_values(
             return ["Instrumenten", "Apparaat", "Inkoop", "Provincie", "Gemeente", "Publiek"]
         raise HTTPException(status_code=400, detail=f"Unknown filter field: {field}")
 
+    if field not in MODULE_CONFIG[module.value].get("filter_fields", []):
+        raise HTTPException(status_code=400, detail="Ongeldige parameter")
+
+    etag = filter_options_etag(module.value, field)
+    cache_headers = {"Cache-Control": "private, no-cache"}
+    if etag is not None:
+        cache_headers["ETag"] = etag
+        if _etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers=cache_headers)
+
     try:
         values = await get_filter_options(module.value, field)
-        return values
+        return JSONResponse(content=values, headers=cache_headers)
     except ValueError as e:
         logger.warning(f"Validation error: {e}")
         raise HTTPException(status_code=400, detail="Ongeldige parameter")
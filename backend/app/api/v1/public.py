@@ -10,7 +10,7 @@ import logging
 from fastapi import APIRouter, Query, HTTPException
 
 from app.config import get_settings
-from app.services.modules import _typesense_search
+from app.services.typesense import typesense_search
 from app.services.database import get_pool
 
 logger = logging.getLogger(__name__)
@@ -43,7 +43,7 @@ async def public_search(
         "sort_by": "totaal:desc",
     }
 
-    data = await _typesense_search("recipients", params)
+    data = await typesense_search("recipients", params, operation="autocomplete")
 
     keys = []
     for hit in data.get("hits", []):
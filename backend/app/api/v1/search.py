@@ -7,17 +7,15 @@ keeping the API key server-side only.
 from typing import Optional
 import asyncio
 import logging
-import httpx
 
 from fastapi import APIRouter, Query, HTTPException
 from pydantic import BaseModel
 
-from app.config import get_settings
+from app.services.typesense import typesense_search, typesense_multi_search
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
-settings = get_settings()
 
 
 # =============================================================================
@@ -73,52 +71,6 @@ MODULE_LABELS = {
 }
 
 
-# =============================================================================
-# Typesense Client Helper
-# =============================================================================
-
-def get_typesense_url(path: str) -> str:
-    """Build Typesense URL."""
-    return f"{settings.typesense_protocol}://{settings.typesense_host}:{settings.typesense_port}{path}"
-
-
-from app.services.http_client import get_http_client as _get_http_client
-
-
-async def typesense_search(collection: str, params: dict) -> dict:
-    """
-    Execute search against Typesense.
-
-    Returns empty results on any error (network, timeout, non-200 response).
-    This ensures search gracefully degrades rather than crashing.
-    """
-    url = get_typesense_url(f"/collections/{collection}/documents/search")
-
-    try:
-        client = await _get_http_client()
-        response = await client.get(
-            url,
-            params=params,
-            headers={"X-TYPESENSE-API-KEY": settings.typesense_api_key},
-        )
-
-        if response.status_code != 200:
-            logger.warning(f"Typesense returned {response.status_code} for {collection}")
-            return {"hits": [], "grouped_hits": []}
-
-        try:
-            return response.json()
-        except ValueError as json_err:
-            logger.error(f"Typesense returned invalid JSON: {json_err}")
-            return {"hits": [], "grouped_hits": []}
-    except httpx.TimeoutException:
-        logger.warning(f"Typesense timeout for collection {collection}")
-        return {"hits": [], "grouped_hits": []}
-    except httpx.RequestError as e:
-        logger.error(f"Typesense request error: {type(e).__name__}: {e}")
-        return {"hits": [], "grouped_hits": []}
-
-
 # =============================================================================
 # Endpoints
 # =============================================================================
@@ -186,7 +138,7 @@ async def search_recipients(
         params["num_typos"] = "2"
         params["typo_tokens_threshold"] = "1"
 
-    data = await typesense_search("recipients", params)
+    data = await typesense_search("recipients", params, operation="autocomplete")
 
     results = []
     for hit in data.get("hits", []):
@@ -214,11 +166,10 @@ async def search_keywords(q: str) -> list[KeywordResult]:
         {"collection": "provincie", "field": "omschrijving", "module": "provincie"},
     ]
 
-    # Fire all 4 keyword searches in parallel
-    configs = keyword_searches[:4]
-    search_tasks = []
-    for sc in configs:
-        params = {
+    # All keyword searches in one /multi_search round trip
+    searches = [
+        {
+            "collection": sc["collection"],
             "q": q,
             "query_by": sc["field"],
             "prefix": "true",
@@ -226,19 +177,16 @@ async def search_keywords(q: str) -> list[KeywordResult]:
             "group_by": sc["field"],
             "group_limit": "1",
         }
-        search_tasks.append(typesense_search(sc["collection"], params))
+        for sc in keyword_searches
+    ]
 
-    all_data = await asyncio.gather(*search_tasks, return_exceptions=True)
+    all_data = await typesense_multi_search(searches, operation="autocomplete")
 
     # Process results sequentially (dedup across collections)
     results: list[KeywordResult] = []
     seen_keywords: set[str] = set()
 
-    for sc, data in zip(configs, all_data):
-        if isinstance(data, Exception):
-            logger.warning(f"Keyword search failed for {sc['collection']}/{sc['field']}: {data}")
-            continue
-
+    for sc, data in zip(keyword_searches, all_data):
         field = sc["field"]
         module = sc["module"]
 
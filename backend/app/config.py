@@ -16,6 +16,11 @@ class Settings(BaseSettings):
 
     # Supabase (PostgreSQL)
     database_url: str = ""
+    # Session-level connection for LISTEN/NOTIFY (dataset generation changes).
+    # Transaction-mode pgbouncer does not deliver notifications. Empty = use database_url.
+    database_listen_url: str = ""
+    # Fallback poll interval for data_generation when notifications are missed
+    data_generation_poll_seconds: int = 60
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -28,6 +33,70 @@ class Settings(BaseSettings):
     typesense_api_key: str = ""
     typesense_protocol: str = "https"
     typesense_port: int = 443
+    # Shared client pool (HTTP/2 multiplexes concurrent searches over few connections)
+    typesense_http2: bool = True
+    typesense_max_connections: int = 20
+    typesense_max_keepalive_connections: int = 10
+    typesense_keepalive_expiry_seconds: float = 30.0
+    typesense_connect_timeout_seconds: float = 1.0
+    # Per-operation read timeouts: autocomplete gives up fast (user keeps typing),
+    # hybrid key lookup may wait longer (its fallback is a slow regex scan)
+    typesense_autocomplete_timeout_seconds: float = 1.0
+    typesense_search_timeout_seconds: float = 2.5
+    # Circuit breaker: after N consecutive failures skip Typesense for reset_seconds
+    typesense_breaker_failure_threshold: int = 5
+    typesense_breaker_reset_seconds: float = 30.0
+    # Hedged requests: send a duplicate if no response after N ms (0 = disabled)
+    typesense_hedge_after_ms: int = 0
+
+    # In-process result cache for module/integraal table pages (per replica)
+    # Entries are scoped to the dataset generation; TTL bounds staleness.
+    result_cache_max_entries: int = 2048
+    result_cache_ttl_seconds: int = 900
+
+    # Search sessions: page-independent part of a search (Typesense key split,
+    # matched fields, secondary rows, count, totals), reused by later pages
+    search_session_max_entries: int = 256
+    search_session_ttl_seconds: int = 600
+
+    # Filtered table views: page + count + totals in one query (single scan).
+    # false = three parallel queries (previous plan).
+    fused_page_query: bool = True
+
+    # Full CSV/XLSX exports (/modules/{module}/export) running at the same time.
+    # Each holds a database connection for the duration of the download.
+    export_max_concurrent: int = 2
+
+    # Default (no-search) browsing from in-memory NumPy arrays, reloaded per
+    # dataset generation. Needs numpy; costs a few hundred bytes per view row
+    # (strings included), ~0.5 GB for all six views.
+    columnar_engine: bool = False
+
+    # Cascading filter option counts from roaring bitmaps per source table,
+    # reloaded per dataset generation. Needs pyroaring + numpy; ~100 MB for
+    # all six tables (row codes + bitmaps).
+    facet_index: bool = False
+
+    # Table/autocomplete/details responses written with orjson straight from the
+    # service-layer dicts (same JSON as the response models). Needs orjson;
+    # false = build and serialize the pydantic response models.
+    orjson_responses: bool = True
+
+    # Rate limiting: token bucket per client IP, requests per minute per tier
+    # (bursts up to the same number). public = /api/v1/public/*, authenticated = rest.
+    rate_limit_public_per_minute: int = 10
+    rate_limit_authenticated_per_minute: int = 120
+    # "memory" = per worker/replica; "redis" = shared via a Redis-protocol store
+    # (needs the redis package and rate_limit_redis_url, e.g. redis://host:6379/0)
+    rate_limit_backend: str = "memory"
+    rate_limit_redis_url: str = ""
+    # memory backend: max tracked clients (least recently seen dropped first)
+    rate_limit_max_keys: int = 100_000
+    # Proxies in front of the backend that append to X-Forwarded-For (Railway
+    # edge = 1). The client IP is the entry that many hops from the right;
+    # entries further left are sent by the client and can be spoofed.
+    # 0 = ignore X-Forwarded-For and use the connecting address.
+    rate_limit_trusted_proxies: int = 1
 
     # BFF shared secret (empty = disabled, for backwards compatibility during rollout)
     # SECURITY: When Railway private networking is enabled, change BACKEND_API_URL
@@ -3,20 +3,24 @@ Rijksuitgaven API - FastAPI Backend
 
 Main application entry point.
 """
+import hmac
 import logging
-import time
-from collections import defaultdict
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, Request
+from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from app.config import get_settings
 from app.api.v1 import router as api_v1_router
 from app.services.database import close_pool, get_pool
+from app.services.columnar import start_columnar_engine, stop_columnar_engine
+from app.services.facets import start_facet_index, stop_facet_index
+from app.services.generation import start_generation_listener, stop_generation_listener
 from app.services.http_client import close_http_client
+from app.services.modules import get_columnar_sources, get_facet_sources
+from app.services.rate_limit import close_rate_limiter, get_rate_limit_tiers, get_rate_limiter
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
@@ -28,8 +32,9 @@ async def lifespan(app: FastAPI):
     Application lifespan context manager.
 
     Handles startup and shutdown events:
-    - Startup: Nothing needed (pool created lazily on first request)
-    - Shutdown: Close database connection pool to prevent resource leaks
+    - Startup: Pre-warm pool, load dataset generation + start LISTEN connection,
+      start columnar engine and facet index loads (when enabled)
+    - Shutdown: Stop listener, close database connection pool to prevent resource leaks
     """
     # Security check: warn if BFF_SECRET is not configured
     if not settings.bff_secret:
@@ -45,10 +50,20 @@ async def lifespan(app: FastAPI):
         # Warm PostgreSQL buffer cache for universal_search (integraal module)
         await conn.fetchval("SELECT COUNT(*) FROM universal_search")
     logger.info("Database pool ready")
+
+    # Dataset generation: scopes in-process caches, invalidated via pg_notify
+    await start_generation_listener()
+    # Optional in-memory browsing engine (loads in the background)
+    await start_columnar_engine(get_columnar_sources())
+    await start_facet_index(get_facet_sources())
     yield
     # Shutdown
     logger.info("Application shutting down, closing connections")
+    await stop_columnar_engine()
+    await stop_facet_index()
+    await stop_generation_listener()
     await close_http_client()
+    await close_rate_limiter()
     await close_pool()
     logger.info("All connections closed")
 
@@ -62,104 +77,124 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
-# CORS middleware
-# Restrict headers to only what's needed (not "*" which is too permissive)
-# Localhost origins only included in development mode (debug=true or ENV=development)
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.get_cors_origins(),
-    allow_credentials=False,
-    allow_methods=["GET", "POST", "OPTIONS"],
-    allow_headers=["Content-Type", "Authorization", "X-Requested-With", "Accept", "X-BFF-Secret"],
-)
+# =============================================================================
+# Middleware (pure ASGI)
+# =============================================================================
+# BaseHTTPMiddleware runs every request through an extra task and memory
+# streams, and buffers streaming responses (exports). These classes only look
+# at scope (path, method, headers) and either answer themselves or pass
+# receive/send through untouched.
+#
+# Order (outermost first): CORS → rate limit → BFF secret → routes.
+# CORS must be outermost so preflights are answered before the secret check
+# (browsers never send X-BFF-Secret on OPTIONS) and so 403/429 responses
+# carry CORS headers.
+
+# Paths that need no X-BFF-Secret
+BFF_EXEMPT_PATHS = frozenset({"/", "/health", "/api/v1/health", "/api/v1/public/search"})
+
+# Paths without rate limit (health checks, root)
+RATE_LIMIT_EXEMPT_PATHS = frozenset({"/", "/health", "/api/v1/health"})
+
+
+def _header(scope: Scope, name: bytes) -> str:
+    """First value of a request header (name in lowercase), or ''."""
+    for key, value in scope["headers"]:
+        if key == name:
+            return value.decode("latin-1")
+    return ""
+
 
 # BFF shared secret middleware — rejects requests without valid X-BFF-Secret
 # when bff_secret is configured. Health/root endpoints are always allowed.
-class BFFSecretMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        if settings.bff_secret:
-            # Allow health checks and root without secret
-            if request.url.path not in ("/", "/health", "/api/v1/health", "/api/v1/public/search"):
-                provided = request.headers.get("X-BFF-Secret", "")
-                if provided != settings.bff_secret:
-                    return JSONResponse(
-                        status_code=403,
-                        content={"error": "Forbidden"},
-                    )
-        return await call_next(request)
-
-app.add_middleware(BFFSecretMiddleware)
-
-
-# Rate limiting middleware — token bucket per IP
-# Public endpoints (no BFF secret): 10 req/min
-# Authenticated endpoints (BFF secret): 120 req/min
+class BFFSecretMiddleware:
+    def __init__(self, app: ASGIApp, secret: str):
+        self.app = app
+        self.secret = secret.encode()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and self.secret and scope["path"] not in BFF_EXEMPT_PATHS:
+            provided = _header(scope, b"x-bff-secret").encode("latin-1")
+            if not hmac.compare_digest(provided, self.secret):
+                response = JSONResponse(status_code=403, content={"error": "Forbidden"})
+                await response(scope, receive, send)
+                return
+        await self.app(scope, receive, send)
+
+
+# Rate limiting middleware — token bucket per IP and tier
+# (app/services/rate_limit.py; limits from RATE_LIMIT_*_PER_MINUTE)
+# Public endpoints (no BFF secret): public tier (default 10 req/min)
+# Authenticated endpoints (BFF secret): authenticated tier (default 120 req/min)
 # Health/root: exempt
-class RateLimitMiddleware(BaseHTTPMiddleware):
-    def __init__(self, app):
-        super().__init__(app)
-        # {ip: [tokens, last_refill_time]}
-        self.buckets: dict[str, list] = defaultdict(lambda: [0.0, 0.0])
-        self.last_cleanup = time.monotonic()
-
-    def _get_client_ip(self, request: Request) -> str:
-        """Extract client IP, respecting X-Forwarded-For from Railway proxy."""
-        forwarded = request.headers.get("x-forwarded-for", "")
-        if forwarded:
-            return forwarded.split(",")[0].strip()
-        return request.client.host if request.client else "unknown"
-
-    async def dispatch(self, request: Request, call_next):
-        path = request.url.path
-
-        # Exempt: health checks, root, OPTIONS (CORS preflight)
-        if path in ("/", "/health", "/api/v1/health") or request.method == "OPTIONS":
-            return await call_next(request)
-
-        # Determine rate limit tier
-        is_public = path.startswith("/api/v1/public/")
-        max_tokens = 10.0 if is_public else 120.0  # bucket capacity
-        refill_rate = 10.0 / 60.0 if is_public else 120.0 / 60.0  # tokens per second
+class RateLimitMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self.tiers = get_rate_limit_tiers()
+        self.trusted_proxies = settings.rate_limit_trusted_proxies
+
+    def _get_client_ip(self, scope: Scope) -> str:
+        """
+        Client IP: the X-Forwarded-For entry appended by the outermost trusted
+        proxy (RATE_LIMIT_TRUSTED_PROXIES hops from the right, Railway = 1).
+        Entries to its left come from the client and are ignored.
+        """
+        if self.trusted_proxies > 0:
+            # Repeated headers form one list, in order
+            forwarded = ",".join(
+                value.decode("latin-1") for key, value in scope["headers"] if key == b"x-forwarded-for"
+            )
+            hops = [hop.strip() for hop in forwarded.split(",") if hop.strip()]
+            if len(hops) >= self.trusted_proxies:
+                return hops[-self.trusted_proxies]
+        client = scope.get("client")
+        return client[0] if client else "unknown"
 
-        client_ip = self._get_client_ip(request)
-        bucket_key = f"{'pub' if is_public else 'auth'}:{client_ip}"
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        now = time.monotonic()
-        bucket = self.buckets[bucket_key]
+        path = scope["path"]
 
-        # Initialize new bucket
-        if bucket[1] == 0.0:
-            bucket[0] = max_tokens
-            bucket[1] = now
+        # Exempt: health checks, root, OPTIONS (CORS preflight)
+        if path in RATE_LIMIT_EXEMPT_PATHS or scope["method"] == "OPTIONS":
+            await self.app(scope, receive, send)
+            return
 
-        # Refill tokens based on elapsed time
-        elapsed = now - bucket[1]
-        bucket[0] = min(max_tokens, bucket[0] + elapsed * refill_rate)
-        bucket[1] = now
+        # Determine rate limit tier
+        tier = self.tiers["public" if path.startswith("/api/v1/public/") else "authenticated"]
+        bucket_key = f"{tier.name}:{self._get_client_ip(scope)}"
 
-        # Check if request is allowed
-        if bucket[0] < 1.0:
+        result = await get_rate_limiter().hit(bucket_key, tier)
+        if not result.allowed:
             logger.warning(f"Rate limit exceeded for {bucket_key}")
-            return JSONResponse(
+            response = JSONResponse(
                 status_code=429,
                 content={"error": "Too many requests"},
-                headers={"Retry-After": str(int(1.0 / refill_rate))},
+                headers={"Retry-After": str(result.retry_after)},
             )
+            await response(scope, receive, send)
+            return
 
-        # Consume a token
-        bucket[0] -= 1.0
-
-        # Periodic cleanup of stale buckets (every 5 minutes)
-        if now - self.last_cleanup > 300:
-            self.last_cleanup = now
-            stale_keys = [k for k, v in self.buckets.items() if now - v[1] > 300]
-            for k in stale_keys:
-                del self.buckets[k]
+        await self.app(scope, receive, send)
 
-        return await call_next(request)
 
+# add_middleware() wraps the stack, so the last one added runs first
+app.add_middleware(BFFSecretMiddleware, secret=settings.bff_secret)
 app.add_middleware(RateLimitMiddleware)
 
+# CORS middleware (outermost)
+# Restrict headers to only what's needed (not "*" which is too permissive)
+# Localhost origins only included in development mode (debug=true or ENV=development)
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=settings.get_cors_origins(),
+    allow_credentials=False,
+    allow_methods=["GET", "POST", "OPTIONS"],
+    allow_headers=["Content-Type", "Authorization", "X-Requested-With", "Accept", "X-BFF-Secret"],
+)
+
 # Include API routes
 app.include_router(api_v1_router, prefix="/api/v1")
 
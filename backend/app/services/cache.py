@@ -0,0 +1,297 @@
+"""
+In-process result cache for module data.
+
+The aggregated views only change when refresh-all-views.sql runs, so identical
+table requests (default browse, popular searches) can be answered from memory.
+
+Entries are keyed on the normalized request arguments PLUS the current dataset
+generation. Bumping the generation makes every older entry unreachable, which
+gives exact invalidation without having to know which keys were affected.
+The TTL is a safety net for when no generation signal is available.
+"""
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable, TypeVar
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+# Current dataset generation (0 = unknown / not yet loaded)
+# Maintained by app/services/generation.py (LISTEN/NOTIFY on data_generation)
+_data_generation: int = 0
+
+# Callbacks invoked with the new generation when it changes
+_generation_listeners: list[Callable[[int], None]] = []
+
+
+def get_data_generation() -> int:
+    """Get the dataset generation that cache keys are scoped to."""
+    return _data_generation
+
+
+def on_generation_change(callback: Callable[[int], None]) -> None:
+    """Register a callback for dataset generation changes (e.g. to drop in-memory indexes)."""
+    _generation_listeners.append(callback)
+
+
+def set_data_generation(generation: int) -> bool:
+    """
+    Broadcast a new dataset generation to every in-process cache.
+
+    Returns True if the generation changed. Registered caches are cleared
+    (their keys embed the old generation and can never be hit again).
+    """
+    global _data_generation
+    if generation == _data_generation:
+        return False
+
+    previous = _data_generation
+    _data_generation = generation
+    for cache in _caches:
+        cache.clear()
+    for callback in _generation_listeners:
+        try:
+            callback(generation)
+        except Exception as e:
+            logger.error(f"Generation listener failed: {type(e).__name__}: {e}", exc_info=True)
+
+    logger.info(f"Data generation {previous} → {generation}: in-process caches invalidated")
+    return True
+
+
+class ResultCache:
+    """
+    Bounded LRU cache with per-entry TTL and hit/miss/eviction counters.
+
+    Not thread-safe — designed for a single asyncio event loop, where every
+    operation runs to completion without yielding.
+
+    Cached values are shared between requests: callers MUST NOT mutate them.
+    """
+
+    def __init__(self, name: str, max_entries: int, ttl_seconds: float):
+        self.name = name
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        # {key: (expires_at, value)} — ordered oldest → most recently used
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: Hashable) -> tuple[bool, Any]:
+        """Return (found, value). Expired entries count as a miss."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return False, None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self.expirations += 1
+            self.misses += 1
+            return False, None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return True, value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used entry when full."""
+        if self.max_entries <= 0:
+            return
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop all entries (counters are kept)."""
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        """Counters for monitoring (exposed via /api/v1/health/cache)."""
+        lookups = self.hits + self.misses
+        return {
+            "name": self.name,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "generation": _data_generation,
+        }
+
+
+class SingleFlight:
+    """
+    Coalesce identical concurrent calls into one execution.
+
+    The first caller for a key (the leader) starts the work as a task; callers
+    arriving while it is in flight await the same task instead of issuing
+    duplicate SQL/Typesense calls. The task is shielded, so a cancelled caller
+    (client disconnect) does not cancel the work for the others.
+
+    Only in-flight work is shared — completed results are not retained here
+    (that is ResultCache's job).
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._inflight: dict[Hashable, asyncio.Task] = {}
+        self.executions = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Run fn() once per key at a time; concurrent callers share its result."""
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced += 1
+            return await asyncio.shield(task)
+
+        task = asyncio.ensure_future(fn())
+        self._inflight[key] = task
+        self.executions += 1
+        task.add_done_callback(lambda t: self._finish(key, t))
+        return await asyncio.shield(task)
+
+    def _finish(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Mark exception as retrieved if every caller went away (avoids asyncio warning)
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> dict:
+        """Counters for monitoring (exposed via /api/v1/health/cache)."""
+        requests = self.executions + self.coalesced
+        return {
+            "name": self.name,
+            "in_flight": len(self._inflight),
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+            "coalesce_rate": round(self.coalesced / requests, 4) if requests else 0.0,
+        }
+
+
+class GenerationReloader:
+    """
+    Keep in-memory structures (columnar tables, facet indexes) loaded for the
+    current dataset generation.
+
+    start() registers the sources and loads them in a background task; every
+    generation change schedules another load. A change while loading re-runs
+    the load, and a structure built for an older generation is never
+    published. Loaded structures carry a .generation attribute: get() returns
+    None for stale or missing ones, and callers use PostgreSQL instead.
+    """
+
+    def __init__(self, name: str, label: str, load: Callable[[str, Any, int], Awaitable[Any]]):
+        self.name = name  # Task name
+        self.label = label  # Log prefix, e.g. "Facet index"
+        self._load = load  # (name, source, generation) -> structure
+        self.sources: dict[str, Any] = {}
+        self.loaded: dict[str, Any] = {}
+        self._task: asyncio.Task | None = None
+        self._pending = False
+        self.last_load_seconds: float | None = None
+
+    def get(self, name: str) -> Any | None:
+        """The structure loaded for the current generation, or None."""
+        item = self.loaded.get(name)
+        if item is None or item.generation != _data_generation:
+            return None
+        return item
+
+    async def _reload_all(self) -> None:
+        """Load every source for the current generation (repeats if it changes meanwhile)."""
+        while True:
+            self._pending = False
+            generation = _data_generation
+            start = time.monotonic()
+            for name, source in self.sources.items():
+                try:
+                    item = await self._load(name, source, generation)
+                except Exception as e:
+                    logger.error(f"{self.label} load failed for {name}: {type(e).__name__}: {e}", exc_info=True)
+                    continue
+                if generation != _data_generation:
+                    break
+                self.loaded[name] = item
+            self.last_load_seconds = round(time.monotonic() - start, 2)
+            if not self._pending and generation == _data_generation:
+                logger.info(f"{self.label} loaded generation {generation} in {self.last_load_seconds}s")
+                return
+
+    def schedule(self, generation: int = 0) -> None:
+        """Generation listener: stale structures are skipped by get() until reloaded."""
+        if self._task is not None and not self._task.done():
+            self._pending = True
+            return
+        self._task = asyncio.get_running_loop().create_task(self._reload_all(), name=self.name)
+
+    def start(self, sources: dict[str, Any]) -> None:
+        """Register sources and start loading in the background."""
+        self.sources.update(sources)
+        on_generation_change(self.schedule)
+        self.schedule()
+
+    async def stop(self) -> None:
+        """Cancel a running load. Call on application shutdown."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def stats(self) -> dict:
+        """State for /api/v1/health/cache."""
+        return {
+            "enabled": bool(self.sources),
+            "loading": self._task is not None and not self._task.done(),
+            "last_load_seconds": self.last_load_seconds,
+            "tables": {
+                name: {**item.stats(), "current": item.generation == _data_generation}
+                for name, item in self.loaded.items()
+            },
+        }
+
+
+# Registry of all caches in this process (for stats)
+_caches: list[ResultCache] = []
+_flights: list[SingleFlight] = []
+
+
+def create_cache(name: str, max_entries: int, ttl_seconds: float) -> ResultCache:
+    """Create and register a result cache."""
+    cache = ResultCache(name, max_entries, ttl_seconds)
+    _caches.append(cache)
+    return cache
+
+
+def get_cache_stats() -> list[dict]:
+    """Stats for every registered cache."""
+    return [cache.stats() for cache in _caches]
+
+
+def create_singleflight(name: str) -> SingleFlight:
+    """Create and register a single-flight group."""
+    flight = SingleFlight(name)
+    _flights.append(flight)
+    return flight
+
+
+def get_singleflight_stats() -> list[dict]:
+    """Stats for every registered single-flight group."""
+    return [flight.stats() for flight in _flights]
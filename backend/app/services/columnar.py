@@ -0,0 +1,284 @@
+"""
+In-memory columnar engine for default (no-search) module browsing.
+
+The default table views (random/totaal/year sort, min_years, jaar, bedrag
+range) only touch numeric columns of the *_aggregated views. With
+COLUMNAR_ENGINE=true those columns are loaded into NumPy arrays per module,
+and filter/sort/count/totals run as vectorized operations:
+
+- filters are boolean masks
+- sorting uses a precomputed rank per sort column (sort value, then row key —
+  the same total order as the SQL ORDER BY sort, key), so a page is an
+  argpartition of the candidate ranks instead of a full sort
+- only the rows on the visible page are turned into dicts
+
+Strings (primary value, row key, view columns) are kept as Python lists;
+view columns are dictionary-encoded (few distinct values per column).
+
+tests/test_columnar.py checks ordering, tie-breaking, the random threshold
+and totals against hand-computed results of the SQL query.
+
+Tables are (re)loaded at startup and whenever the dataset generation changes.
+Until a table is loaded for the current generation, get_table() returns None
+and callers use PostgreSQL as before. NumPy is optional: without it the
+engine stays disabled.
+"""
+import logging
+from dataclasses import dataclass, field
+from typing import Optional
+
+from app.config import get_settings
+from app.services.cache import GenerationReloader
+from app.services.database import get_pool
+
+try:
+    import numpy as np
+except ImportError:  # Optional dependency (requirements.txt), engine stays disabled
+    np = None
+
+logger = logging.getLogger(__name__)
+
+# Rows fetched per cursor batch while loading (bounds transient memory)
+_LOAD_BATCH_ROWS = 50_000
+
+
+@dataclass
+class ColumnarSource:
+    """How to load one table: SQL returning the columns below, ordered by row key."""
+    query: str
+    years: list[int]
+    view_columns: list[str] = field(default_factory=list)
+
+
+class ColumnarTable:
+    """
+    Column arrays for one aggregated view, in row-key order.
+
+    Expected load columns: key, primary_value, primary_rank (0-based rank of
+    ORDER BY primary, key), y<year> per year, totaal, row_count,
+    years_with_data, random_order, and extra_<col> / extra_<col>_count per
+    view column.
+    """
+
+    def __init__(self, name: str, generation: int, years: list[int], view_columns: list[str]):
+        self.name = name
+        self.generation = generation
+        self.years = years
+        self.view_columns = view_columns
+        self.n = 0
+        self.keys: list[str] = []
+        self.primary: list[str] = []
+        self._chunks: dict[str, list] = {}
+        self._extra_values: dict[str, list[str | None]] = {col: [] for col in view_columns}
+        self._extra_lookup: dict[str, dict[str | None, int]] = {col: {} for col in view_columns}
+        # Sort ranks, computed on first use per sort column
+        self._ranks: dict[str, "np.ndarray"] = {}
+
+    # -------------------------------------------------------------------------
+    # Loading
+    # -------------------------------------------------------------------------
+
+    def append(self, records: list) -> None:
+        """Append one batch of records (converted to arrays per batch)."""
+        self.keys.extend(r["key"] for r in records)
+        self.primary.extend(r["primary_value"] for r in records)
+
+        def add(name: str, values, dtype) -> None:
+            self._chunks.setdefault(name, []).append(np.array(values, dtype=dtype))
+
+        add("primary_rank", [r["primary_rank"] for r in records], np.int32)
+        for year in self.years:
+            add(f"y{year}", [r[f"y{year}"] or 0.0 for r in records], np.float64)
+        add("totaal", [r["totaal"] or 0.0 for r in records], np.float64)
+        add("row_count", [r["row_count"] or 0 for r in records], np.int64)
+        add("years_with_data", [r["years_with_data"] or 0 for r in records], np.int16)
+        add("random_order", [r["random_order"] or 0.0 for r in records], np.float64)
+        for col in self.view_columns:
+            lookup = self._extra_lookup[col]
+            values = self._extra_values[col]
+            codes = []
+            for r in records:
+                value = r[f"extra_{col}"]
+                value = str(value) if value is not None else None
+                code = lookup.get(value)
+                if code is None:
+                    code = lookup[value] = len(values)
+                    values.append(value)
+                codes.append(code)
+            add(f"extra_{col}", codes, np.int32)
+            add(f"extra_{col}_count", [r[f"extra_{col}_count"] or 1 for r in records], np.int64)
+
+    def finish(self) -> None:
+        """Concatenate the loaded batches into final arrays."""
+        columns = {name: np.concatenate(chunks) for name, chunks in self._chunks.items()}
+        self._chunks = {}
+        self._extra_lookup = {}
+        self.n = len(self.keys)
+        self.primary_rank = columns.get("primary_rank", np.empty(0, np.int32))
+        self.year_matrix = np.vstack([columns.get(f"y{y}", np.empty(0)) for y in self.years])
+        self.totaal = columns.get("totaal", np.empty(0))
+        self.row_count = columns.get("row_count", np.empty(0, np.int64))
+        self.years_with_data = columns.get("years_with_data", np.empty(0, np.int16))
+        self.random_order = columns.get("random_order", np.empty(0))
+        self.extra_codes = {col: columns.get(f"extra_{col}", np.empty(0, np.int32)) for col in self.view_columns}
+        self.extra_counts = {col: columns.get(f"extra_{col}_count", np.empty(0, np.int64)) for col in self.view_columns}
+
+    # -------------------------------------------------------------------------
+    # Query
+    # -------------------------------------------------------------------------
+
+    def sort_values(self, sort_field: str) -> "np.ndarray":
+        if sort_field == "totaal":
+            return self.totaal
+        if sort_field == "random_order":
+            return self.random_order
+        return self.year_matrix[self.years.index(int(sort_field[1:]))]
+
+    def _rank(self, sort_field: str) -> "np.ndarray":
+        """Ascending rank per row under ORDER BY sort_field, key (unique, 0..n-1)."""
+        if sort_field == "primary":
+            return self.primary_rank
+        rank = self._ranks.get(sort_field)
+        if rank is None:
+            # Rows are stored in key order, so the row index breaks ties like the key does
+            order = np.lexsort((np.arange(self.n), self.sort_values(sort_field)))
+            rank = np.empty(self.n, dtype=np.int32)
+            rank[order] = np.arange(self.n, dtype=np.int32)
+            self._ranks[sort_field] = rank
+        return rank
+
+    def query(
+        self,
+        sort_field: str,
+        descending: bool,
+        limit: int,
+        offset: int,
+        jaar: Optional[int] = None,
+        min_bedrag: Optional[float] = None,
+        max_bedrag: Optional[float] = None,
+        min_years: Optional[int] = None,
+        random_threshold: Optional[float] = None,
+        with_totals: bool = False,
+    ) -> tuple["np.ndarray", int, dict | None]:
+        """
+        Filter, count and page the table.
+
+        sort_field: "totaal", "primary", "random_order" or "y<year>".
+        random_threshold is a page-only condition (random_order > threshold):
+        it does not affect count/totals, like the SQL random first page.
+
+        Returns (row indices of the page in order, total count, totals or None).
+        """
+        mask = np.ones(self.n, dtype=bool)
+        if jaar is not None:
+            mask &= self.year_matrix[self.years.index(jaar)] > 0
+        if min_bedrag is not None:
+            mask &= self.totaal >= min_bedrag
+        if max_bedrag is not None:
+            mask &= self.totaal <= max_bedrag
+        if min_years is not None and min_years > 0:
+            mask &= self.years_with_data >= min_years
+
+        total = int(np.count_nonzero(mask))
+        totals = None
+        if with_totals:
+            year_sums = self.year_matrix[:, mask].sum(axis=1)
+            totals = {
+                "years": {year: int(year_sums[i]) for i, year in enumerate(self.years)},
+                "totaal": int(self.totaal[mask].sum()),
+            }
+
+        if random_threshold is not None:
+            mask &= self.random_order > random_threshold
+
+        candidates = np.flatnonzero(mask)
+        rank = self._rank(sort_field)[candidates]
+        if descending:
+            rank = -rank.astype(np.int64)
+
+        # Top (offset + limit) without sorting every candidate
+        k = min(offset + limit, len(candidates))
+        if k == 0:
+            return candidates[:0], total, totals
+        if k < len(candidates):
+            top = np.argpartition(rank, k - 1)[:k]
+        else:
+            top = np.arange(len(candidates))
+        top = top[np.argsort(rank[top], kind="stable")]
+        return candidates[top[offset:k]], total, totals
+
+    def rows(self, indices: "np.ndarray", columns: Optional[list[str]] = None) -> list[dict]:
+        """Build API rows for the given indices (same shape as the SQL path)."""
+        result = []
+        for i in indices.tolist():
+            row = {
+                "primary_value": self.primary[i],
+                "years": {year: int(self.year_matrix[y, i]) for y, year in enumerate(self.years)},
+                "totaal": int(self.totaal[i]),
+                "row_count": int(self.row_count[i]),
+            }
+            if columns:
+                row["extra_columns"] = {
+                    col: self._extra_values[col][self.extra_codes[col][i]] for col in columns
+                }
+                row["extra_column_counts"] = {col: int(self.extra_counts[col][i]) for col in columns}
+            result.append(row)
+        return result
+
+    def stats(self) -> dict:
+        arrays = [self.primary_rank, self.year_matrix, self.totaal, self.row_count,
+                  self.years_with_data, self.random_order,
+                  *self.extra_codes.values(), *self.extra_counts.values(), *self._ranks.values()]
+        return {
+            "rows": self.n,
+            "generation": self.generation,
+            "array_bytes": int(sum(a.nbytes for a in arrays)),
+            "ranks": sorted(self._ranks),
+        }
+
+
+# =============================================================================
+# Registry + reload per generation
+# =============================================================================
+
+def get_table(name: str) -> ColumnarTable | None:
+    """The loaded table for the current generation, or None (use PostgreSQL)."""
+    return _reloader.get(name)
+
+
+async def _load_table(name: str, source: ColumnarSource, generation: int) -> ColumnarTable:
+    table = ColumnarTable(name, generation, source.years, source.view_columns)
+    pool = await get_pool()
+    async with pool.acquire(timeout=10) as conn:
+        async with conn.transaction(readonly=True):
+            cursor = await conn.cursor(source.query)
+            while True:
+                records = await cursor.fetch(_LOAD_BATCH_ROWS)
+                if not records:
+                    break
+                table.append(records)
+    table.finish()
+    return table
+
+
+_reloader = GenerationReloader("columnar-reload", "Columnar engine", _load_table)
+
+
+async def start_columnar_engine(sources: dict[str, ColumnarSource]) -> None:
+    """Register sources and start loading in the background (COLUMNAR_ENGINE=true)."""
+    if not get_settings().columnar_engine:
+        return
+    if np is None:
+        logger.warning("COLUMNAR_ENGINE is enabled but numpy is not installed, using PostgreSQL")
+        return
+    _reloader.start(sources)
+
+
+async def stop_columnar_engine() -> None:
+    """Cancel a running load. Call on application shutdown."""
+    await _reloader.stop()
+
+
+def get_columnar_stats() -> dict:
+    """Engine state for /api/v1/health/cache."""
+    return _reloader.stats()
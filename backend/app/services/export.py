@@ -0,0 +1,218 @@
+"""
+CSV/XLSX writers for streaming table exports (/api/v1/modules/{module}/export).
+
+Output matches the frontend export (data-table.tsx generateCSV/downloadXLS):
+- Columns: primary, extra columns, years, Totaal
+- CSV: semicolon separator, UTF-8 BOM, quoted text, amounts with 2 decimals
+- XLSX: one sheet "Rijksuitgaven", same column widths
+- Formula injection protection: text starting with = + - @ tab CR gets a ' prefix
+
+Both writers consume an async row iterator and yield bytes as they go, so the
+full file is never held in memory. The XLSX is written by hand (minimal
+SpreadsheetML, inline strings) into a zip stream — no spreadsheet library
+buffers the workbook.
+"""
+import io
+import re
+import zipfile
+from typing import AsyncIterator
+from xml.sax.saxutils import escape
+
+from app.services.modules import YEARS
+
+# Extra column labels that differ from the capitalized column name
+# (mirrors MODULE_COLUMNS in app/src/components/column-selector/column-selector.tsx)
+COLUMN_LABELS: dict[str, dict[str, str]] = {
+    "publiek": {
+        "source": "Organisatie",
+        "regeling": "Regeling (RVO/COA)",
+        "trefwoorden": "Trefwoorden (RVO)",
+        "sectoren": "Sectoren (RVO)",
+        "provincie": "Regio (RVO)",
+        "staffel": "Staffel (COA)",
+        "onderdeel": "Onderdeel (NWO)",
+    },
+}
+
+CSV_MEDIA_TYPE = "text/csv; charset=utf-8"
+XLSX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+# Rows per yielded chunk (XLSX: compressed output is drained per chunk)
+_CHUNK_ROWS = 500
+
+_FORMULA_TRIGGER = re.compile(r"^[=+\-@\t\r]")
+
+# Characters not allowed in XML 1.0 (control characters except tab/LF/CR)
+_XML_ILLEGAL = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]")
+
+
+def export_headers(module: str, primary_field: str, extra_columns: list[str]) -> list[str]:
+    """Header row: Primary, extra columns, years, Totaal."""
+    labels = COLUMN_LABELS.get(module, {})
+    return (
+        [primary_field.capitalize()]
+        + [labels.get(col, col.capitalize()) for col in extra_columns]
+        + [str(year) for year in YEARS]
+        + ["Totaal"]
+    )
+
+
+def _sanitize(value: str) -> str:
+    """Prefix formula-trigger characters with a single quote to prevent execution."""
+    if _FORMULA_TRIGGER.match(value):
+        return f"'{value}"
+    return value
+
+
+def _row_values(row: dict, extra_columns: list[str]) -> tuple[list[str], list]:
+    """Split an export row into (text cells, amount cells)."""
+    extras = row.get("extra_columns") or {}
+    text = [row["primary_value"] or ""] + [extras.get(col) or "" for col in extra_columns]
+    amounts = [row["years"].get(year, 0) or 0 for year in YEARS] + [row["totaal"] or 0]
+    return text, amounts
+
+
+# =============================================================================
+# CSV
+# =============================================================================
+
+def _csv_cell(value: str) -> str:
+    return '"' + _sanitize(value.replace('"', '""')) + '"'
+
+
+async def stream_csv(
+    rows: AsyncIterator[dict],
+    headers: list[str],
+    extra_columns: list[str],
+) -> AsyncIterator[bytes]:
+    """Yield a semicolon-separated CSV (UTF-8 with BOM) for Dutch Excel."""
+    parts = ["\ufeff" + ";".join(f'"{h}"' for h in headers)]
+    async for row in rows:
+        text, amounts = _row_values(row, extra_columns)
+        parts.append("\n" + ";".join(
+            [_csv_cell(v) for v in text] + [f"{float(a):.2f}" for a in amounts]
+        ))
+        if len(parts) >= _CHUNK_ROWS:
+            yield "".join(parts).encode("utf-8")
+            parts = []
+    if parts:
+        yield "".join(parts).encode("utf-8")
+
+
+# =============================================================================
+# XLSX
+# =============================================================================
+
+_CONTENT_TYPES_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    '</Types>'
+)
+
+_ROOT_RELS_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="xl/workbook.xml"/>'
+    '</Relationships>'
+)
+
+_WORKBOOK_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets><sheet name="Rijksuitgaven" sheetId="1" r:id="rId1"/></sheets>'
+    '</workbook>'
+)
+
+_WORKBOOK_RELS_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+    'Target="worksheets/sheet1.xml"/>'
+    '</Relationships>'
+)
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only, non-seekable sink: zipfile writes into it, we drain it per chunk."""
+
+    def __init__(self):
+        self._chunks: list[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def _xlsx_text_cell(value: str) -> str:
+    text = escape(_XML_ILLEGAL.sub("", _sanitize(value)))
+    return f'<c t="inlineStr"><is><t xml:space="preserve">{text}</t></is></c>'
+
+
+def _xlsx_row(text: list[str], amounts: list) -> str:
+    cells = [_xlsx_text_cell(v) for v in text] + [
+        f"<c><v>{a if isinstance(a, int) else format(a, 'f')}</v></c>" for a in amounts
+    ]
+    return "<row>" + "".join(cells) + "</row>"
+
+
+async def stream_xlsx(
+    rows: AsyncIterator[dict],
+    headers: list[str],
+    extra_columns: list[str],
+) -> AsyncIterator[bytes]:
+    """Yield an .xlsx workbook with one sheet, compressed as it is written."""
+    sink = _ChunkSink()
+    with zipfile.ZipFile(sink, mode="w", compression=zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("[Content_Types].xml", _CONTENT_TYPES_XML)
+        zf.writestr("_rels/.rels", _ROOT_RELS_XML)
+        zf.writestr("xl/workbook.xml", _WORKBOOK_XML)
+        zf.writestr("xl/_rels/workbook.xml.rels", _WORKBOOK_RELS_XML)
+
+        # Column widths: primary 40, extra columns 20, years 12, Totaal 14
+        widths = [40] + [20] * len(extra_columns) + [12] * len(YEARS) + [14]
+        cols = "".join(
+            f'<col min="{i}" max="{i}" width="{w}" customWidth="1"/>'
+            for i, w in enumerate(widths, start=1)
+        )
+
+        # Size is unknown up front: force ZIP64 so large exports stay valid
+        with zf.open("xl/worksheets/sheet1.xml", mode="w", force_zip64=True) as sheet:
+            sheet.write((
+                '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+                f"<cols>{cols}</cols><sheetData>"
+                + _xlsx_row(headers, [])
+            ).encode("utf-8"))
+
+            parts: list[str] = []
+            async for row in rows:
+                text, amounts = _row_values(row, extra_columns)
+                parts.append(_xlsx_row(text, amounts))
+                if len(parts) >= _CHUNK_ROWS:
+                    sheet.write("".join(parts).encode("utf-8"))
+                    parts = []
+                    chunk = sink.drain()
+                    if chunk:
+                        yield chunk
+
+            sheet.write(("".join(parts) + "</sheetData></worksheet>").encode("utf-8"))
+
+    yield sink.drain()
@@ -0,0 +1,263 @@
+"""
+In-memory facet index for cascading filter options (/modules/{module}/filter-options).
+
+Each option count is the number of distinct recipients (primary values) among
+the source rows that have that value AND match the active filters of all
+OTHER fields (bidirectional cascading). In SQL that is one COUNT(DISTINCT)
+GROUP BY scan of the source table per filter field, every time a checkbox
+changes.
+
+With FACET_INDEX=true every source table is loaded once per dataset
+generation into:
+
+- per (field, value): a roaring bitmap of row IDs and one of recipient IDs
+- per field: the value code of every row, and the recipient ID of every row
+
+A request then runs without database round trips:
+
+- rows matching one active filter = union of its values' row bitmaps
+- rows matching "all other filters" for a field = intersection of those unions
+- no other filter active: count = size of the value's recipient bitmap
+- otherwise the matching rows' (value code, recipient) pairs are deduplicated
+  with NumPy and counted per value
+
+Options are ordered like the SQL query: count DESC, then value in database
+collation order (ranks fetched while loading).
+
+Until an index is loaded for the current generation, get_facet_index()
+returns None and callers use PostgreSQL as before. pyroaring and numpy are
+optional: without them the index stays disabled.
+"""
+import logging
+from functools import reduce
+
+from app.config import get_settings
+from app.services.cache import GenerationReloader
+from app.services.database import get_pool
+
+try:
+    import numpy as np
+    from pyroaring import BitMap
+except ImportError:  # Optional dependencies (requirements.txt), index stays disabled
+    np = None
+    BitMap = None
+
+logger = logging.getLogger(__name__)
+
+# Rows fetched per cursor batch while loading (bounds transient memory)
+_LOAD_BATCH_ROWS = 50_000
+
+
+class FacetIndex:
+    """
+    Facet bitmaps for one source table.
+
+    Expected load columns: primary_value, then one text column per filter
+    field (NULL or '' = no value, like the SQL WHERE field IS NOT NULL AND
+    field != '').
+    """
+
+    def __init__(self, name: str, generation: int, fields: list[str]):
+        self.name = name
+        self.generation = generation
+        self.fields = fields
+        self.n = 0
+        self.values: dict[str, list[str]] = {f: [] for f in fields}
+        self.value_codes: dict[str, dict[str, int]] = {f: {} for f in fields}
+        self._recipient_lookup: dict[str, int] = {}
+        self._chunks: dict[str, list] = {}
+
+    # -------------------------------------------------------------------------
+    # Loading
+    # -------------------------------------------------------------------------
+
+    def append(self, records: list) -> None:
+        """Append one batch of records (value and recipient codes per row)."""
+        recipients = self._recipient_lookup
+        codes = []
+        for r in records:
+            value = r["primary_value"]
+            if value is None:
+                codes.append(-1)
+                continue
+            code = recipients.get(value)
+            if code is None:
+                code = recipients[value] = len(recipients)
+            codes.append(code)
+        self._chunks.setdefault("recipient", []).append(np.array(codes, dtype=np.int32))
+
+        for f in self.fields:
+            lookup = self.value_codes[f]
+            values = self.values[f]
+            codes = []
+            for r in records:
+                value = r[f]
+                if value is None or value == "":
+                    codes.append(-1)
+                    continue
+                code = lookup.get(value)
+                if code is None:
+                    code = lookup[value] = len(values)
+                    values.append(value)
+                codes.append(code)
+            self._chunks.setdefault(f, []).append(np.array(codes, dtype=np.int32))
+
+    def finish(self, collation_ranks: dict[str, list[int]]) -> None:
+        """
+        Concatenate the batches and build the bitmaps.
+
+        collation_ranks: per field, the database sort rank of each value code.
+        """
+        empty = np.empty(0, dtype=np.int32)
+        self.recipient_of = np.concatenate(self._chunks.get("recipient", [empty]))
+        self.codes = {f: np.concatenate(self._chunks.get(f, [empty])) for f in self.fields}
+        self._chunks = {}
+        self.n = len(self.recipient_of)
+        self.n_recipients = len(self._recipient_lookup)
+        self._recipient_lookup = {}
+        self.ranks = {f: np.array(collation_ranks[f], dtype=np.int32) for f in self.fields}
+
+        self.rows: dict[str, list[BitMap]] = {}
+        self.recipients: dict[str, list[BitMap]] = {}
+        for f in self.fields:
+            codes = self.codes[f]
+            order = np.argsort(codes, kind="stable")
+            bounds = np.searchsorted(codes[order], np.arange(len(self.values[f]) + 1))
+            row_maps, recipient_maps = [], []
+            for code in range(len(self.values[f])):
+                row_ids = order[bounds[code]:bounds[code + 1]]
+                recipient_ids = self.recipient_of[row_ids]
+                row_maps.append(BitMap(row_ids.tolist()))
+                recipient_maps.append(BitMap(recipient_ids[recipient_ids >= 0].tolist()))
+            self.rows[f] = row_maps
+            self.recipients[f] = recipient_maps
+
+    # -------------------------------------------------------------------------
+    # Query
+    # -------------------------------------------------------------------------
+
+    def _matching_rows(self, field: str, values: list[str]) -> "BitMap":
+        """Rows where field has one of values (unknown values match nothing)."""
+        value_codes = self.value_codes[field]
+        maps = [self.rows[field][value_codes[v]] for v in set(values) if v in value_codes]
+        return BitMap.union(*maps) if maps else BitMap()
+
+    def _counts(self, field: str, rows: "BitMap") -> tuple["np.ndarray", "np.ndarray"]:
+        """(distinct recipients per value code, value present per code) within rows."""
+        n_values = len(self.values[field])
+        row_ids = np.frombuffer(rows.to_array(), dtype=np.uint32)
+        codes = self.codes[field][row_ids]
+        recipients = self.recipient_of[row_ids]
+        has_value = codes >= 0
+        present = np.bincount(codes[has_value], minlength=n_values) > 0
+
+        keep = has_value & (recipients >= 0)
+        pairs = np.unique(codes[keep].astype(np.int64) * max(self.n_recipients, 1) + recipients[keep])
+        counts = np.bincount(pairs // max(self.n_recipients, 1), minlength=n_values)
+        return counts, present
+
+    def options(
+        self,
+        active_filters: dict[str, list[str]],
+        max_options: int,
+        max_values_per_filter: int,
+    ) -> dict[str, list[dict]]:
+        """Same result as the SQL cascading query: {field: [{"value", "count"}, ...]}."""
+        selected = {
+            f: self._matching_rows(f, values[:max_values_per_filter])
+            for f, values in active_filters.items()
+            if values and f in self.rows
+        }
+
+        result = {}
+        for field in self.fields:
+            others = [rows for f, rows in selected.items() if f != field]
+            if others:
+                rows = reduce(lambda a, b: a & b, others) if len(others) > 1 else others[0]
+                counts, present = self._counts(field, rows)
+                codes = np.flatnonzero(present)
+            else:
+                counts = np.array([len(m) for m in self.recipients[field]], dtype=np.int64)
+                codes = np.arange(len(counts))
+
+            # ORDER BY count DESC, value (database collation)
+            order = np.lexsort((self.ranks[field][codes], -counts[codes]))[:max_options]
+            values = self.values[field]
+            result[field] = [
+                {"value": values[code], "count": int(counts[code])}
+                for code in codes[order].tolist()
+            ]
+        return result
+
+    def stats(self) -> dict:
+        arrays = [self.recipient_of, *self.codes.values(), *self.ranks.values()]
+        return {
+            "rows": self.n,
+            "recipients": self.n_recipients,
+            "generation": self.generation,
+            "values": {f: len(self.values[f]) for f in self.fields},
+            "array_bytes": int(sum(a.nbytes for a in arrays)),
+        }
+
+
+# =============================================================================
+# Registry + reload per generation
+# =============================================================================
+
+def get_facet_index(name: str) -> FacetIndex | None:
+    """The loaded index for the current generation, or None (use PostgreSQL)."""
+    return _reloader.get(name)
+
+
+async def _load_index(name: str, source: tuple[str, str, list[str]], generation: int) -> FacetIndex:
+    """source: source table, primary field, filter fields."""
+    table, primary, fields = source
+    index = FacetIndex(name, generation, fields)
+    field_cols = ", ".join(f'"{f}"::text AS "{f}"' for f in fields)
+    query = f'SELECT "{primary}"::text AS primary_value, {field_cols} FROM {table}'
+    pool = await get_pool()
+    async with pool.acquire(timeout=10) as conn:
+        async with conn.transaction(readonly=True):
+            cursor = await conn.cursor(query)
+            while True:
+                records = await cursor.fetch(_LOAD_BATCH_ROWS)
+                if not records:
+                    break
+                index.append(records)
+
+        # Tie-break order of equal counts: database collation, like ORDER BY "field"::text
+        collation_ranks = {}
+        for f in fields:
+            ordered = await conn.fetch(
+                "SELECT i FROM unnest($1::text[]) WITH ORDINALITY AS v(value, i) ORDER BY value",
+                index.values[f],
+            )
+            ranks = [0] * len(ordered)
+            for rank, row in enumerate(ordered):
+                ranks[row["i"] - 1] = rank
+            collation_ranks[f] = ranks
+    index.finish(collation_ranks)
+    return index
+
+
+_reloader = GenerationReloader("facet-reload", "Facet index", _load_index)
+
+
+async def start_facet_index(sources: dict[str, tuple[str, str, list[str]]]) -> None:
+    """Register sources and start loading in the background (FACET_INDEX=true)."""
+    if not get_settings().facet_index:
+        return
+    if np is None or BitMap is None:
+        logger.warning("FACET_INDEX is enabled but pyroaring/numpy is not installed, using PostgreSQL")
+        return
+    _reloader.start(sources)
+
+
+async def stop_facet_index() -> None:
+    """Cancel a running load. Call on application shutdown."""
+    await _reloader.stop()
+
+
+def get_facet_stats() -> dict:
+    """Index state for /api/v1/health/cache."""
+    return _reloader.stats()
@@ -0,0 +1,111 @@
+"""
+Dataset generation listener.
+
+The materialized views only change when refresh-all-views.sql runs, which
+ends with bump_data_generation() (077 migration). That function increments
+data_generation.generation and sends pg_notify('data_generation', <n>).
+
+Each replica holds ONE dedicated asyncpg connection (outside the pool) that
+LISTENs on the channel and broadcasts the new generation to every in-process
+cache via set_data_generation(). The same connection polls the table every
+data_generation_poll_seconds as a fallback for notifications missed while
+disconnected.
+
+NOTE: LISTEN needs a session-level connection. Supabase's transaction-mode
+pooler (port 6543) does not deliver notifications — use the session pooler
+(port 5432) or a direct connection via DATABASE_LISTEN_URL.
+"""
+import asyncio
+import logging
+from typing import Optional
+
+import asyncpg
+
+from app.config import get_settings
+from app.services.cache import set_data_generation
+from app.services.database import fetch_val
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+CHANNEL = "data_generation"
+GENERATION_QUERY = "SELECT generation FROM data_generation WHERE id = 1"
+
+_listener_task: Optional[asyncio.Task] = None
+
+
+def _on_notify(connection, pid, channel, payload) -> None:
+    """asyncpg notification callback — payload is the new generation."""
+    try:
+        generation = int(payload)
+    except (TypeError, ValueError):
+        logger.warning(f"Ignoring invalid {CHANNEL} payload: {payload!r}")
+        return
+    set_data_generation(generation)
+
+
+async def _listen_loop() -> None:
+    """Hold the LISTEN connection open, reconnecting with exponential backoff."""
+    backoff = 1.0
+    while True:
+        conn: Optional[asyncpg.Connection] = None
+        try:
+            conn = await asyncpg.connect(
+                settings.database_listen_url or settings.database_url,
+                statement_cache_size=0,  # pgbouncer compatibility (see database.py)
+            )
+            await conn.add_listener(CHANNEL, _on_notify)
+            logger.info(f"Listening for dataset generation changes on '{CHANNEL}'")
+            backoff = 1.0
+
+            # Re-sync immediately (a bump may have happened while disconnected),
+            # then poll as a fallback. The poll also detects dead connections.
+            while not conn.is_closed():
+                generation = await conn.fetchval(GENERATION_QUERY)
+                if generation is not None:
+                    set_data_generation(int(generation))
+                await asyncio.sleep(settings.data_generation_poll_seconds)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Generation listener error: {type(e).__name__}: {e} (retry in {backoff:.0f}s)")
+        finally:
+            if conn is not None and not conn.is_closed():
+                try:
+                    await conn.close(timeout=5)
+                except Exception:
+                    conn.terminate()
+
+        await asyncio.sleep(backoff)
+        backoff = min(backoff * 2, 60.0)
+
+
+async def start_generation_listener() -> None:
+    """
+    Load the current generation and start the background listener.
+
+    If the data_generation table does not exist yet (077 not applied),
+    caches keep generation 0 and rely on their TTL.
+    """
+    global _listener_task
+    try:
+        generation = await fetch_val(GENERATION_QUERY)
+        if generation is not None:
+            set_data_generation(int(generation))
+    except Exception as e:
+        logger.warning(f"Could not load data generation (caches fall back to TTL): {type(e).__name__}: {e}")
+
+    if _listener_task is None:
+        _listener_task = asyncio.create_task(_listen_loop(), name="data-generation-listener")
+
+
+async def stop_generation_listener() -> None:
+    """Cancel the listener task. Call on application shutdown."""
+    global _listener_task
+    if _listener_task is not None:
+        _listener_task.cancel()
+        try:
+            await _listener_task
+        except asyncio.CancelledError:
+            pass
+        _listener_task = None
@@ -4,24 +4,87 @@ Shared HTTP client for external service calls (Typesense).
 Centralizes httpx.AsyncClient lifecycle to avoid duplicate clients
 in modules.py and search.py. Uses asyncio.Lock for safe lazy init
 (matches database.py pool pattern).
+
+Pool limits are explicit (TYPESENSE_MAX_CONNECTIONS etc.). With HTTP/2,
+concurrent searches are multiplexed over a few keep-alive connections
+instead of opening one connection per in-flight request.
 """
 import asyncio
+import logging
 import httpx
 
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+
 _http_client: httpx.AsyncClient | None = None
 _http_client_lock = asyncio.Lock()
 
 
 async def get_http_client() -> httpx.AsyncClient:
-    """Get or create shared httpx client (5s timeout)."""
+    """Get or create shared httpx client (explicit pool limits, HTTP/2 when available)."""
     global _http_client
     if _http_client is None:
         async with _http_client_lock:
             if _http_client is None:
-                _http_client = httpx.AsyncClient(timeout=5.0)
+                settings = get_settings()
+                limits = httpx.Limits(
+                    max_connections=settings.typesense_max_connections,
+                    max_keepalive_connections=settings.typesense_max_keepalive_connections,
+                    keepalive_expiry=settings.typesense_keepalive_expiry_seconds,
+                )
+                # Default timeout; Typesense calls pass a per-operation read timeout
+                timeout = httpx.Timeout(5.0, connect=settings.typesense_connect_timeout_seconds)
+                try:
+                    _http_client = httpx.AsyncClient(
+                        limits=limits, timeout=timeout, http2=settings.typesense_http2,
+                    )
+                except ImportError:
+                    # http2=True requires the h2 package (httpx[http2])
+                    logger.warning("HTTP/2 unavailable (h2 not installed), using HTTP/1.1")
+                    _http_client = httpx.AsyncClient(limits=limits, timeout=timeout)
     return _http_client
 
 
+def get_http_pool_stats() -> dict:
+    """
+    Connection pool utilization of the shared client.
+
+    Reads httpcore's pool state (best effort: empty counts before first use).
+    With HTTP/2 a single active connection can carry many requests. These are
+    httpcore internals (pinned in requirements.txt); if they change, only the
+    configured limits are reported.
+    """
+    settings = get_settings()
+    stats = {
+        "max_connections": settings.typesense_max_connections,
+        "max_keepalive_connections": settings.typesense_max_keepalive_connections,
+    }
+    try:
+        transport = getattr(_http_client, "_transport", None)
+        pool = getattr(transport, "_pool", None)
+        connections = list(getattr(pool, "connections", []) or [])
+        requests = getattr(pool, "_requests", []) or []
+
+        idle = sum(1 for c in connections if c.is_idle())
+        http2 = sum(1 for c in connections if "HTTP/2" in c.info())
+        queued = sum(1 for r in requests if r.is_queued())
+    except Exception as e:
+        logger.warning(f"HTTP pool stats unavailable: {type(e).__name__}: {e}")
+        return {**stats, "connections": None}
+
+    return {
+        **stats,
+        "connections": len(connections),
+        "active_connections": len(connections) - idle,
+        "idle_connections": idle,
+        "http2_connections": http2,
+        "queued_requests": queued,
+        "utilization": round((len(connections) - idle) / settings.typesense_max_connections, 4)
+        if settings.typesense_max_connections else 0.0,
+    }
+
+
 async def close_http_client() -> None:
     """Close the shared httpx client. Call on application shutdown."""
     global _http_client
@@ -9,13 +9,21 @@ against whitelists before being used in queries. User input is NEVER used
 directly as identifiers - only as parameterized values.
 """
 import asyncio
+import base64
+import binascii
+import json
 import logging
 import random
 import re
+import time
 from dataclasses import dataclass, field
-from typing import Optional
-import httpx
-from app.services.database import fetch_all, fetch_val, get_pool
+from decimal import Decimal
+from typing import AsyncIterator, Awaitable, Callable, Optional
+from app.services.database import fetch_all, fetch_val, get_pool, normalize_recipient_python
+from app.services.cache import create_cache, create_singleflight, get_data_generation
+from app.services.columnar import ColumnarSource, get_table as get_columnar_table
+from app.services.facets import get_facet_index
+from app.services.typesense import typesense_search, typesense_multi_search
 from app.config import get_settings
 
 logger = logging.getLogger(__name__)
@@ -32,39 +40,69 @@ AVAILABILITY_ENTITY_TYPE = {
     "publiek": "source",
 }
 
-# Cache for module-level availability (rarely changes, avoid repeated queries)
-_availability_cache: dict[str, tuple[int, int]] = {}
+@dataclass
+class AvailabilityIndex:
+    """
+    All data_availability ranges of one data generation (the table is tiny).
+
+    modules: module → (year_from, year_to) from the module-level rows
+    (entity_type IS NULL). Entity-level modules without such a row get the
+    full range, like the unfiltered table view.
+    entities: (module, entity_name) → range, for the entity_type of
+    AVAILABILITY_ENTITY_TYPE.
+    mask_ranges: universal_search.module_mask → combined range (integraal).
+    """
+    modules: dict[str, tuple[int, int]]
+    entities: dict[tuple[str, str], tuple[int, int]]
+    mask_ranges: dict[int, tuple[int | None, int | None]] = field(default_factory=dict)
+
+    def __post_init__(self):
+        # Integraal rows: combined range of the modules in universal_search.module_mask
+        for mask, (_, module_names) in _MODULE_MASK_DECODE.items():
+            ranges = [self.modules[m] for m in module_names if m in self.modules]
+            self.mask_ranges[mask] = (
+                (min(r[0] for r in ranges), max(r[1] for r in ranges)) if ranges else (None, None)
+            )
 
+    def module_range(self, module: str) -> tuple[int | None, int | None]:
+        return self.modules.get(module, (None, None))
 
-async def _get_module_availability(module: str) -> tuple[int | None, int | None]:
-    """Get module-level year range from data_availability table."""
-    # Check cache first (no lock needed - cache is dict, worst case is duplicate query)
-    if module in _availability_cache:
-        return _availability_cache[module]
+    def entity_range(self, module: str, entity_name: str) -> tuple[int, int]:
+        return self.entities.get((module, entity_name), (YEARS[0], YEARS[-1]))
 
-    # Query database (cache miss)
-    row = await fetch_all(
-        "SELECT year_from, year_to FROM data_availability WHERE module = $1 AND entity_type IS NULL",
-        module,
-    )
-    if row:
-        result = (row[0]["year_from"], row[0]["year_to"])
-        # Store in cache (race condition possible but harmless - both queries return same data)
-        _availability_cache[module] = result
-        return result
-    return (None, None)
+    def mask_range(self, module_mask: int) -> tuple[int | None, int | None]:
+        return self.mask_ranges.get(module_mask, (None, None))
 
 
-async def _get_entity_availability(module: str) -> dict[str, tuple[int, int]]:
-    """Get entity-level year ranges for a module. Returns {entity_name: (year_from, year_to)}."""
-    entity_type = AVAILABILITY_ENTITY_TYPE.get(module)
-    if not entity_type:
-        return {}
-    rows = await fetch_all(
-        "SELECT entity_name, year_from, year_to FROM data_availability WHERE module = $1 AND entity_type = $2",
-        module, entity_type,
-    )
-    return {r["entity_name"]: (r["year_from"], r["year_to"]) for r in rows}
+# One index per data generation: loaded with one query, shared by all requests
+_availability_cache = create_cache("availability", max_entries=2, ttl_seconds=86400)
+_availability_flight = create_singleflight("availability")
+
+
+async def get_availability_index() -> AvailabilityIndex:
+    """The availability index for the current data generation."""
+    key = get_data_generation()
+    found, cached = _availability_cache.get(key)
+    if found:
+        return cached
+
+    async def _load():
+        rows = await fetch_all(
+            "SELECT module, entity_type, entity_name, year_from, year_to FROM data_availability"
+        )
+        modules = {mod: (YEARS[0], YEARS[-1]) for mod in AVAILABILITY_ENTITY_TYPE}
+        entities = {}
+        for r in rows:
+            avail = (r["year_from"], r["year_to"])
+            if r["entity_type"] is None:
+                modules[r["module"]] = avail
+            elif r["entity_type"] == AVAILABILITY_ENTITY_TYPE.get(r["module"]):
+                entities[(r["module"], r["entity_name"])] = avail
+        index = AvailabilityIndex(modules=modules, entities=entities)
+        _availability_cache.set(key, index)
+        return index
+
+    return await _availability_flight.do(key, _load)
 
 
 async def _inject_availability(
@@ -73,6 +111,7 @@ async def _inject_availability(
 ) -> list[dict]:
     """Add data_available_from/to fields to each row based on module type."""
     entity_type = AVAILABILITY_ENTITY_TYPE.get(module)
+    availability = await get_availability_index()
 
     if entity_type:
         # Entity-level module (gemeente/provincie/publiek)
@@ -82,8 +121,7 @@ async def _inject_availability(
         if len(entity_filter) == 1:
             # Filtered to a single entity (e.g., ?gemeente=Amersfoort)
             # Use that entity's specific availability
-            entity_avail = await _get_entity_availability(module)
-            avail = entity_avail.get(entity_filter[0], (YEARS[0], YEARS[-1]))
+            avail = availability.entity_range(module, entity_filter[0])
             for row in rows:
                 row["data_available_from"] = avail[0]
                 row["data_available_to"] = avail[1]
@@ -94,7 +132,7 @@ async def _inject_availability(
                 row["data_available_to"] = YEARS[-1]
     else:
         # Module-level: same range for all rows
-        year_from, year_to = await _get_module_availability(module)
+        year_from, year_to = availability.module_range(module)
         for row in rows:
             row["data_available_from"] = year_from
             row["data_available_to"] = year_to
@@ -102,52 +140,6 @@ async def _inject_availability(
     return rows
 
 
-# =============================================================================
-# Typesense Client Helper (for fast autocomplete)
-# =============================================================================
-
-from app.services.http_client import get_http_client as _get_http_client
-
-
-async def _typesense_search(collection: str, params: dict) -> dict:
-    """
-    Execute search against Typesense.
-
-    Uses httpx for async HTTP requests. Returns empty result on error.
-    Typesense delivers <50ms response times vs seconds for PostgreSQL regex.
-    """
-    settings = get_settings()
-    if not settings.typesense_host or not settings.typesense_api_key:
-        logger.warning("Typesense not configured, falling back to empty results")
-        return {"hits": [], "grouped_hits": []}
-
-    url = f"{settings.typesense_protocol}://{settings.typesense_host}:{settings.typesense_port}/collections/{collection}/documents/search"
-
-    try:
-        client = await _get_http_client()
-        response = await client.get(
-            url,
-            params=params,
-            headers={"X-TYPESENSE-API-KEY": settings.typesense_api_key},
-        )
-
-        if response.status_code != 200:
-            logger.warning(f"Typesense search failed: {response.status_code}")
-            return {"hits": [], "grouped_hits": []}
-
-        try:
-            return response.json()
-        except ValueError as json_err:
-            logger.error(f"Typesense returned invalid JSON: {json_err}")
-            return {"hits": [], "grouped_hits": []}
-    except httpx.TimeoutException:
-        logger.warning("Typesense search timeout")
-        return {"hits": [], "grouped_hits": []}
-    except httpx.RequestError as e:
-        logger.error(f"Typesense request error: {type(e).__name__}: {e}")
-        return {"hits": [], "grouped_hits": []}
-
-
 # =============================================================================
 # Word-Boundary Search (V1.2)
 # =============================================================================
@@ -268,6 +260,34 @@ def build_search_condition(field: str, param_idx: int, search: str) -> tuple[str
     )
 
 
+def build_search_prefilter(search: str) -> str:
+    """
+    Build the ILIKE pattern that prefilters a word-boundary search.
+
+    A \\y regex cannot use an index; ILIKE '%term%' can (pg_trgm GIN indexes,
+    080-search-trigram-prefilter-indexes.sql). Every \\y match is also a
+    substring match, so (ILIKE AND ~*) returns the same rows as ~* alone.
+
+    Returns:
+        e.g., "%politie%" (LIKE wildcards in the search term escaped)
+    """
+    parsed = parse_search_query(search)
+    search_lower = parsed.raw.lower().strip()
+    escaped = search_lower.replace("\\", "\\\\").replace("%", r"\%").replace("_", r"\_")
+    return f"%{escaped}%"
+
+
+def word_match_sql(fields: list[str], regex_idx: int, like_idx: int) -> str:
+    """
+    OR of word-boundary matches over fields, each as index prefilter + recheck:
+    (field ILIKE $like AND field ~* $regex). Params: build_search_prefilter()
+    and the pattern from build_search_condition().
+    """
+    return " OR ".join(
+        f"({field} ILIKE ${like_idx} AND {field} ~* ${regex_idx})" for field in fields
+    )
+
+
 def is_word_boundary_match(search: str, text: str) -> bool:
     """
     Check if ALL search terms appear as whole words in text.
@@ -356,7 +376,7 @@ async def _lookup_matched_fields(
     case_value += "            ELSE NULL\n        END"
 
     # Build OR conditions for non-primary fields
-    or_conditions = " OR ".join([f"{f} ~* $1" for f in other_fields])
+    or_conditions = word_match_sql(other_fields, 1, 3)
 
     # Query: find ONE matching row per primary value where a non-primary field matches
     # Uses LIMIT per primary_value via lateral join for efficiency
@@ -379,8 +399,8 @@ async def _lookup_matched_fields(
         ) t
     """
 
-    # Execute query - pass pattern and array of primary values
-    rows = await fetch_all(query, pattern, primary_values)
+    # Execute query - pass pattern, array of primary values and ILIKE prefilter
+    rows = await fetch_all(query, pattern, primary_values, build_search_prefilter(search))
 
     # Build result dict
     result = {}
@@ -409,6 +429,8 @@ def _init_allowed_identifiers():
         ALLOWED_TABLES.add(config["table"])
         if config.get("aggregated_table"):
             ALLOWED_TABLES.add(config["aggregated_table"])
+        if config.get("recipient_table"):
+            ALLOWED_TABLES.add(config["recipient_table"])
 
     # Add universal_search table
     ALLOWED_TABLES.add("universal_search")
@@ -461,6 +483,8 @@ MODULE_CONFIG = {
     "instrumenten": {
         "table": "instrumenten",
         "aggregated_table": "instrumenten_aggregated",  # Pre-computed view
+        "key_field": "ontvanger_key",  # Unique row key in view (keyset pagination tie-breaker)
+        "source_key_field": "ontvanger_key",  # Stored normalize_recipient(primary) in source table (082)
         "primary_field": "ontvanger",
         "year_field": "begrotingsjaar",
         "amount_field": "bedrag",
@@ -474,6 +498,8 @@ MODULE_CONFIG = {
     "apparaat": {
         "table": "apparaat",
         "aggregated_table": "apparaat_aggregated",
+        "key_field": "kostensoort",
+        "source_key_field": "kostensoort_key",
         "primary_field": "kostensoort",
         "year_field": "begrotingsjaar",
         "amount_field": "bedrag",
@@ -487,6 +513,8 @@ MODULE_CONFIG = {
     "inkoop": {
         "table": "inkoop",
         "aggregated_table": "inkoop_aggregated",
+        "key_field": "leverancier_key",
+        "source_key_field": "leverancier_key",
         "primary_field": "leverancier",
         "year_field": "jaar",
         "amount_field": "totaal_avg",
@@ -500,6 +528,8 @@ MODULE_CONFIG = {
     "provincie": {
         "table": "provincie",
         "aggregated_table": "provincie_aggregated",
+        "key_field": "ontvanger_key",
+        "source_key_field": "ontvanger_key",
         "primary_field": "ontvanger",
         "year_field": "jaar",
         "amount_field": "bedrag",
@@ -512,10 +542,14 @@ MODULE_CONFIG = {
         # Entity field: the defining dimension for this module (028 migration)
         # Views are grouped by (recipient, entity) for accurate entity filtering
         "entity_field": "provincie",
+        # One row per recipient (079 rollup of aggregated_table): default view, no entity filter
+        "recipient_table": "provincie_recipient_aggregated",
     },
     "gemeente": {
         "table": "gemeente",
         "aggregated_table": "gemeente_aggregated",
+        "key_field": "ontvanger_key",
+        "source_key_field": "ontvanger_key",
         "primary_field": "ontvanger",
         "year_field": "jaar",
         "amount_field": "bedrag",
@@ -526,10 +560,13 @@ MODULE_CONFIG = {
         # Columns available in aggregated view (default columns for speed)
         "view_columns": ["gemeente", "omschrijving"],
         "entity_field": "gemeente",
+        "recipient_table": "gemeente_recipient_aggregated",
     },
     "publiek": {
         "table": "publiek",
         "aggregated_table": "publiek_aggregated",
+        "key_field": "ontvanger_key",
+        "source_key_field": "ontvanger_key",
         "primary_field": "ontvanger",
         "year_field": "jaar",
         "amount_field": "bedrag",
@@ -540,6 +577,7 @@ MODULE_CONFIG = {
         # Columns available in aggregated view (default columns for speed)
         "view_columns": ["source"],
         "entity_field": "source",
+        "recipient_table": "publiek_recipient_aggregated",
     },
 }
 
@@ -547,11 +585,468 @@ MODULE_CONFIG = {
 _init_allowed_identifiers()
 
 
+# =============================================================================
+# Result Cache
+# =============================================================================
+# Table pages are identical across users for the default view and popular
+# searches, and only change when the materialized views are refreshed.
+# Keys include the dataset generation, so a refresh invalidates exactly.
+# =============================================================================
+
+_result_cache = create_cache(
+    "module_data",
+    max_entries=get_settings().result_cache_max_entries,
+    ttl_seconds=get_settings().result_cache_ttl_seconds,
+)
+
+# Concurrent cache misses for the same key share one execution (news spikes:
+# dozens of identical ?q= requests in the same second would otherwise each
+# fan out into 3-4 parallel queries and starve the 10-connection pool).
+_result_flight = create_singleflight("module_data")
+
+
+def _normalize_filter_fields(filter_fields: Optional[dict[str, list]]) -> tuple:
+    """Order-independent, hashable form of multi-select filters (IN semantics)."""
+    if not filter_fields:
+        return ()
+    return tuple(sorted(
+        (field, tuple(sorted(str(v) for v in values)))
+        for field, values in filter_fields.items()
+        if values
+    ))
+
+
+# =============================================================================
+# Search Sessions
+# =============================================================================
+# Paging through a search re-ran the full hybrid pipeline per page: Typesense
+# field searches, the secondary-match aggregation, "Ook in" enrichment, COUNT
+# and totals. None of that depends on the page (search results are ranked by
+# relevance, whatever sort_by says), so it is kept per search and reused:
+# - with secondary matches, the merged + ranked rows are kept; a page is a slice
+# - otherwise the key split is kept; a page is one LIMIT/OFFSET query
+# =============================================================================
+
+@dataclass
+class SearchSession:
+    """Page-independent result of one search on an aggregated view."""
+    typesense_keys: list[str]
+    primary_only_keys: list[str]
+    secondary_only_keys: list[str]
+    matched_info: dict[str, tuple[str | None, str | None]]  # Enriched ("Ook in")
+    total: int
+    totals: dict | None
+    merged: list[dict] | None = None  # All rows, ranked (only with secondary matches)
+
+
+_search_sessions = create_cache(
+    "search_session",
+    max_entries=get_settings().search_session_max_entries,
+    ttl_seconds=get_settings().search_session_ttl_seconds,
+)
+
+
+def _search_session_key(
+    table: str,
+    search: str,
+    jaar: Optional[int],
+    min_bedrag: Optional[float],
+    max_bedrag: Optional[float],
+    min_years: Optional[int],
+    entity_filter: Optional[list[str]],
+) -> tuple:
+    """Key on the parsed query: case, spacing and wildcards do not change results."""
+    parsed = parse_search_query(search)
+    return (
+        "search_session", get_data_generation(), table,
+        tuple(p.lower() for p in parsed.phrases), tuple(w.lower() for w in parsed.words),
+        jaar, min_bedrag, max_bedrag, min_years,
+        tuple(sorted(entity_filter)) if entity_filter else (),
+    )
+
+
+def _is_cacheable(search: Optional[str], sort_by: str, offset: int) -> bool:
+    """
+    Random sort on the first page picks a fresh random threshold per request
+    (UX-002), so caching it would show every user the same "random" page.
+    Later random pages are deterministic (ORDER BY random_order OFFSET n).
+    """
+    return not (sort_by == "random" and not search and offset == 0)
+
+
+# =============================================================================
+# Fused Page Query
+# =============================================================================
+# Filtered table views need three things from the same WHERE clause: the page,
+# COUNT(*) and per-year SUM totals. As three statements that is three scans of
+# the filtered set and three pool connections. The fused query scans once into
+# a materialized CTE (only the columns the page, sort and totals read) and
+# derives all three from it. The three-query plan stays as fallback
+# (FUSED_PAGE_QUERY=false, or when the fused query fails).
+# =============================================================================
+
+_TOTALS_SELECT = ", ".join(f'SUM("{y}") AS sum_{y}' for y in YEARS) + ", SUM(totaal) AS sum_totaal"
+
+
+def _build_fused_query(
+    select_sql: str,
+    filtered_columns: list[str],
+    from_clause: str,
+    where_sql: str,
+    page_where_sql: str,
+    sort_clause: str,
+    limit_param_idx: int,
+) -> str:
+    """
+    Build a single-scan query returning page rows + total count + totals.
+
+    One row per page row (plus _total_count/sum_* on every row), or a single
+    row with _page_pos NULL when the page is empty. page_where_sql holds
+    page-only conditions (random threshold) that must not affect count/totals.
+
+    filtered_columns: the columns (or "expr AS name") that select_sql,
+    page_where_sql, sort_clause and the totals read, instead of whole view
+    rows. Sort columns must be among them: the page position is numbered with
+    the same ORDER BY, which only sees the CTE's columns.
+    """
+    return f"""
+        WITH filtered AS MATERIALIZED (
+            SELECT {", ".join(filtered_columns)}
+            FROM {from_clause}
+            {where_sql}
+        ),
+        stats AS (
+            SELECT COUNT(*) AS _total_count, {_TOTALS_SELECT}
+            FROM filtered
+        ),
+        page AS (
+            SELECT {select_sql},
+                ROW_NUMBER() OVER ({sort_clause}) AS _page_pos
+            FROM filtered
+            {page_where_sql}
+            {sort_clause}
+            LIMIT ${limit_param_idx} OFFSET ${limit_param_idx + 1}
+        )
+        SELECT stats.*, page.*
+        FROM stats
+        LEFT JOIN page ON TRUE
+        ORDER BY page._page_pos
+    """
+
+
+def _build_merged_search_query(
+    primary_part: str,
+    secondary_part: str,
+    relevance_param_idx: int,
+    limit_param_idx: int,
+) -> str:
+    """
+    Build the single statement for searches with secondary matches.
+
+    Primary matches (view rows) UNION ALL secondary matches (filtered
+    source-table aggregates), ranked by relevance then totaal, paged, counted
+    and summed server-side. Both parts select primary_value, y<year>, totaal,
+    row_count, is_secondary. Same output shape as _build_fused_query.
+
+    Relevance: 1 = exact name, 2 = name contains the term, 3 = other field
+    ($relevance_param_idx: clean search, +1: ILIKE pattern). primary_value
+    breaks ties so OFFSET pages do not overlap.
+    """
+    year_sums = ", ".join(f"SUM(y{y}) AS sum_{y}" for y in YEARS)
+    return f"""
+        WITH filtered AS MATERIALIZED (
+            SELECT m.*,
+                CASE
+                    WHEN UPPER(m.primary_value) = UPPER(${relevance_param_idx}) THEN 1
+                    WHEN m.primary_value ILIKE ${relevance_param_idx + 1} THEN 2
+                    ELSE 3
+                END AS relevance_score
+            FROM ({primary_part}
+                UNION ALL
+                {secondary_part}
+            ) m
+        ),
+        stats AS (
+            SELECT COUNT(*) AS _total_count, {year_sums}, SUM(totaal) AS sum_totaal
+            FROM filtered
+        ),
+        page AS (
+            SELECT *,
+                ROW_NUMBER() OVER (ORDER BY relevance_score ASC, totaal DESC, primary_value) AS _page_pos
+            FROM filtered
+            ORDER BY relevance_score ASC, totaal DESC, primary_value
+            LIMIT ${limit_param_idx} OFFSET ${limit_param_idx + 1}
+        )
+        SELECT stats.*, page.*
+        FROM stats
+        LEFT JOIN page ON TRUE
+        ORDER BY page._page_pos
+    """
+
+
+def _totals_from_row(r: dict) -> dict:
+    """Convert sum_<year>/sum_totaal columns to the API totals dict."""
+    return {
+        "years": {year: int(r.get(f"sum_{year}", 0) or 0) for year in YEARS},
+        "totaal": int(r.get("sum_totaal", 0) or 0),
+    }
+
+
+async def _fetch_fused_or_none(
+    query: str, params: list, label: str,
+) -> tuple[list[dict], int, dict] | None:
+    """
+    Run a fused query. Returns (page_rows, total_count, totals), or None when it
+    fails so the caller can fall back to the three-query plan.
+    """
+    try:
+        result = await fetch_all(query, *params)
+    except Exception as e:
+        logger.warning(f"Fused page query failed for {label}, using three-query plan: {type(e).__name__}: {e}")
+        return None
+    first = result[0]
+    rows = [r for r in result if r["_page_pos"] is not None]
+    return rows, first["_total_count"] or 0, _totals_from_row(first)
+
+
+# =============================================================================
+# Keyset Pagination (cursor)
+# =============================================================================
+# LIMIT/OFFSET reads and discards `offset` rows, so deep pages get slower and
+# are capped at 10,000. A cursor holds the last row's sort value + unique key;
+# the next page is WHERE (sort, key) < (last_sort, last_key), which is an index
+# seek on (sort, key) at any depth (indexes: scripts/sql/078).
+#
+# Supported when browsing (no search) with totaal, year or primary sort.
+# Search results are relevance-ranked and random sort has no stable order.
+# =============================================================================
+
+def _encode_cursor(sort_by: str, sort_order: str, values: list) -> str:
+    """Encode the last row's sort value + key(s) as an opaque URL-safe token."""
+    payload = {"s": sort_by, "o": sort_order, "v": [str(v) for v in values]}
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str, sort_by: str, sort_order: str, numeric_sort: bool, key_count: int) -> list:
+    """
+    Decode a cursor into bind values [sort_value, *keys].
+
+    Raises ValueError when the token is malformed or was issued for a
+    different sort (API maps this to 400).
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        values = payload["v"]
+        if payload["s"] != sort_by or payload["o"] != sort_order:
+            raise ValueError("Cursor does not match sort")
+        if not isinstance(values, list) or len(values) != 1 + key_count:
+            raise ValueError("Cursor has wrong number of values")
+        sort_value = str(values[0])
+        if numeric_sort:
+            # int binds to both integer (record_count) and numeric columns
+            number = Decimal(sort_value)
+            if not number.is_finite():
+                raise ValueError("Cursor sort value is not a number")
+            sort_value = int(number) if number == number.to_integral_value() else number
+        return [sort_value, *(str(v) for v in values[1:])]
+    except ValueError:
+        raise
+    except (TypeError, KeyError, ArithmeticError, binascii.Error) as e:
+        raise ValueError(f"Invalid cursor: {type(e).__name__}")
+
+
+def _keyset_condition(columns: list[str], sort_order: str, param_idx: int) -> str:
+    """Row-value comparison (sort, key...) after the cursor position."""
+    op = "<" if sort_order == "desc" else ">"
+    placeholders = ", ".join(f"${param_idx + i}" for i in range(len(columns)))
+    return f"({', '.join(columns)}) {op} ({placeholders})"
+
+
+def _next_cursor(rows: list[dict], limit: int, sort_by: str, sort_order: str, key_count: int) -> str | None:
+    """Cursor for the page after `rows` (None when this was the last page)."""
+    if len(rows) < limit:
+        return None
+    last = rows[-1]
+    return _encode_cursor(sort_by, sort_order, [last[f"_cursor_{i}"] for i in range(1 + key_count)])
+
+
+# =============================================================================
+# Columnar Engine (optional, COLUMNAR_ENGINE=true)
+# =============================================================================
+# Default browsing (no search, no entity/source filters, no cursor) only needs
+# the numeric columns of the aggregated views. app/services/columnar.py keeps
+# those in NumPy arrays per generation; this section defines what to load and
+# answers table requests from it. Returns None when a table is not loaded, so
+# the caller falls through to the SQL path.
+# =============================================================================
+
+def get_columnar_sources() -> dict[str, ColumnarSource]:
+    """Load queries for the columnar engine: one per module aggregated view."""
+    sources = {}
+    for module, config in MODULE_CONFIG.items():
+        primary = config["primary_field"]
+        key = config["key_field"]
+        view_columns = config.get("view_columns", [])
+        from_clause = _aggregated_view_for(config, has_entity_filter=False)
+        year_cols = ", ".join(f'"{y}"::float8 AS y{y}' for y in YEARS)
+        extra_cols = "".join(
+            f", {col} AS extra_{col}, COALESCE({col}_count, 1) AS extra_{col}_count" for col in view_columns
+        )
+        sources[module] = ColumnarSource(
+            query=f"""
+                SELECT
+                    {key} AS key,
+                    {primary} AS primary_value,
+                    (ROW_NUMBER() OVER (ORDER BY {primary}, {key}) - 1)::int4 AS primary_rank,
+                    {year_cols},
+                    totaal::float8 AS totaal,
+                    row_count::int8 AS row_count,
+                    years_with_data::int4 AS years_with_data,
+                    random_order::float8 AS random_order{extra_cols}
+                FROM {from_clause}
+                ORDER BY {key}
+            """,
+            years=YEARS,
+            view_columns=view_columns,
+        )
+    return sources
+
+
+def _random_threshold(offset: int) -> float | None:
+    """
+    random_order threshold for a random sort: the first page starts at a random
+    point (WHERE random_order > threshold), later pages use OFFSET (None).
+    """
+    if offset != 0:
+        return None
+    return random.random() * 0.9  # 0-0.9 to ensure enough rows after
+
+
+def _sort_year(sort_by: str) -> int | None:
+    """
+    Validate sort_by: "random", "totaal", "primary" or "y<year>".
+
+    Returns the year of a year sort, else None. SECURITY: anything else raises
+    ValueError before it gets near SQL construction.
+    """
+    if sort_by in ("random", "totaal", "primary"):
+        return None
+    if sort_by.startswith("y") and sort_by[1:].isdigit():
+        year_num = int(sort_by[1:])
+        if year_num not in YEARS:
+            raise ValueError("Invalid sort year")
+        return year_num
+    # Reject any other sort_by values (could be SQL injection attempt)
+    raise ValueError(f"Invalid sort_by value: {sort_by}")
+
+
+def _get_from_columnar(
+    module: str,
+    jaar: Optional[int],
+    min_bedrag: Optional[float],
+    max_bedrag: Optional[float],
+    sort_by: str,
+    sort_order: str,
+    limit: int,
+    offset: int,
+    min_years: Optional[int],
+    columns: Optional[list[str]],
+) -> tuple[list[dict], int, dict | None, str | None] | None:
+    """Browse an aggregated view from memory (same results as _get_from_aggregated_view)."""
+    table = get_columnar_table(module)
+    if table is None:
+        return None
+
+    if jaar and jaar not in YEARS:
+        raise ValueError("Invalid year")
+
+    random_threshold = None
+    if sort_by == "random":
+        sort_field = "random_order"
+        random_threshold = _random_threshold(offset)
+    else:
+        _sort_year(sort_by)
+        sort_field = sort_by  # ColumnarTable names: totaal, primary, y2016...
+
+    indices, total, totals = table.query(
+        sort_field=sort_field,
+        descending=sort_order == "desc" and sort_by != "random",
+        limit=limit,
+        offset=offset,
+        jaar=jaar or None,
+        min_bedrag=min_bedrag,
+        max_bedrag=max_bedrag,
+        min_years=min_years,
+        random_threshold=random_threshold,
+        with_totals=bool(jaar or min_bedrag is not None or max_bedrag is not None),
+    )
+    rows = table.rows(indices, columns)
+
+    next_cursor = None
+    if sort_by != "random" and len(rows) == limit:
+        last = int(indices[-1])
+        sort_value = table.primary[last] if sort_by == "primary" else table.sort_values(sort_field)[last]
+        next_cursor = _encode_cursor(sort_by, sort_order, [sort_value, table.keys[last]])
+
+    return rows, total, totals, next_cursor
+
+
 # =============================================================================
 # Aggregation Queries
 # =============================================================================
 
 async def get_module_data(
+    module: str,
+    search: Optional[str] = None,
+    jaar: Optional[int] = None,
+    min_bedrag: Optional[float] = None,
+    max_bedrag: Optional[float] = None,
+    sort_by: str = "totaal",
+    sort_order: str = "desc",
+    limit: int = 25,
+    offset: int = 0,
+    min_years: Optional[int] = None,
+    filter_fields: Optional[dict[str, list[str]]] = None,
+    columns: Optional[list[str]] = None,
+    cursor: Optional[str] = None,
+) -> tuple[list[dict], int, dict | None, str | None]:
+    """
+    Cached entry point for get_module_data (see _get_module_data_uncached).
+
+    Returned rows are shared with the cache and must not be mutated.
+    """
+    if not _is_cacheable(search, sort_by, offset):
+        return await _get_module_data_uncached(
+            module, search, jaar, min_bedrag, max_bedrag, sort_by, sort_order,
+            limit, offset, min_years, filter_fields, columns, cursor,
+        )
+
+    key = (
+        "module", get_data_generation(), module,
+        search.strip() if search is not None else None,
+        jaar, min_bedrag, max_bedrag, sort_by, sort_order, limit, offset, min_years,
+        _normalize_filter_fields(filter_fields),
+        tuple(columns or ()),
+        cursor,
+    )
+    found, cached = _result_cache.get(key)
+    if found:
+        return cached
+
+    async def _load():
+        result = await _get_module_data_uncached(
+            module, search, jaar, min_bedrag, max_bedrag, sort_by, sort_order,
+            limit, offset, min_years, filter_fields, columns, cursor,
+        )
+        _result_cache.set(key, result)
+        return result
+
+    return await _result_flight.do(key, _load)
+
+
+async def _get_module_data_uncached(
     module: str,
     search: Optional[str] = None,
     jaar: Optional[int] = None,
@@ -564,7 +1059,9 @@ async def get_module_data(
     min_years: Optional[int] = None,  # Filter for recipients with data in X+ years
     filter_fields: Optional[dict[str, list[str]]] = None,  # Multi-select filters
     columns: Optional[list[str]] = None,  # Extra columns to return (max 2)
-) -> tuple[list[dict], int, dict | None]:
+    cursor: Optional[str] = None,  # Keyset cursor (replaces offset)
+    export: bool = False,  # Return an ExportPlan instead of executing
+) -> tuple[list[dict], int, dict | None, str | None]:
     """
     Get aggregated data for a module.
 
@@ -577,8 +1074,9 @@ async def get_module_data(
                  Values are fetched from the source table for each aggregated row.
 
     Returns:
-        Tuple of (rows, total_count, totals_dict) where totals_dict contains year sums
-        and grand total (only when searching/filtering, None otherwise).
+        Tuple of (rows, total_count, totals_dict, next_cursor) where totals_dict contains
+        year sums and grand total (only when searching/filtering, None otherwise) and
+        next_cursor is set when keyset pagination applies and more rows follow.
     """
     if module not in MODULE_CONFIG:
         raise ValueError(f"Unknown module: {module}")
@@ -630,8 +1128,32 @@ async def get_module_data(
         and columns_in_view  # Can use view if columns are available or none requested
     )
 
-    if use_aggregated:
-        rows, total, totals = await _get_from_aggregated_view(
+    if export:
+        # Same routing as below, but return the query plan (see get_export_plan)
+        if use_aggregated:
+            return await _get_from_aggregated_view(
+                config=config, search=search, jaar=jaar, min_bedrag=min_bedrag, max_bedrag=max_bedrag,
+                sort_by=sort_by, sort_order=sort_order, min_years=min_years,
+                columns=valid_columns if valid_columns else None,
+                entity_filter=entity_filter_values, export=True,
+            )
+        return await _get_from_source_table(
+            config=config, search=search, jaar=jaar, min_bedrag=min_bedrag, max_bedrag=max_bedrag,
+            sort_by=sort_by, sort_order=sort_order, min_years=min_years,
+            filter_fields=filter_fields, columns=valid_columns, export=True,
+        )
+
+    columnar_result = None
+    if use_aggregated and not search and not entity_filter_values and not cursor:
+        columnar_result = _get_from_columnar(
+            module, jaar, min_bedrag, max_bedrag, sort_by, sort_order,
+            limit, offset, min_years, valid_columns or None,
+        )
+
+    if columnar_result:
+        rows, total, totals, next_cursor = columnar_result
+    elif use_aggregated:
+        rows, total, totals, next_cursor = await _get_from_aggregated_view(
             config=config,
             search=search,
             jaar=jaar,
@@ -644,8 +1166,13 @@ async def get_module_data(
             min_years=min_years,
             columns=valid_columns if valid_columns else None,
             entity_filter=entity_filter_values,  # Pass entity filter for direct view query
+            cursor=cursor,
         )
     else:
+        if cursor:
+            # Source-table aggregation has no stable row key to seek on
+            raise ValueError("Cursor pagination not supported with these filters")
+        next_cursor = None
         rows, total, totals = await _get_from_source_table(
             config=config,
             search=search,
@@ -664,7 +1191,7 @@ async def get_module_data(
     # Inject data availability info (year range per entity/module)
     await _inject_availability(rows, module, config, filter_fields=filter_fields)
 
-    return rows, total, totals
+    return rows, total, totals, next_cursor
 
 
 # Fields with _lower variants in Typesense (for prefix matching)
@@ -694,7 +1221,11 @@ async def _typesense_get_primary_keys_with_highlights(
     primary_field: str,
     search: str,
     limit: int = 1000,
-) -> tuple[list[str], dict[str, tuple[str | None, str | None]]]:
+) -> tuple[
+    list[str],
+    dict[str, tuple[str | None, str | None]],
+    dict[str, tuple[str | None, str | None]],
+]:
     """
     Get matching primary keys AND highlight info from Typesense for hybrid search.
 
@@ -706,13 +1237,16 @@ async def _typesense_get_primary_keys_with_highlights(
 
     Strategy: Search each field individually (like autocomplete does) and
     combine unique primary values. Multi-field query_by can miss results.
+    All per-field searches go out in one /multi_search round trip.
 
     Returns:
-        Tuple of:
+        Tuple of three (primary_keys, matched_info, context_info):
         - list[str]: Primary keys that matched
-        - dict[str, tuple]: Map of primary_key -> (matched_field, matched_value)
-          Initially only includes non-primary field matches from Typesense.
-          Later enriched by _enrich_matched_info() for primary-only matches.
+        - matched_info: Map of primary_key -> (matched_field, matched_value)
+          for keys found ONLY via a non-primary field (secondary matches).
+        - context_info: Same map, for keys found on the primary field that also
+          had a non-primary field hit ("Ook in" context, from the same results).
+          Remaining primary-only matches: see _enrich_matched_info().
 
     Args:
         collection: Typesense collection name
@@ -731,32 +1265,46 @@ async def _typesense_get_primary_keys_with_highlights(
     primary_keys = []
     # Track which field matched for each primary value (only for non-primary fields)
     matched_info: dict[str, tuple[str | None, str | None]] = {}
+    # Non-primary field hits for values already found earlier ("Ook in" context)
+    context_info: dict[str, tuple[str | None, str | None]] = {}
 
-    # Search each field individually (more reliable than multi-field query_by)
+    # Search each field individually (more reliable than multi-field query_by),
+    # batched into a single HTTP request
+    searches = []
     for field in search_fields:
-        if len(primary_keys) >= limit:
-            break
-
         # Build query_by for this field
         query_by = field
         if field in lower_fields:
             query_by = f"{field},{field}_lower"
 
-        params = {
+        searches.append({
+            "collection": collection,
             "q": parsed.raw,
             "query_by": query_by,
             "prefix": "true",
             "per_page": str(min(limit * 5, 250)),  # Get enough per field
             "highlight_full_fields": field,  # Get full field value in highlight
-        }
+        })
+
+    all_data = await typesense_multi_search(searches, operation="search")
 
-        data = await _typesense_search(collection, params)
+    # Combine in field order (primary field first)
+    for field, data in zip(search_fields, all_data):
+        if len(primary_keys) >= limit:
+            break
 
         # Extract primary values from hits
         for hit in data.get("hits", []):
             doc = hit.get("document", {})
             value = doc.get(primary_field)
-            if value and value not in seen:
+            if value and value in seen:
+                # Found before (e.g. on its name): a later field hit is "Ook in" context
+                if field != primary_field and value not in matched_info and value not in context_info:
+                    field_value = doc.get(field)
+                    if field_value and is_word_boundary_match(search, str(field_value)):
+                        context_info[value] = (field, str(field_value))
+                continue
+            if value:
                 # Get the field value that was searched
                 field_value = doc.get(field)
                 if not field_value:
@@ -784,10 +1332,10 @@ async def _typesense_get_primary_keys_with_highlights(
 
     logger.info(
         f"Typesense search '{search}' in {collection}: found {len(primary_keys)} unique {primary_field}s, "
-        f"{len(matched_info)} with non-primary field matches"
+        f"{len(matched_info)} with non-primary field matches, {len(context_info)} with context"
     )
 
-    return primary_keys, matched_info
+    return primary_keys, matched_info, context_info
 
 
 async def _enrich_matched_info(
@@ -805,10 +1353,14 @@ async def _enrich_matched_info(
     After Typesense search, some rows only have a primary field match (their
     ontvanger name contains the search term). But their secondary fields
     (regeling, omschrijving, etc.) may ALSO contain the search term.
-    This SQL query finds those secondary matches.
+    Typesense hits already cover part of these (context_info); the rest is
+    looked up in search_match_context (081): one row per distinct
+    (primary value, field, value), so one indexed query instead of a regex
+    CASE ladder over every source row per recipient.
 
     Only enriches rows that don't already have matched_info (i.e., rows
-    where Typesense recorded a primary-only match).
+    where Typesense recorded a primary-only match). Runs in parallel with
+    the page queries; mutates and returns matched_info.
     """
     if not primary_keys or not search:
         return matched_info
@@ -818,44 +1370,29 @@ async def _enrich_matched_info(
     if not unenriched:
         return matched_info  # All rows already have secondary match info
 
-    # Secondary fields only (exclude primary)
+    # Secondary fields only (exclude primary), in priority order
     other_fields = [f for f in search_fields if f != primary_field]
     if not other_fields:
         return matched_info  # No secondary fields to check
 
-    # Build CASE expressions: find first matching secondary field
-    _, pattern = build_search_condition(other_fields[0], 1, search)
-
-    case_field = "CASE\n"
-    case_value = "CASE\n"
-    for field in other_fields:
-        case_field += f"            WHEN {field} ~* $1 THEN '{field}'\n"
-        case_value += f"            WHEN {field} ~* $1 THEN {field}\n"
-    case_field += "            ELSE NULL\n        END"
-    case_value += "            ELSE NULL\n        END"
-
-    or_conditions = " OR ".join([f"{f} ~* $1" for f in other_fields])
+    _, pattern = build_search_condition("value", 1, search)
 
+    # First matching field per key, in search_fields order
     query = f"""
-        WITH primary_list AS (
-            SELECT unnest($2::text[]) AS pv
-        )
-        SELECT
-            pl.pv AS key,
-            {case_field} AS matched_field,
-            {case_value} AS matched_value
-        FROM primary_list pl
-        CROSS JOIN LATERAL (
-            SELECT *
-            FROM {table}
-            WHERE {primary_field} = pl.pv
-              AND ({or_conditions})
-            LIMIT 1
-        ) t
+        SELECT DISTINCT ON (primary_value)
+            primary_value AS key,
+            field AS matched_field,
+            value AS matched_value
+        FROM search_match_context
+        WHERE module = $2
+          AND primary_value = ANY($3::text[])
+          AND field = ANY($4::text[])
+          AND {word_match_sql(["value"], 1, 5)}
+        ORDER BY primary_value, array_position($4::text[], field)
     """
 
     try:
-        rows = await fetch_all(query, pattern, unenriched)
+        rows = await fetch_all(query, pattern, table, unenriched, other_fields, build_search_prefilter(search))
         enriched_count = 0
         for row in rows:
             key = row["key"]
@@ -895,7 +1432,7 @@ async def _typesense_search_recipient_keys(
         "per_page": str(min(limit * 5, 250)),
     }
 
-    data = await _typesense_search("recipients", params)
+    data = await typesense_search("recipients", params, operation="search")
 
     keys = []
     for hit in data.get("hits", []):
@@ -914,6 +1451,20 @@ async def _typesense_search_recipient_keys(
     return keys
 
 
+def _aggregated_view_for(config: dict, has_entity_filter: bool) -> str:
+    """
+    Aggregated view to query for a module.
+
+    Entity-level modules (028): aggregated_table has one row per (recipient,
+    entity). The default view (no entity filter) reads the recipient-level
+    rollup instead (079), which has the same columns as the other module
+    views; with an entity filter the per-entity view is queried directly.
+    """
+    if config.get("entity_field") and not has_entity_filter:
+        return config["recipient_table"]
+    return config["aggregated_table"]
+
+
 async def _get_from_aggregated_view(
     config: dict,
     search: Optional[str] = None,
@@ -927,65 +1478,45 @@ async def _get_from_aggregated_view(
     min_years: Optional[int] = None,
     columns: Optional[list[str]] = None,  # Extra columns available in view
     entity_filter: Optional[list[str]] = None,  # Entity filter values (028)
-) -> tuple[list[dict], int, dict | None]:
-    """Fast path: query pre-computed materialized view. Returns (rows, total_count, totals_dict)."""
-    agg_table = config["aggregated_table"]
+    cursor: Optional[str] = None,  # Keyset cursor (replaces offset)
+    export: bool = False,  # Return an ExportPlan instead of executing
+) -> tuple[list[dict], int, dict | None, str | None]:
+    """
+    Fast path: query pre-computed materialized view.
+
+    Returns (rows, total_count, totals_dict, next_cursor).
+    With export=True returns the unpaginated query as ExportPlan (None when the
+    result needs the in-memory primary/secondary merge).
+    """
     primary = config["primary_field"]
     entity_field = config.get("entity_field")
     has_entity_filter = bool(entity_filter and entity_field)
 
-    # Entity-level modules (028): views are grouped by (recipient, entity).
-    # Default view (no entity filter): wrap with GROUP BY to aggregate per-recipient.
-    # Filtered view (entity filter active): query view directly with WHERE.
-    needs_entity_groupby = bool(entity_field and not has_entity_filter)
-
-    # Build the FROM clause: subquery for entity default view, direct table otherwise
-    if needs_entity_groupby:
-        # Default view: aggregate per-entity rows back to per-recipient
-        year_sum_cols = ", ".join([f'SUM("{y}") AS "{y}"' for y in YEARS])
-        years_with_data_expr = " + ".join([
-            f'CASE WHEN SUM("{y}") > 0 THEN 1 ELSE 0 END' for y in YEARS
-        ])
+    # Unique row key: recipient key, plus entity when the per-entity view is queried directly
+    key_columns = [config["key_field"]] + ([entity_field] if has_entity_filter else [])
 
-        # Build extra column aggregations for the subquery
-        view_cols = config.get("view_columns", [])
-        extra_agg_parts = []
-        for vc in view_cols:
-            if vc == entity_field:
-                extra_agg_parts.append(f"MODE() WITHIN GROUP (ORDER BY {vc}) AS {vc}")
-                extra_agg_parts.append(f"COUNT(DISTINCT {vc}) AS {vc}_count")
-            else:
-                extra_agg_parts.append(f"MODE() WITHIN GROUP (ORDER BY {vc}) AS {vc}")
-                extra_agg_parts.append(f"MAX({vc}_count) AS {vc}_count")
-        extra_agg_sql = ", " + ", ".join(extra_agg_parts) if extra_agg_parts else ""
-
-        from_clause = f"""(
-            SELECT ontvanger_key, MIN({primary}) AS {primary},
-                {year_sum_cols},
-                SUM(totaal) AS totaal,
-                SUM(row_count) AS row_count{extra_agg_sql},
-                ({years_with_data_expr}) AS years_with_data,
-                MIN(random_order) AS random_order
-            FROM {agg_table}
-            GROUP BY ontvanger_key
-        ) AS {agg_table}"""
-    else:
-        from_clause = agg_table
+    # Entity-level modules (028): views are grouped by (recipient, entity).
+    # Default view (no entity filter): recipient-level rollup view (079).
+    # Filtered view (entity filter active): query per-entity view directly with WHERE.
+    from_clause = _aggregated_view_for(config, has_entity_filter)
 
     # Build extra columns selection if columns are requested and available in view
     # Also select count columns for "+X meer" indicator (column_count columns in view)
     extra_columns_select = ""
+    extra_source_columns: list[str] = []  # View columns read by extra_columns_select
     if columns and not search:
         # Only include static columns when NOT searching (search uses matched_field instead)
         value_parts = []
         count_parts = []
         for col in columns:
             value_parts.append(f"{col} AS extra_{col}")
+            extra_source_columns.append(col)
             if has_entity_filter and col == entity_field:
                 # Entity field with active filter: each row IS one entity, count = 1
                 count_parts.append(f"1 AS extra_{col}_count")
             else:
                 count_parts.append(f"COALESCE({col}_count, 1) AS extra_{col}_count")
+                extra_source_columns.append(f"{col}_count")
         extra_columns_select = ", " + ", ".join(value_parts) + ", " + ", ".join(count_parts)
 
     # Build WHERE clause
@@ -1009,25 +1540,55 @@ async def _get_from_aggregated_view(
     primary_only_keys: list[str] = []
     secondary_only_keys: list[str] = []
     using_regex_fallback = False
+
+    # Search session: a later page of the same search skips Typesense, the
+    # secondary aggregation, enrichment, COUNT and totals
+    session: SearchSession | None = None
+    session_key = None
+    if search and not export:
+        session_key = _search_session_key(
+            config["table"], search, jaar, min_bedrag, max_bedrag, min_years,
+            entity_filter if has_entity_filter else None,
+        )
+        _, session = _search_sessions.get(session_key)
+        if session is not None and session.merged is not None:
+            # Merged primary + secondary rows are complete: the page is a slice
+            # (copied: callers add fields to returned rows)
+            page = [dict(r) for r in session.merged[offset:offset + limit]]
+            return page, session.total, session.totals, None
+
     if search:
         # Get Typesense collection for this module
         collection = TYPESENSE_COLLECTIONS.get(config["table"])
         if collection:
-            # Get matching primary keys AND highlight info from Typesense (fast)
-            # Searchable fields are defined in TYPESENSE_SEARCHABLE_FIELDS
-            typesense_primary_keys, typesense_matched_info = await _typesense_get_primary_keys_with_highlights(
-                collection=collection,
-                primary_field=primary,
-                search=search,
-                limit=1000,  # Get more than needed for accurate count
-            )
+            if session is not None:
+                typesense_primary_keys = session.typesense_keys
+                typesense_matched_info = session.matched_info
+            else:
+                # Get matching primary keys AND highlight info from Typesense (fast)
+                # Searchable fields are defined in TYPESENSE_SEARCHABLE_FIELDS
+                (
+                    typesense_primary_keys, typesense_matched_info, typesense_context_info,
+                ) = await _typesense_get_primary_keys_with_highlights(
+                    collection=collection,
+                    primary_field=primary,
+                    search=search,
+                    limit=1000,  # Get more than needed for accurate count
+                )
 
             if typesense_primary_keys:
                 # Split: primary matches use aggregated view, secondary matches use source table
                 # Primary matches = name contains search term → full aggregated totals are correct
                 # Secondary matches = regeling/artikel/etc. contains search term → need filtered amounts
-                primary_only_keys = [k for k in typesense_primary_keys if k not in typesense_matched_info]
-                secondary_only_keys = [k for k in typesense_primary_keys if k in typesense_matched_info]
+                if session is not None:
+                    # Session matched_info is enriched, so the split cannot be recomputed from it
+                    primary_only_keys = session.primary_only_keys
+                    secondary_only_keys = session.secondary_only_keys
+                else:
+                    primary_only_keys = [k for k in typesense_primary_keys if k not in typesense_matched_info]
+                    secondary_only_keys = [k for k in typesense_primary_keys if k in typesense_matched_info]
+                    # "Ook in" context Typesense already returned for name matches
+                    typesense_matched_info.update(typesense_context_info)
 
                 if primary_only_keys:
                     # Use IN clause with array for primary matches (aggregated view)
@@ -1054,17 +1615,17 @@ async def _get_from_aggregated_view(
                 logger.info(f"Typesense returned 0 results for '{search}', falling back to regex on {primary}")
                 using_regex_fallback = True
                 _, pattern = build_search_condition(primary, param_idx, search)
-                where_clauses.append(f"{primary} ~* ${param_idx}")
-                params.append(pattern)
-                param_idx += 1
+                where_clauses.append(f"({word_match_sql([primary], param_idx, param_idx + 1)})")
+                params.extend([pattern, build_search_prefilter(search)])
+                param_idx += 2
         else:
             # Fallback: regex search if Typesense collection not mapped
             # Only search primary field for simplicity and reliability
             using_regex_fallback = True
             _, pattern = build_search_condition(primary, param_idx, search)
-            where_clauses.append(f"{primary} ~* ${param_idx}")
-            params.append(pattern)
-            param_idx += 1
+            where_clauses.append(f"({word_match_sql([primary], param_idx, param_idx + 1)})")
+            params.extend([pattern, build_search_prefilter(search)])
+            param_idx += 2
 
     # Year filter: show recipients who have data in that year
     # (still shows all years in response, but filters to active recipients)
@@ -1110,6 +1671,12 @@ async def _get_from_aggregated_view(
     # IMPORTANT: When searching, ALWAYS use relevance ranking (ignore random sort)
     use_random_threshold = False
     relevance_select = ""
+    relevance_column = ""
+    cursor_select = ""
+    keyset_columns: list[str] = []
+    keyset_clause = None
+    if cursor and (search or sort_by == "random"):
+        raise ValueError("Cursor pagination not supported for search or random sort")
     if search:
         # When searching: 3-tier relevance ranking
         # 1. Exact match on name → score 1
@@ -1120,12 +1687,13 @@ async def _get_from_aggregated_view(
         parsed_rel = parse_search_query(search)
         clean_search = parsed_rel.raw
         ilike_search = clean_search.replace('%', r'\%').replace('_', r'\_')
-        relevance_select = f""",
+        relevance_column = f"""
             CASE
                 WHEN UPPER({primary}) = UPPER(${param_idx}) THEN 1
                 WHEN {primary} ILIKE ${param_idx + 1} THEN 2
                 ELSE 3
             END AS relevance_score"""
+        relevance_select = f",{relevance_column}"
         params.append(clean_search)
         params.append(f"%{ilike_search}%")
         param_idx += 2
@@ -1134,33 +1702,46 @@ async def _get_from_aggregated_view(
         sort_clause = "ORDER BY random_order"
         # For random sort on first page: use WHERE random_order > threshold
         # This is faster than OFFSET because it uses the index directly
-        if offset == 0:
+        random_threshold = _random_threshold(offset)
+        if random_threshold is not None:
             use_random_threshold = True
-            random_threshold = random.random() * 0.9  # 0-0.9 to ensure enough rows after
             where_clauses.append(f"random_order > ${param_idx}")
             params.append(random_threshold)
             param_idx += 1
     else:
         # SECURITY: Validate sort_by against allowed values before SQL construction
+        year_num = _sort_year(sort_by)
         sort_field = "totaal"
         if sort_by == "primary":
             sort_field = primary
-        elif sort_by.startswith("y") and sort_by[1:].isdigit():
-            year_num = int(sort_by[1:])
-            if year_num not in YEARS:
-                raise ValueError("Invalid sort year")
+        elif year_num is not None:
             sort_field = f'"{year_num}"'
-        elif sort_by not in ["totaal", "primary", "random"]:
-            # Reject any other sort_by values (could be SQL injection attempt)
-            raise ValueError(f"Invalid sort_by value: {sort_by}")
         sort_direction = "DESC" if sort_order == "desc" else "ASC"
-        sort_clause = f"ORDER BY {sort_field} {sort_direction} NULLS LAST"
 
-    # Rebuild where_sql after potential random_order addition
+        # Keyset pagination: the unique key breaks ties, giving a total order that
+        # a (sort, key) index serves directly. View sort columns are never NULL
+        # (COALESCE'd in the views), so NULLS LAST is not needed here.
+        keyset_columns = [sort_field] + key_columns
+        sort_clause = "ORDER BY " + ", ".join(f"{c} {sort_direction}" for c in keyset_columns)
+        cursor_select = ", " + ", ".join(f"{c} AS _cursor_{i}" for i, c in enumerate(keyset_columns))
+        if cursor:
+            cursor_values = _decode_cursor(
+                cursor, sort_by, sort_order,
+                numeric_sort=sort_by != "primary", key_count=len(key_columns),
+            )
+            keyset_clause = _keyset_condition(keyset_columns, sort_order, param_idx)
+            where_clauses.append(keyset_clause)
+            params.extend(cursor_values)
+            param_idx += len(cursor_values)
+            offset = 0
+
+    # Rebuild where_sql after potential random_order/keyset addition
     where_sql = f"WHERE {' AND '.join(where_clauses)}" if where_clauses else ""
 
     # Count query uses only WHERE clause params (snapshot taken before relevance/random params added)
-    count_where = [c for c in where_clauses if "random_order" not in c]
+    # Page-only conditions (random threshold, cursor position) must not affect count/totals
+    page_only = [c for c in where_clauses if "random_order" in c or c == keyset_clause]
+    count_where = [c for c in where_clauses if c not in page_only]
     count_where_sql = f"WHERE {' AND '.join(count_where)}" if count_where else ""
     count_params = count_params_snapshot
 
@@ -1168,35 +1749,61 @@ async def _get_from_aggregated_view(
     # Otherwise, use SQL LIMIT/OFFSET as before for performance.
     needs_python_pagination = bool(secondary_only_keys)
 
-    # Main query from aggregated view (or subquery for entity default view)
-    if needs_python_pagination:
-        # Fetch all primary matches (no SQL pagination — merge + paginate in Python)
-        query = f"""
-            SELECT
+    select_sql = f"""
                 {primary} AS primary_value,
                 "2016" AS y2016, "2017" AS y2017, "2018" AS y2018,
                 "2019" AS y2019, "2020" AS y2020, "2021" AS y2021,
                 "2022" AS y2022, "2023" AS y2023, "2024" AS y2024,
                 totaal,
-                row_count{extra_columns_select}{relevance_select}
+                row_count{extra_columns_select}{relevance_select}{cursor_select}"""
+
+    if export:
+        # Secondary matches are merged in Python (bounded by the Typesense key limit)
+        if needs_python_pagination or not (primary_only_keys or not search or using_regex_fallback):
+            return None
+        return ExportPlan(
+            primary_field=primary,
+            extra_columns=[(col, f"extra_{col}") for col in (columns or []) if not search],
+            query=f"SELECT{select_sql} FROM {from_clause} {where_sql} {sort_clause}",
+            params=list(params),
+        )
+
+    # Main query from aggregated view (or subquery for entity default view)
+    fused_query = None
+    if needs_python_pagination:
+        # Fetch all primary matches (no SQL pagination — merge + paginate in Python)
+        query = f"""
+            SELECT{select_sql}
             FROM {from_clause}
             {where_sql}
             {sort_clause}
         """
     else:
         query = f"""
-            SELECT
-                {primary} AS primary_value,
-                "2016" AS y2016, "2017" AS y2017, "2018" AS y2018,
-                "2019" AS y2019, "2020" AS y2020, "2021" AS y2021,
-                "2022" AS y2022, "2023" AS y2023, "2024" AS y2024,
-                totaal,
-                row_count{extra_columns_select}{relevance_select}
+            SELECT{select_sql}
             FROM {from_clause}
             {where_sql}
             {sort_clause}
             LIMIT ${param_idx} OFFSET ${param_idx + 1}
         """
+        # Columns of select_sql, the sort, the page-only conditions and the totals
+        filtered_columns = list(dict.fromkeys([
+            primary, *(f'"{y}"' for y in YEARS), "totaal", "row_count",
+            *key_columns, *extra_source_columns,
+        ]))
+        if sort_by == "random" and not search:
+            filtered_columns.append("random_order")
+        if relevance_column:
+            filtered_columns.append(relevance_column)
+        fused_query = _build_fused_query(
+            select_sql=select_sql,
+            filtered_columns=filtered_columns,
+            from_clause=from_clause,
+            where_sql=count_where_sql,
+            page_where_sql=f"WHERE {' AND '.join(page_only)}" if page_only else "",
+            sort_clause=sort_clause,
+            limit_param_idx=param_idx,
+        )
         params.extend([limit, offset])
 
     # Count query (without random threshold for accurate total)
@@ -1221,7 +1828,10 @@ async def _get_from_aggregated_view(
     # reflect rows where the search term actually appears.
     # This runs in PARALLEL with the aggregated view query for primary matches.
     # ==========================================================================
-    secondary_query_coro = None
+    sec_query = None
+    sec_params: list = []
+    merged_query = None
+    merged_params: list = []
     if secondary_only_keys and search:
         table = config["table"]
         year_field = config["year_field"]
@@ -1232,27 +1842,70 @@ async def _get_from_aggregated_view(
         other_fields = [f for f in search_fields if f != primary]
 
         if other_fields:
-            # Build search condition
             _, sec_pattern = build_search_condition(other_fields[0], 2, search)
-            sec_search_conditions = " OR ".join([f"{f} ~* $2" for f in other_fields])
+            sec_params = [secondary_only_keys, sec_pattern, build_search_prefilter(search)]
 
             sec_year_columns = ", ".join([
                 f"COALESCE(SUM(CASE WHEN {year_field} = {year} THEN {amount_field} END), 0) * {multiplier} AS \"y{year}\""
                 for year in YEARS
             ])
 
-            sec_query = f"""
+            def secondary_sql(base_idx: int) -> str:
+                """Source-table aggregate of secondary matches ($base: keys, +1: regex, +2: ILIKE)."""
+                return f"""
                 SELECT
                     {primary} AS primary_value,
                     {sec_year_columns},
                     COALESCE(SUM(CASE WHEN {year_field} BETWEEN {YEARS[0]} AND {YEARS[-1]} THEN {amount_field} END), 0) * {multiplier} AS totaal,
                     COUNT(*) AS row_count
                 FROM {table}
-                WHERE {primary} = ANY($1)
-                  AND ({sec_search_conditions})
+                WHERE {primary} = ANY(${base_idx})
+                  AND ({word_match_sql(other_fields, base_idx + 1, base_idx + 2)})
                 GROUP BY {primary}
             """
-            secondary_query_coro = fetch_all(sec_query, secondary_only_keys, sec_pattern)
+
+            sec_query = secondary_sql(1)
+
+            if get_settings().fused_page_query:
+                # Merged plan: primary view rows UNION ALL filtered secondary aggregates,
+                # ranked, paged, counted and summed in one statement.
+                # count_where_sql params are $1..$n, relevance params follow (see above).
+                # Without primary matches the primary part is kept with FALSE: its
+                # filter params stay referenced, the planner drops the scan.
+                primary_where = count_where + ([] if primary_only_keys else ["FALSE"])
+                primary_part = f"""
+                SELECT
+                    {primary} AS primary_value,
+                    {", ".join(f'"{y}" AS y{y}' for y in YEARS)},
+                    totaal, row_count, FALSE AS is_secondary
+                FROM {from_clause}
+                WHERE {' AND '.join(primary_where)}"""
+
+                merged_params = list(params)
+                next_idx = len(merged_params) + 1
+                merged_params.extend(sec_params)
+                # Same filters the primary part applies in SQL (jaar validated above)
+                sec_filters = []
+                if jaar:
+                    sec_filters.append(f"y{jaar} > 0")
+                if min_bedrag is not None:
+                    merged_params.append(min_bedrag)
+                    sec_filters.append(f"totaal >= ${len(merged_params)}")
+                if max_bedrag is not None:
+                    merged_params.append(max_bedrag)
+                    sec_filters.append(f"totaal <= ${len(merged_params)}")
+                secondary_part = f"""
+                SELECT s.*, TRUE AS is_secondary
+                FROM ({secondary_sql(next_idx)}) s
+                {"WHERE " + " AND ".join(sec_filters) if sec_filters else ""}"""
+
+                merged_query = _build_merged_search_query(
+                    primary_part=primary_part,
+                    secondary_part=secondary_part,
+                    relevance_param_idx=len(count_params_snapshot) + 1,
+                    limit_param_idx=len(merged_params) + 1,
+                )
+                merged_params.extend([limit, offset])
 
     # Execute queries in PARALLEL for performance (750ms → ~250ms)
     # Previously sequential: rows, then count, then totals = 3x latency
@@ -1266,24 +1919,63 @@ async def _get_from_aggregated_view(
         coros = []
         coro_labels = []
 
-        if has_primary_query:
-            coros.append(fetch_all(query, *params))
-            coro_labels.append("primary")
-            coros.append(fetch_val(count_query, *count_params) if count_params else fetch_val(count_query))
-            coro_labels.append("count")
-
         # Add totals query only when user actively searches/filters (not min_years alone)
         run_totals = bool(search or jaar or min_bedrag is not None or max_bedrag is not None or has_entity_filter)
-        if run_totals and has_primary_query:
-            coros.append(
-                fetch_all(totals_query, *count_params) if count_params else fetch_all(totals_query)
+
+        # Enrich "Ook in" column: for rows that matched on primary field (name),
+        # check if secondary fields also contain the search term (match context).
+        # Independent of the page queries, so it runs alongside them.
+        # Session hits already carry the enriched matched_info.
+        needs_enrich = bool(search and session is None and typesense_primary_keys)
+
+        def enrich_coro():
+            return _enrich_matched_info(
+                table=config["table"],
+                primary_field=primary,
+                search_fields=config.get("search_fields", [primary]),
+                primary_keys=typesense_primary_keys,
+                matched_info=typesense_matched_info,
+                search=search,
             )
-            coro_labels.append("totals")
 
-        # Add secondary query if we have secondary matches
-        if secondary_query_coro:
-            coros.append(secondary_query_coro)
-            coro_labels.append("secondary")
+        # Secondary matches: merge + rank + page + count + totals in one statement
+        # (falls back to the Python merge below when it fails)
+        merged_result = None
+        if merged_query:
+            merged_coros = [_fetch_fused_or_none(merged_query, merged_params, config["table"])]
+            if needs_enrich:
+                merged_coros.append(enrich_coro())
+                needs_enrich = False
+            merged_result = (await asyncio.gather(*merged_coros))[0]
+
+        # Filtered view with SQL pagination: page + count + totals in one scan
+        # Search session hit: count and totals are known, only the page is queried
+        fused_result = None
+        if session is None and run_totals and has_primary_query and fused_query and get_settings().fused_page_query:
+            fused_result = await _fetch_fused_or_none(fused_query, params, config["table"])
+
+        if not merged_result:
+            if has_primary_query and not fused_result:
+                coros.append(fetch_all(query, *params))
+                coro_labels.append("primary")
+                # The Python merge needs the primary count/totals, session or not
+                if session is None or needs_python_pagination:
+                    coros.append(fetch_val(count_query, *count_params) if count_params else fetch_val(count_query))
+                    coro_labels.append("count")
+                    if run_totals:
+                        coros.append(
+                            fetch_all(totals_query, *count_params) if count_params else fetch_all(totals_query)
+                        )
+                        coro_labels.append("totals")
+
+            # Add secondary query if we have secondary matches
+            if sec_query:
+                coros.append(fetch_all(sec_query, *sec_params))
+                coro_labels.append("secondary")
+
+        if needs_enrich:
+            coros.append(enrich_coro())
+            coro_labels.append("enrich")
 
         # Run all queries in parallel
         results = await asyncio.gather(*coros)
@@ -1297,16 +1989,11 @@ async def _get_from_aggregated_view(
 
         # Extract totals from primary query (we'll recompute after merge if needed)
         totals = None
-        if "totals" in result_map:
+        if fused_result:
+            primary_rows, primary_count, primary_totals = fused_result
+        elif "totals" in result_map:
             totals_row = result_map["totals"]
-            if totals_row:
-                r = totals_row[0]
-                primary_totals = {
-                    "years": {year: int(r.get(f"sum_{year}", 0) or 0) for year in YEARS},
-                    "totaal": int(r.get("sum_totaal", 0) or 0),
-                }
-            else:
-                primary_totals = None
+            primary_totals = _totals_from_row(totals_row[0]) if totals_row else None
         else:
             primary_totals = None
 
@@ -1315,19 +2002,6 @@ async def _get_from_aggregated_view(
         logger.error(f"Query failed for {module}: {type(e).__name__}: {e}", exc_info=True)
         raise
 
-    # Enrich "Ook in" column: for rows that matched on primary field (name),
-    # check if secondary fields also contain the search term (SQL enrichment).
-    # This fills in context for rows that Typesense only found via primary match.
-    if search and typesense_primary_keys and typesense_matched_info is not None:
-        typesense_matched_info = await _enrich_matched_info(
-            table=config["table"],
-            primary_field=primary,
-            search_fields=config.get("search_fields", [primary]),
-            primary_keys=typesense_primary_keys,
-            matched_info=typesense_matched_info,
-            search=search,
-        )
-
     # ==========================================================================
     # MERGE primary + secondary results
     # ==========================================================================
@@ -1379,8 +2053,14 @@ async def _get_from_aggregated_view(
     if secondary_result and max_bedrag is not None:
         secondary_result = [r for r in secondary_result if r["totaal"] <= max_bedrag]
 
-    if secondary_result:
-        # Merge: primary results first, then secondary results
+    merged = None
+    if merged_result:
+        # Merged, ranked, paged, counted and summed in SQL (_build_merged_search_query)
+        merged_rows, total, totals = merged_result
+        result = [transform_row(row, is_secondary=row["is_secondary"]) for row in merged_rows]
+    elif needs_python_pagination:
+        # Fallback: merge in Python. Primary results first, then secondary results
+        # (also when filters removed every secondary row: primary rows are unpaginated)
         result.extend(secondary_result)
 
         # Compute relevance scores for sorting the merged set
@@ -1424,13 +2104,31 @@ async def _get_from_aggregated_view(
             }
 
         # Apply pagination in Python (both queries returned full sets)
-        result = result[offset:offset + limit]
+        merged = result
+        result = [dict(r) for r in merged[offset:offset + limit]]
+    elif session is not None:
+        # Page query only; count and totals from the search session
+        total = session.total
+        totals = session.totals
     else:
         # No secondary matches — use primary results as-is (already paginated by SQL)
         total = primary_count or 0
         totals = primary_totals
 
-    return result, total or 0, totals
+    if session_key is not None and session is None:
+        _search_sessions.set(session_key, SearchSession(
+            typesense_keys=typesense_primary_keys,
+            primary_only_keys=primary_only_keys,
+            secondary_only_keys=secondary_only_keys,
+            matched_info=typesense_matched_info,
+            total=total or 0,
+            totals=totals,
+            merged=merged,
+        ))
+
+    next_cursor = _next_cursor(primary_rows, limit, sort_by, sort_order, len(key_columns)) if keyset_columns else None
+
+    return result, total or 0, totals, next_cursor
 
 
 async def _get_from_source_table(
@@ -1446,8 +2144,14 @@ async def _get_from_source_table(
     min_years: Optional[int] = None,
     filter_fields: Optional[dict[str, list[str]]] = None,  # Multi-select filters
     columns: Optional[list[str]] = None,  # Extra columns to return
+    export: bool = False,  # Return an ExportPlan instead of executing
 ) -> tuple[list[dict], int, dict | None]:
-    """Slow path: aggregate from source table (needed for filter fields and extra columns). Returns (rows, total_count, totals_dict)."""
+    """
+    Slow path: aggregate from source table (needed for filter fields and extra columns).
+
+    Returns (rows, total_count, totals_dict), or the unpaginated query as
+    ExportPlan when export=True.
+    """
     table = config["table"]
     primary = config["primary_field"]
     year_field = config["year_field"]
@@ -1490,29 +2194,15 @@ async def _get_from_source_table(
     params = []
     param_idx = 1
 
-    # Track search info for matched_field/matched_value detection
-    search_pattern = None
-    search_operator = None
-
     # Search filter on multiple fields
     # Uses Dutch language rules to avoid false cognates (e.g., politie/politiek)
+    # ILIKE prefilter per field uses the trigram indexes, regex rechecks word boundaries
     if search:
-        condition, pattern = build_search_condition(search_fields[0], param_idx, search)
-        search_pattern = pattern
-        # Apply same condition type to all search fields
-        if "~*" in condition:
-            search_operator = "~*"
-            search_conditions = " OR ".join([
-                f"{field} ~* ${param_idx}" for field in search_fields
-            ])
-        else:
-            search_operator = "ILIKE"
-            search_conditions = " OR ".join([
-                f"{field} ILIKE ${param_idx}" for field in search_fields
-            ])
+        _, pattern = build_search_condition(search_fields[0], param_idx, search)
+        search_conditions = word_match_sql(search_fields, param_idx, param_idx + 1)
         where_clauses.append(f"({search_conditions})")
-        params.append(pattern)
-        param_idx += 1
+        params.extend([pattern, build_search_prefilter(search)])
+        param_idx += 2
 
         # Build matched field detection SQL for search results
         # This finds which field matched and what value it had
@@ -1521,7 +2211,7 @@ async def _get_from_source_table(
         for field in search_fields:
             if field != primary:  # Skip primary field - we already show that
                 matched_field_cases.append(
-                    f"MAX(CASE WHEN {field} {search_operator} $1 THEN {field} END) AS matched_{field}"
+                    f"MAX(CASE WHEN {field} ~* $1 THEN {field} END) AS matched_{field}"
                 )
         if matched_field_cases:
             matched_field_sql = ", " + ", ".join(matched_field_cases)
@@ -1616,7 +2306,7 @@ async def _get_from_source_table(
         sort_clause = f"ORDER BY {sort_field} {sort_direction} NULLS LAST"
 
     # Main query with aggregation
-    query = f"""
+    unpaginated_query = f"""
         SELECT
             {primary} AS primary_value,
             {year_columns},
@@ -1627,6 +2317,16 @@ async def _get_from_source_table(
         GROUP BY {primary}
         {having_sql}
         {sort_clause}
+    """
+    if export:
+        return ExportPlan(
+            primary_field=primary,
+            extra_columns=[(col, f"extra_{col}") for col in (columns or []) if not search],
+            query=unpaginated_query,
+            params=list(params),
+        )
+
+    query = f"""{unpaginated_query}
         LIMIT ${param_idx} OFFSET ${param_idx + 1}
     """
     params.extend([limit, offset])
@@ -1725,6 +2425,61 @@ async def _get_from_source_table(
     return result, total or 0, totals
 
 
+# =============================================================================
+# Recipient Keys
+# =============================================================================
+# Detail lookups match the stored key columns (082: source tables, 009/079:
+# aggregated views) against a key computed in Python, bound as a plain
+# equality parameter. normalize_recipient_python() must produce exactly what
+# the database function stored, so that is checked once per process against a
+# sample of names; on any difference the key is normalized in SQL instead
+# (normalize_recipient($n), evaluated once per parameter, not per row).
+
+_RECIPIENT_KEY_SAMPLES = [
+    "ProRail B.V.",
+    "Prorail BV",
+    "N.V. Nederlandse Spoorwegen",
+    "NEDERLANDSE SPOORWEGEN N.V.",
+    "  Stichting   Het Utrechts Landschap. ",
+    "Gemeente 's-Hertogenbosch",
+    "Provincie Noord-Holland",
+    "Sociale Verzekeringsbank",
+    "Straße & Zoon nv",
+    "Ærø Café",
+]
+
+_recipient_key_parity: Optional[bool] = None
+
+
+async def _python_recipient_keys() -> bool:
+    """True when normalize_recipient_python() matches the database function."""
+    global _recipient_key_parity
+    if _recipient_key_parity is None:
+        try:
+            db_keys = await fetch_val(
+                "SELECT array_agg(normalize_recipient(v) ORDER BY i) "
+                "FROM unnest($1::text[]) WITH ORDINALITY AS s(v, i)",
+                _RECIPIENT_KEY_SAMPLES,
+            )
+        except Exception as e:
+            # Not cached: check again on the next lookup
+            logger.warning(f"Recipient key parity check failed: {type(e).__name__}: {e}")
+            return False
+        _recipient_key_parity = list(db_keys or []) == [
+            normalize_recipient_python(name) for name in _RECIPIENT_KEY_SAMPLES
+        ]
+        if not _recipient_key_parity:
+            logger.warning("normalize_recipient_python() differs from normalize_recipient(), keys are normalized in SQL")
+    return _recipient_key_parity
+
+
+async def _recipient_key_param(value: str, param_idx: int) -> tuple[str, str]:
+    """(SQL expression, bound value) for comparing a stored key column with value."""
+    if await _python_recipient_keys():
+        return f"${param_idx}", normalize_recipient_python(value)
+    return f"normalize_recipient(${param_idx})", value
+
+
 async def get_row_details(
     module: str,
     primary_value: str,
@@ -1748,106 +2503,133 @@ async def get_row_details(
 
     config = MODULE_CONFIG[module]
     table = config["table"]
-    primary = config["primary_field"]
-    year_field = config["year_field"]
     amount_field = config["amount_field"]
     multiplier = config.get("amount_multiplier", 1)
 
-    # Default grouping fields per module
-    default_group_by = {
-        "instrumenten": "regeling",
-        "apparaat": "begrotingsnaam",
-        "inkoop": "ministerie",
-        "provincie": "provincie",
-        "gemeente": "gemeente",
-        "publiek": "source",
-    }
+    group_field = _detail_group_field(module, config, group_by)
 
-    group_field = group_by or default_group_by.get(module, primary)
+    # Validate jaar against YEARS list (H-5)
+    if jaar and jaar not in YEARS:
+        raise ValueError("Invalid year")
+
+    # Build WHERE clause
+    # The stored key (normalize_recipient(primary), 082) matches all
+    # case/formatting variations (SVB, Svb, etc.) with a plain index equality
+    key_sql, key_value = await _recipient_key_param(primary_value, 1)
+    scope_clauses, scope_params = _detail_scope(config, jaar, search, filter_fields, param_idx=2)
+    where_clauses = [f"{config['source_key_field']} = {key_sql}"] + scope_clauses
+    params = [key_value] + scope_params
+
+    where_sql = f"WHERE {' AND '.join(where_clauses)}"
 
-    # Validate group_field against allowed fields for this module (C-1: SQL injection prevention)
+    query = f"""
+        SELECT
+            {group_field}::text AS group_value,
+            {_detail_year_columns(config)},
+            COALESCE(SUM({amount_field}), 0) * {multiplier} AS totaal,
+            COUNT(*) AS row_count
+        FROM {table}
+        {where_sql}
+        GROUP BY {group_field}
+        ORDER BY totaal DESC
+        LIMIT 100
+    """
+
+    rows = await fetch_all(query, *params)
+
+    return [_detail_row(row, group_field) for row in rows]
+
+
+# Default grouping fields per module
+DEFAULT_GROUP_BY = {
+    "instrumenten": "regeling",
+    "apparaat": "begrotingsnaam",
+    "inkoop": "ministerie",
+    "provincie": "provincie",
+    "gemeente": "gemeente",
+    "publiek": "source",
+}
+
+
+def _detail_group_field(module: str, config: dict, group_by: Optional[str]) -> str:
+    """Resolve and validate the detail grouping field (C-1: SQL injection prevention)."""
+    primary = config["primary_field"]
+    group_field = group_by or DEFAULT_GROUP_BY.get(module, primary)
     valid_group_fields = list(config.get("filter_fields", [])) + list(config.get("extra_columns", [])) + [primary]
     if group_field not in valid_group_fields:
         raise ValueError(f"Invalid group_by field")
     validate_identifier(group_field, ALLOWED_COLUMNS, "column")
+    return group_field
 
-    # Validate jaar against YEARS list (H-5)
-    if jaar and jaar not in YEARS:
-        raise ValueError("Invalid year")
 
-    # Build year columns with multiplier for normalization
-    year_columns = ", ".join([
+def _detail_year_columns(config: dict) -> str:
+    """Per-year SUM columns (y2016..y2024) with multiplier for normalization."""
+    year_field = config["year_field"]
+    amount_field = config["amount_field"]
+    multiplier = config.get("amount_multiplier", 1)
+    return ", ".join([
         f"COALESCE(SUM(CASE WHEN {year_field} = {year} THEN {amount_field} END), 0) * {multiplier} AS \"y{year}\""
         for year in YEARS
     ])
 
-    # Build WHERE clause
-    # Use normalize_recipient() to match all case/formatting variations (SVB, Svb, etc.)
-    # This uses functional indexes created in 020-normalize-recipient-indexes.sql
-    # IMPORTANT: The index on normalize_recipient(primary_field) makes this fast
-    where_clauses = [f"normalize_recipient({primary}) = normalize_recipient($1)"]
-    params = [primary_value]
-    param_idx = 2
+
+def _detail_scope(
+    config: dict,
+    jaar: Optional[int],
+    search: Optional[str],
+    filter_fields: Optional[dict[str, list[str]]],
+    param_idx: int,
+) -> tuple[list[str], list]:
+    """
+    WHERE conditions (and params, numbered from param_idx) that scope detail rows.
+
+    - jaar: only that year
+    - search (secondary match expansion): only rows where secondary fields
+      (regeling, artikel, etc.) match the search term
+    - filter_fields (filter-scoped expansion): only rows matching the active
+      multiselect filters (e.g., regeling='Bijdrage aan Deltares')
+    """
+    primary = config["primary_field"]
+    clauses: list[str] = []
+    params: list = []
 
     if jaar:
-        where_clauses.append(f"{year_field} = ${param_idx}")
+        clauses.append(f"{config['year_field']} = ${param_idx}")
         params.append(jaar)
         param_idx += 1
 
-    # Search scoping: when expanding a secondary match, only show detail rows
-    # where secondary fields (regeling, artikel, etc.) match the search term.
     if search:
         search_fields = config.get("search_fields", [primary])
         other_fields = [f for f in search_fields if f != primary]
         if other_fields:
             _, sec_pattern = build_search_condition(other_fields[0], param_idx, search)
-            sec_conditions = " OR ".join([f"{f} ~* ${param_idx}" for f in other_fields])
-            where_clauses.append(f"({sec_conditions})")
-            params.append(sec_pattern)
-            param_idx += 1
+            sec_conditions = word_match_sql(other_fields, param_idx, param_idx + 1)
+            clauses.append(f"({sec_conditions})")
+            params.extend([sec_pattern, build_search_prefilter(search)])
+            param_idx += 2
 
-    # Filter scoping: when multiselect filters are active, only show detail rows
-    # matching the active filters (e.g., regeling='Bijdrage aan Deltares').
     if filter_fields:
         valid_filter_fields = config.get("filter_fields", [])
         for field, values in filter_fields.items():
             if field in valid_filter_fields and values:
                 validate_identifier(field, ALLOWED_COLUMNS, "column")
                 placeholders = ", ".join([f"${param_idx + i}" for i in range(len(values))])
-                where_clauses.append(f"{field}::text IN ({placeholders})")
+                clauses.append(f"{field}::text IN ({placeholders})")
                 params.extend(values)
                 param_idx += len(values)
 
-    where_sql = f"WHERE {' AND '.join(where_clauses)}"
+    return clauses, params
 
-    query = f"""
-        SELECT
-            {group_field}::text AS group_value,
-            {year_columns},
-            COALESCE(SUM({amount_field}), 0) * {multiplier} AS totaal,
-            COUNT(*) AS row_count
-        FROM {table}
-        {where_sql}
-        GROUP BY {group_field}
-        ORDER BY totaal DESC
-        LIMIT 100
-    """
 
-    rows = await fetch_all(query, *params)
-
-    result = []
-    for row in rows:
-        years_dict = {year: int(row.get(f"y{year}", 0) or 0) for year in YEARS}
-        raw_gv = row["group_value"]
-        result.append({
-            "group_by": group_field,
-            "group_value": str(raw_gv) if raw_gv is not None else None,
-            "years": years_dict,
-            "totaal": int(row["totaal"] or 0),
-            "row_count": row["row_count"],
-        })
-
-    return result
+def _detail_row(row: dict, group_field: str) -> dict:
+    raw_gv = row["group_value"]
+    return {
+        "group_by": group_field,
+        "group_value": str(raw_gv) if raw_gv is not None else None,
+        "years": {year: int(row.get(f"y{year}", 0) or 0) for year in YEARS},
+        "totaal": int(row["totaal"] or 0),
+        "row_count": row["row_count"],
+    }
 
 
 # Groupable fields per module (mirrors frontend GROUPABLE_FIELDS)
@@ -1876,7 +2658,6 @@ async def get_grouping_counts(
 
     config = MODULE_CONFIG[module]
     table = config["table"]
-    primary = config["primary_field"]
 
     fields = GROUPABLE_FIELDS.get(module, [])
     if not fields:
@@ -1891,13 +2672,14 @@ async def get_grouping_counts(
         f'COUNT(DISTINCT "{f}") AS "{f}_count"' for f in fields
     ])
 
+    key_sql, key_value = await _recipient_key_param(primary_value, 1)
     query = f"""
         SELECT {count_cols}
         FROM {table}
-        WHERE normalize_recipient({primary}) = normalize_recipient($1)
+        WHERE {config['source_key_field']} = {key_sql}
     """
 
-    rows = await fetch_all(query, primary_value)
+    rows = await fetch_all(query, key_value)
     if not rows:
         return {f: 0 for f in fields}
 
@@ -1905,6 +2687,145 @@ async def get_grouping_counts(
     return {f: int(row[f"{f}_count"] or 0) for f in fields}
 
 
+# Maximum primary values per batch expansion request (one table page)
+MAX_BATCH_EXPAND = 100
+
+
+async def _batch_keys_cte(primary_values: list[str]) -> tuple[str, list]:
+    """
+    CTE batch_keys(batch_key, batch_norm): each requested value with its
+    recipient key, for joining on the stored key column. Returns (CTE, params
+    starting at $1).
+    """
+    if await _python_recipient_keys():
+        cte = "batch_keys AS (SELECT * FROM unnest($1::text[], $2::text[]) AS k(batch_key, batch_norm))"
+        return cte, [primary_values, [normalize_recipient_python(pv) for pv in primary_values]]
+    cte = (
+        "batch_keys AS (SELECT k AS batch_key, normalize_recipient(k) AS batch_norm"
+        " FROM unnest($1::text[]) AS k)"
+    )
+    return cte, [primary_values]
+
+
+async def get_row_details_batch(
+    module: str,
+    primary_values: list[str],
+    group_by: Optional[str] = None,
+    jaar: Optional[int] = None,
+    search: Optional[str] = None,
+    filter_fields: Optional[dict[str, list[str]]] = None,
+) -> dict[str, list[dict]]:
+    """
+    Detail rows for many primary values at once ("expand all").
+
+    Same rows and scoping as get_row_details(), in one query: the requested
+    values are unnested, joined on the stored key column (same index as the
+    single lookup) and grouped by (value, group field). The per-value
+    LIMIT 100 becomes a ROW_NUMBER() window.
+
+    Returns {primary_value: [detail rows]} for every requested value.
+    """
+    if module not in MODULE_CONFIG:
+        raise ValueError(f"Unknown module: {module}")
+    if len(primary_values) > MAX_BATCH_EXPAND:
+        raise ValueError("Too many primary values")
+
+    config = MODULE_CONFIG[module]
+    table = config["table"]
+    amount_field = config["amount_field"]
+    multiplier = config.get("amount_multiplier", 1)
+
+    group_field = _detail_group_field(module, config, group_by)
+
+    if jaar and jaar not in YEARS:
+        raise ValueError("Invalid year")
+
+    result: dict[str, list[dict]] = {pv: [] for pv in primary_values}
+    if not primary_values:
+        return result
+
+    primary_values = list(dict.fromkeys(primary_values))
+    keys_cte, keys_params = await _batch_keys_cte(primary_values)
+    scope_clauses, scope_params = _detail_scope(
+        config, jaar, search, filter_fields, param_idx=len(keys_params) + 1
+    )
+    where_sql = f"WHERE {' AND '.join(scope_clauses)}" if scope_clauses else ""
+
+    query = f"""
+        WITH {keys_cte},
+        grouped AS (
+            SELECT
+                bk.batch_key,
+                t.{group_field}::text AS group_value,
+                {_detail_year_columns(config)},
+                COALESCE(SUM({amount_field}), 0) * {multiplier} AS totaal,
+                COUNT(*) AS row_count
+            FROM batch_keys bk
+            JOIN {table} t ON t.{config['source_key_field']} = bk.batch_norm
+            {where_sql}
+            GROUP BY bk.batch_key, t.{group_field}
+        ),
+        ranked AS (
+            SELECT grouped.*,
+                   ROW_NUMBER() OVER (PARTITION BY batch_key ORDER BY totaal DESC) AS batch_rank
+            FROM grouped
+        )
+        SELECT * FROM ranked
+        WHERE batch_rank <= 100
+        ORDER BY batch_key, batch_rank
+    """
+
+    rows = await fetch_all(query, *keys_params, *scope_params)
+
+    for row in rows:
+        result[row["batch_key"]].append(_detail_row(row, group_field))
+    return result
+
+
+async def get_grouping_counts_batch(
+    module: str,
+    primary_values: list[str],
+) -> dict[str, dict[str, int]]:
+    """
+    get_grouping_counts() for many primary values in one query.
+
+    Returns {primary_value: {"regeling": 12, ...}} for every requested value.
+    """
+    if module not in MODULE_CONFIG:
+        raise ValueError(f"Unknown module: {module}")
+    if len(primary_values) > MAX_BATCH_EXPAND:
+        raise ValueError("Too many primary values")
+
+    config = MODULE_CONFIG[module]
+    table = config["table"]
+
+    fields = GROUPABLE_FIELDS.get(module, [])
+    result = {pv: {f: 0 for f in fields} for pv in primary_values}
+    if not fields or not primary_values:
+        return result
+
+    for f in fields:
+        validate_identifier(f, ALLOWED_COLUMNS, "column")
+
+    count_cols = ", ".join([
+        f'COUNT(DISTINCT t."{f}") AS "{f}_count"' for f in fields
+    ])
+
+    keys_cte, keys_params = await _batch_keys_cte(list(dict.fromkeys(primary_values)))
+    query = f"""
+        WITH {keys_cte}
+        SELECT bk.batch_key, {count_cols}
+        FROM batch_keys bk
+        JOIN {table} t ON t.{config['source_key_field']} = bk.batch_norm
+        GROUP BY bk.batch_key
+    """
+
+    rows = await fetch_all(query, *keys_params)
+    for row in rows:
+        result[row["batch_key"]] = {f: int(row[f"{f}_count"] or 0) for f in fields}
+    return result
+
+
 BETALINGEN_BRACKETS = {
     "1": "record_count = 1",
     "2-10": "record_count BETWEEN 2 AND 10",
@@ -1912,6 +2833,50 @@ BETALINGEN_BRACKETS = {
     "50+": "record_count >= 50",
 }
 
+# universal_search.module_mask bits (084): module -> (bit, display name in sources).
+# Bits follow the alphabetical order of the display names, so decoding low to
+# high gives the badge order of STRING_AGG(... ORDER BY source).
+INTEGRAAL_MODULE_BITS = {
+    "instrumenten": (1, "Financiële instrumenten"),
+    "gemeente": (2, "Gemeentelijke subsidieregisters"),
+    "inkoop": (4, "Inkoopuitgaven"),
+    "provincie": (8, "Provinciale subsidieregisters"),
+    "publiek": (16, "Publiek"),
+}
+_ALL_MODULES_MASK = sum(bit for bit, _ in INTEGRAAL_MODULE_BITS.values())
+
+# Filter value (module name or display name, lowercase) -> bit
+_MODULE_FILTER_BITS = {
+    **{mod: bit for mod, (bit, _) in INTEGRAAL_MODULE_BITS.items()},
+    **{name.lower(): bit for bit, name in INTEGRAAL_MODULE_BITS.values()},
+}
+
+# mask -> (display names, module names), precomputed for every possible mask
+_MODULE_MASK_DECODE = {
+    mask: (
+        [name for bit, name in sorted(INTEGRAAL_MODULE_BITS.values()) if mask & bit],
+        [mod for mod, (bit, _) in sorted(INTEGRAAL_MODULE_BITS.items(), key=lambda m: m[1]) if mask & bit],
+    )
+    for mask in range(_ALL_MODULES_MASK + 1)
+}
+
+
+def _module_filter_masks(filter_modules: list[str]) -> list[int]:
+    """
+    All module_mask values that contain every selected module.
+
+    (module_mask & required) = required cannot use an index; with only 31
+    possible masks, module_mask = ANY(<these masks>) can. Returns [] when a
+    selected module never appears in universal_search (e.g. apparaat).
+    """
+    required = 0
+    for mod in filter_modules:
+        bit = _MODULE_FILTER_BITS.get(mod.strip().lower())
+        if bit is None:
+            return []
+        required |= bit
+    return [m for m in range(1, _ALL_MODULES_MASK + 1) if m & required == required]
+
 
 async def get_integraal_data(
     search: Optional[str] = None,
@@ -1926,28 +2891,71 @@ async def get_integraal_data(
     filter_modules: Optional[list[str]] = None,
     betalingen: Optional[str] = None,
     columns: Optional[list[str]] = None,
-) -> tuple[list[dict], int, dict | None]:
+    cursor: Optional[str] = None,
+) -> tuple[list[dict], int, dict | None, str | None]:
+    """
+    Cached entry point for get_integraal_data (see _get_integraal_data_uncached).
+
+    Returned rows are shared with the cache and must not be mutated.
+    """
+    if not _is_cacheable(search, sort_by, offset):
+        return await _get_integraal_data_uncached(
+            search, jaar, min_bedrag, max_bedrag, sort_by, sort_order,
+            limit, offset, min_years, filter_modules, betalingen, columns, cursor,
+        )
+
+    key = (
+        "integraal", get_data_generation(),
+        search.strip() if search is not None else None,
+        jaar, min_bedrag, max_bedrag, sort_by, sort_order, limit, offset, min_years,
+        tuple(sorted(filter_modules or ())),
+        betalingen,
+        tuple(columns or ()),
+        cursor,
+    )
+    found, cached = _result_cache.get(key)
+    if found:
+        return cached
+
+    async def _load():
+        result = await _get_integraal_data_uncached(
+            search, jaar, min_bedrag, max_bedrag, sort_by, sort_order,
+            limit, offset, min_years, filter_modules, betalingen, columns, cursor,
+        )
+        _result_cache.set(key, result)
+        return result
+
+    return await _result_flight.do(key, _load)
+
+
+async def _get_integraal_data_uncached(
+    search: Optional[str] = None,
+    jaar: Optional[int] = None,
+    min_bedrag: Optional[float] = None,
+    max_bedrag: Optional[float] = None,
+    sort_by: str = "totaal",
+    sort_order: str = "desc",
+    limit: int = 25,
+    offset: int = 0,
+    min_years: Optional[int] = None,
+    filter_modules: Optional[list[str]] = None,
+    betalingen: Optional[str] = None,
+    columns: Optional[list[str]] = None,
+    cursor: Optional[str] = None,
+    export: bool = False,
+) -> tuple[list[dict], int, dict | None, str | None]:
     """
     Get cross-module data from universal_search table.
 
     This table is pre-aggregated with recipient totals across all modules.
-    Returns (rows, total_count, totals_dict_or_none).
+    Returns (rows, total_count, totals_dict_or_none, next_cursor), or the
+    unpaginated query as ExportPlan when export=True.
     """
     # SECURITY: Validate pagination bounds (defense-in-depth)
     if limit < 1 or limit > 500:
         raise ValueError(f"Invalid limit: {limit} (must be 1-500)")
     if offset < 0 or offset > 10000:
         raise ValueError(f"Invalid offset: {offset} (must be 0-10000)")
-    # Map display names to source values in database
-    module_name_map = {
-        "Instrumenten": "instrumenten",
-        "Apparaat": "apparaat",
-        "Inkoop": "inkoop",
-        "Provincie": "provincie",
-        "Gemeente": "gemeente",
-        "Publiek": "publiek",
-    }
-
     # Build WHERE clause
     where_clauses = []
     params = []
@@ -1964,10 +2972,10 @@ async def get_integraal_data(
         else:
             # Fallback: regex search (Typesense not configured or no word-boundary matches)
             logger.info(f"Integraal: Typesense returned 0 for '{search}', falling back to regex")
-            condition, pattern = build_search_condition("ontvanger", param_idx, search)
-            where_clauses.append(condition)
-            params.append(pattern)
-            param_idx += 1
+            _, pattern = build_search_condition("ontvanger", param_idx, search)
+            where_clauses.append(f"({word_match_sql(['ontvanger'], param_idx, param_idx + 1)})")
+            params.extend([pattern, build_search_prefilter(search)])
+            param_idx += 2
 
     # Year filter: show recipients who have data in that year
     if jaar:
@@ -1994,13 +3002,11 @@ async def get_integraal_data(
         param_idx += 1
 
     # Filter by modules: recipient must appear in ALL selected modules
+    # (module_mask bitmask, B-tree index on module_mask)
     if filter_modules:
-        for mod_display in filter_modules:
-            mod_db = module_name_map.get(mod_display, mod_display.lower())
-            escaped = mod_db.replace('%', '\\%').replace('_', '\\_')
-            where_clauses.append(f"sources ILIKE ${param_idx}")
-            params.append(f"%{escaped}%")
-            param_idx += 1
+        where_clauses.append(f"module_mask = ANY(${param_idx}::smallint[])")
+        params.append(_module_filter_masks(filter_modules))
+        param_idx += 1
 
     # Filter by betalingen bracket (record_count) — UX-022
     if betalingen and betalingen in BETALINGEN_BRACKETS:
@@ -2015,6 +3021,12 @@ async def get_integraal_data(
     # IMPORTANT: When searching, ALWAYS use relevance ranking (ignore random sort)
     use_random_threshold = False
     relevance_select = ""
+    relevance_column = ""
+    cursor_select = ""
+    keyset_columns: list[str] = []
+    keyset_clause = None
+    if cursor and (search or sort_by == "random"):
+        raise ValueError("Cursor pagination not supported for search or random sort")
     if search:
         # When searching: 3-tier relevance ranking
         # 1. Exact match on name → score 1
@@ -2025,12 +3037,13 @@ async def get_integraal_data(
         parsed_rel = parse_search_query(search)
         clean_search = parsed_rel.raw
         ilike_search = clean_search.replace('%', r'\%').replace('_', r'\_')
-        relevance_select = f""",
+        relevance_column = f"""
             CASE
                 WHEN UPPER(ontvanger) = UPPER(${param_idx}) THEN 1
                 WHEN ontvanger ILIKE ${param_idx + 1} THEN 2
                 ELSE 3
             END AS relevance_score"""
+        relevance_select = f",{relevance_column}"
         params.append(clean_search)
         params.append(f"%{ilike_search}%")
         param_idx += 2
@@ -2039,9 +3052,9 @@ async def get_integraal_data(
         sort_clause = "ORDER BY random_order"
         # For random sort on first page: use WHERE random_order > threshold
         # This is faster than OFFSET because it uses the index directly
-        if offset == 0:
+        random_threshold = _random_threshold(offset)
+        if random_threshold is not None:
             use_random_threshold = True
-            random_threshold = random.random() * 0.9  # 0-0.9 to ensure enough rows after
             where_clauses.append(f"random_order > ${param_idx}")
             params.append(random_threshold)
             param_idx += 1
@@ -2062,20 +3075,35 @@ async def get_integraal_data(
             # Reject any other sort_by values (could be SQL injection attempt)
             raise ValueError(f"Invalid sort_by value: {sort_by}")
         sort_direction = "DESC" if sort_order == "desc" else "ASC"
-        sort_clause = f"ORDER BY {sort_field} {sort_direction} NULLS LAST"
 
-    # Rebuild where_sql after potential random_order addition
+        # Keyset pagination: ontvanger_key breaks ties (see _get_from_aggregated_view)
+        keyset_columns = [sort_field, "ontvanger_key"]
+        sort_clause = "ORDER BY " + ", ".join(f"{c} {sort_direction}" for c in keyset_columns)
+        cursor_select = ", " + ", ".join(f"{c} AS _cursor_{i}" for i, c in enumerate(keyset_columns))
+        if cursor:
+            cursor_values = _decode_cursor(
+                cursor, sort_by, sort_order,
+                numeric_sort=sort_by != "primary", key_count=1,
+            )
+            keyset_clause = _keyset_condition(keyset_columns, sort_order, param_idx)
+            where_clauses.append(keyset_clause)
+            params.extend(cursor_values)
+            param_idx += len(cursor_values)
+            offset = 0
+
+    # Rebuild where_sql after potential random_order/keyset addition
     where_sql = f"WHERE {' AND '.join(where_clauses)}" if where_clauses else ""
 
     # Count query uses only WHERE clause params (snapshot taken before relevance/random params added)
-    count_where = [c for c in where_clauses if "random_order" not in c]
+    # Page-only conditions (random threshold, cursor position) must not affect count/totals
+    page_only = [c for c in where_clauses if "random_order" in c or c == keyset_clause]
+    count_where = [c for c in where_clauses if c not in page_only]
     count_where_sql = f"WHERE {' AND '.join(count_where)}" if count_where else ""
     count_params = count_params_snapshot
 
-    query = f"""
-        SELECT
+    select_sql = f"""
             ontvanger AS primary_value,
-            sources,
+            module_mask,
             source_count,
             record_count,
             "2016" AS y2016,
@@ -2087,12 +3115,41 @@ async def get_integraal_data(
             "2022" AS y2022,
             "2023" AS y2023,
             "2024" AS y2024,
-            totaal{relevance_select}
+            totaal{relevance_select}{cursor_select}"""
+
+    if export:
+        return ExportPlan(
+            primary_field="ontvanger",
+            extra_columns=[("betalingen", "record_count")] if columns and "betalingen" in columns else [],
+            query=f"SELECT{select_sql} FROM universal_search {where_sql} {sort_clause}",
+            params=list(params),
+        )
+
+    query = f"""
+        SELECT{select_sql}
         FROM universal_search
         {where_sql}
         {sort_clause}
         LIMIT ${param_idx} OFFSET ${param_idx + 1}
     """
+    # Columns of select_sql, the sort, the page-only conditions and the totals
+    filtered_columns = [
+        "ontvanger", "ontvanger_key", "module_mask", "source_count", "record_count",
+        *(f'"{y}"' for y in YEARS), "totaal",
+    ]
+    if sort_by == "random" and not search:
+        filtered_columns.append("random_order")
+    if relevance_column:
+        filtered_columns.append(relevance_column)
+    fused_query = _build_fused_query(
+        select_sql=select_sql,
+        filtered_columns=filtered_columns,
+        from_clause="universal_search",
+        where_sql=count_where_sql,
+        page_where_sql=f"WHERE {' AND '.join(page_only)}" if page_only else "",
+        sort_clause=sort_clause,
+        limit_param_idx=param_idx,
+    )
     params.extend([limit, offset])
 
     # Count query (without random threshold for accurate total)
@@ -2112,35 +3169,35 @@ async def get_integraal_data(
     # Execute queries in PARALLEL for performance
     # Only compute totals when user actively searches/filters (not min_years alone)
     run_totals = bool(search or jaar or min_bedrag is not None or max_bedrag is not None or filter_modules or betalingen)
-    coros = [
-        fetch_all(query, *params),
-        fetch_val(count_query, *count_params) if count_params else fetch_val(count_query),
-        fetch_all("SELECT module, year_from, year_to FROM data_availability WHERE entity_type IS NULL"),
-    ]
-    if run_totals:
-        coros.append(
-            fetch_all(totals_query, *count_params) if count_params else fetch_all(totals_query)
-        )
 
-    results = await asyncio.gather(*coros)
-    rows = results[0]
-    total = results[1]
-    all_avail = results[2]
+    # Filtered view: page + count + totals in one scan of universal_search
+    fused_result = None
+    if run_totals and get_settings().fused_page_query:
+        fused_result = await _fetch_fused_or_none(fused_query, params, "integraal")
 
-    # Extract totals if we ran that query
     totals = None
-    if run_totals and len(results) > 3:
-        totals_row = results[3]
-        if totals_row:
-            r = totals_row[0]
-            totals = {
-                "years": {year: int(r.get(f"sum_{year}", 0) or 0) for year in YEARS},
-                "totaal": int(r.get("sum_totaal", 0) or 0),
-            }
-    module_avail = {r["module"]: (r["year_from"], r["year_to"]) for r in all_avail}
-    for mod in AVAILABILITY_ENTITY_TYPE:
-        if mod not in module_avail:
-            module_avail[mod] = (YEARS[0], YEARS[-1])
+    if fused_result:
+        rows, total, totals = fused_result
+    else:
+        coros = [
+            fetch_all(query, *params),
+            fetch_val(count_query, *count_params) if count_params else fetch_val(count_query),
+        ]
+        if run_totals:
+            coros.append(
+                fetch_all(totals_query, *count_params) if count_params else fetch_all(totals_query)
+            )
+
+        results = await asyncio.gather(*coros)
+        rows = results[0]
+        total = results[1]
+
+        # Extract totals if we ran that query
+        if run_totals and len(results) > 2:
+            totals_row = results[2]
+            if totals_row:
+                totals = _totals_from_row(totals_row[0])
+    availability = await get_availability_index()
 
     result = []
     for row in rows:
@@ -2148,18 +3205,10 @@ async def get_integraal_data(
             year: int(row.get(f"y{year}", 0) or 0)
             for year in YEARS
         }
-        row_modules = [s.strip() for s in row["sources"].split(",")] if row["sources"] else []
-
-        # Compute combined availability range from all modules this entity appears in
-        year_from = None
-        year_to = None
-        for mod in row_modules:
-            avail = module_avail.get(mod)
-            if avail:
-                if year_from is None or avail[0] < year_from:
-                    year_from = avail[0]
-                if year_to is None or avail[1] > year_to:
-                    year_to = avail[1]
+        mask = row["module_mask"] or 0
+
+        # Combined availability range of all modules this entity appears in
+        year_from, year_to = availability.mask_range(mask)
 
         extra = {}
         if columns and "betalingen" in columns:
@@ -2170,13 +3219,53 @@ async def get_integraal_data(
             "years": years_dict,
             "totaal": int(row["totaal"] or 0),
             "row_count": row["source_count"] or 1,  # Use source_count as row_count
-            "modules": row_modules,
+            "modules": list(_MODULE_MASK_DECODE[mask][0]),
             "data_available_from": year_from,
             "data_available_to": year_to,
             "extra_columns": extra if extra else None,
         })
 
-    return result, total or 0, totals
+    next_cursor = _next_cursor(rows, limit, sort_by, sort_order, 1) if keyset_columns else None
+
+    return result, total or 0, totals, next_cursor
+
+
+# Module columns of integraal_module_breakdown (085), in query order.
+# Not apparaat: it has kostensoort, not recipients.
+INTEGRAAL_DETAIL_MODULES = ["instrumenten", "inkoop", "provincie", "gemeente", "publiek"]
+
+
+def _integraal_breakdown_rows(row, jaar: Optional[int]) -> list[dict]:
+    """
+    Detail rows from one integraal_module_breakdown row.
+
+    Each module column is [2016..2024, totaal, row_count] of that module's
+    view row (NULL = not in module), unrounded NUMERIC: int() truncates it
+    like the module table rows (transform_row). With jaar, modules without an
+    amount in that year are left out, like the former WHERE "jaar" > 0 per
+    module view.
+    """
+    result = []
+    for module_name in INTEGRAAL_DETAIL_MODULES:
+        vec = row[module_name] if row is not None else None
+        if not vec:
+            continue
+        if jaar and (vec[YEARS.index(jaar)] or 0) <= 0:
+            continue
+        totaal = int(vec[len(YEARS)] or 0)
+        if totaal == 0:
+            continue  # Same as the former SUM over no rows: skip empty modules
+        result.append({
+            "group_by": "module",
+            "group_value": module_name,
+            "years": {year: int(vec[i] or 0) for i, year in enumerate(YEARS)},
+            "totaal": totaal,
+            "row_count": int(vec[len(YEARS) + 1] or 0),
+        })
+
+    # Sort by totaal descending
+    result.sort(key=lambda x: x["totaal"], reverse=True)
+    return result
 
 
 async def get_integraal_details(
@@ -2186,73 +3275,199 @@ async def get_integraal_details(
     """
     Get module breakdown for a specific recipient in integraal view.
 
-    Shows how much the recipient received from each module by querying
-    each module's aggregated view.
+    Shows how much the recipient received from each module, read from the
+    per-module year vectors in integraal_module_breakdown (one row fetch).
     """
     # Validate jaar (H-5)
     if jaar and jaar not in YEARS:
         raise ValueError("Invalid year")
 
-    # Modules with their aggregated table and primary field
-    # (not apparaat - it uses kostensoort, not recipients)
-    modules_to_query = [
-        ("instrumenten", "instrumenten_aggregated", "ontvanger"),
-        ("inkoop", "inkoop_aggregated", "leverancier"),
-        ("provincie", "provincie_aggregated", "ontvanger"),
-        ("gemeente", "gemeente_aggregated", "ontvanger"),
-        ("publiek", "publiek_aggregated", "ontvanger"),
-    ]
+    key_sql, key_value = await _recipient_key_param(primary_value, 1)
+    columns = ", ".join(INTEGRAAL_DETAIL_MODULES)
+    rows = await fetch_all(
+        f"SELECT {columns} FROM integraal_module_breakdown WHERE recipient_key = {key_sql}",
+        key_value,
+    )
+    return _integraal_breakdown_rows(rows[0] if rows else None, jaar)
 
-    # Build all 5 queries and run in PARALLEL
-    # Uses SUM to handle per-entity views (028): entity-level modules may have
-    # multiple rows per recipient (one per entity), so we sum across entities
-    coros = []
-    for module_name, agg_table, primary_field in modules_to_query:
-        year_filter = f'AND "{jaar}" > 0' if jaar else ""
-        key_field = f"{primary_field}_key"
 
-        query = f"""
-            SELECT
-                COALESCE(SUM("2016"), 0) AS y2016, COALESCE(SUM("2017"), 0) AS y2017,
-                COALESCE(SUM("2018"), 0) AS y2018, COALESCE(SUM("2019"), 0) AS y2019,
-                COALESCE(SUM("2020"), 0) AS y2020, COALESCE(SUM("2021"), 0) AS y2021,
-                COALESCE(SUM("2022"), 0) AS y2022, COALESCE(SUM("2023"), 0) AS y2023,
-                COALESCE(SUM("2024"), 0) AS y2024,
-                COALESCE(SUM(totaal), 0) AS totaal,
-                COALESCE(SUM(row_count), 0) AS row_count
-            FROM {agg_table}
-            WHERE {key_field} = normalize_recipient($1) {year_filter}
-        """
-        coros.append(fetch_all(query, primary_value))
+async def get_integraal_details_batch(
+    primary_values: list[str],
+    jaar: Optional[int] = None,
+) -> dict[str, list[dict]]:
+    """
+    Module breakdown for many integraal rows at once ("expand all").
 
-    all_results = await asyncio.gather(*coros)
+    Same rows as get_integraal_details() for every value, in one query.
+    """
+    if jaar and jaar not in YEARS:
+        raise ValueError("Invalid year")
+    if len(primary_values) > MAX_BATCH_EXPAND:
+        raise ValueError("Too many primary values")
+    if not primary_values:
+        return {}
 
-    result = []
-    for (module_name, _, _), rows in zip(modules_to_query, all_results):
-        if rows:
-            row = rows[0]
-            totaal = int(row.get("totaal", 0) or 0)
-            if totaal == 0:
-                continue  # SUM returns 0 when no matching rows, skip empty modules
-            years_dict = {year: int(row.get(f"y{year}", 0) or 0) for year in YEARS}
-            result.append({
-                "group_by": "module",
-                "group_value": module_name,
-                "years": years_dict,
-                "totaal": totaal,
-                "row_count": int(row.get("row_count", 0) or 0),
-            })
+    keys_cte, keys_params = await _batch_keys_cte(list(dict.fromkeys(primary_values)))
+    columns = ", ".join(f"b.{m}" for m in INTEGRAAL_DETAIL_MODULES)
+    rows = await fetch_all(
+        f"""
+        WITH {keys_cte}
+        SELECT bk.batch_key, {columns}
+        FROM batch_keys bk
+        JOIN integraal_module_breakdown b ON b.recipient_key = bk.batch_norm
+        """,
+        *keys_params,
+    )
+    by_key = {row["batch_key"]: row for row in rows}
+    return {pv: _integraal_breakdown_rows(by_key.get(pv), jaar) for pv in primary_values}
 
-    # Sort by totaal descending
-    result.sort(key=lambda x: x["totaal"], reverse=True)
 
-    return result
+# =============================================================================
+# Streaming Export
+# =============================================================================
+# The frontend exports the rows it has loaded (max 500). Full exports stream the
+# complete result set through a server-side cursor instead: rows are fetched in
+# batches and written straight to the response, so memory stays constant no
+# matter how many rows match.
+#
+# Uses the same query builders as the table (identical filters and sort),
+# minus LIMIT/OFFSET. Search results with secondary matches are merged in
+# Python; those are bounded by the Typesense key limit and are paged instead.
+# =============================================================================
+
+# Each running export holds a pool connection until the download finishes
+_export_semaphore = asyncio.Semaphore(get_settings().export_max_concurrent)
+
+# Page size for the bounded (in-memory merge) fallback
+_EXPORT_PAGE_SIZE = 500
+
+
+@dataclass
+class ExportPlan:
+    """Query (or page loader) for a streaming export, see get_export_plan()."""
+    primary_field: str
+    extra_columns: list[tuple[str, str]]  # (column name, record key)
+    query: str | None = None  # Full ordered result set, streamed via cursor
+    params: list = field(default_factory=list)
+    load_page: Callable[[int, int], Awaitable[list[dict]]] | None = None  # (limit, offset) → API rows
+
+
+def export_slots_available() -> bool:
+    """Whether an export can start without waiting for a running one."""
+    return not _export_semaphore.locked()
+
+
+async def get_export_plan(
+    module: str,
+    search: Optional[str] = None,
+    jaar: Optional[int] = None,
+    min_bedrag: Optional[float] = None,
+    max_bedrag: Optional[float] = None,
+    sort_by: str = "totaal",
+    sort_order: str = "desc",
+    min_years: Optional[int] = None,
+    filter_fields: Optional[dict[str, list[str]]] = None,
+    columns: Optional[list[str]] = None,
+    filter_modules: Optional[list[str]] = None,
+    betalingen: Optional[str] = None,
+) -> ExportPlan:
+    """
+    Build the export for a module table with the same filters as get_module_data().
+
+    Validation (unknown module, invalid sort, ...) raises ValueError here,
+    before anything is streamed. Random sort is exported by totaal.
+    """
+    if sort_by == "random":
+        sort_by = "totaal"
+
+    if module == "integraal":
+        return await _get_integraal_data_uncached(
+            search=search, jaar=jaar, min_bedrag=min_bedrag, max_bedrag=max_bedrag,
+            sort_by=sort_by, sort_order=sort_order, min_years=min_years,
+            filter_modules=filter_modules, betalingen=betalingen, columns=columns, export=True,
+        )
+
+    plan = await _get_module_data_uncached(
+        module, search, jaar, min_bedrag, max_bedrag, sort_by, sort_order,
+        min_years=min_years, filter_fields=filter_fields, columns=columns, export=True,
+    )
+    if plan is not None:
+        return plan
+
+    # Search with secondary matches: page through the regular (merged) result
+    async def load_page(limit: int, offset: int) -> list[dict]:
+        rows, _, _, _ = await _get_module_data_uncached(
+            module, search, jaar, min_bedrag, max_bedrag, sort_by, sort_order,
+            limit=limit, offset=offset, min_years=min_years,
+            filter_fields=filter_fields, columns=columns,
+        )
+        return rows
+
+    return ExportPlan(
+        primary_field=MODULE_CONFIG[module]["primary_field"],
+        extra_columns=[],
+        load_page=load_page,
+    )
+
+
+async def iter_export_rows(plan: ExportPlan, batch_size: int = 1000) -> AsyncIterator[dict]:
+    """
+    Yield export rows ({primary_value, years, totaal, extra_columns}) in order.
+
+    SQL plans are read through a server-side cursor inside a transaction
+    (required for cursors, and keeps pgbouncer on one backend).
+    """
+    async with _export_semaphore:
+        if plan.query is None:
+            offset = 0
+            while offset <= 10000:
+                rows = await plan.load_page(_EXPORT_PAGE_SIZE, offset)
+                for row in rows:
+                    yield row
+                if len(rows) < _EXPORT_PAGE_SIZE:
+                    return
+                offset += _EXPORT_PAGE_SIZE
+            return
+
+        pool = await get_pool()
+        async with pool.acquire(timeout=10) as conn:
+            async with conn.transaction(readonly=True):
+                async for record in conn.cursor(plan.query, *plan.params, prefetch=batch_size):
+                    yield {
+                        "primary_value": record["primary_value"],
+                        "years": {year: record[f"y{year}"] or 0 for year in YEARS},
+                        "totaal": record["totaal"] or 0,
+                        "extra_columns": {
+                            name: str(record[key]) if record[key] is not None else None
+                            for name, key in plan.extra_columns
+                        },
+                    }
 
 
 # =============================================================================
 # Filter Options
 # =============================================================================
 
+# Dropdown values per (module, field), until the dataset generation changes
+# (the cache is cleared then). ~25 filter fields in total.
+_filter_options_cache = create_cache("filter_options", max_entries=64, ttl_seconds=86400)
+_filter_options_flight = create_singleflight("filter_options")
+
+
+def filter_options_etag(module: str, field: str) -> Optional[str]:
+    """
+    Strong ETag for a filter dropdown: values only change with the dataset generation.
+
+    None while no generation is loaded (0: 077 not applied, or the startup
+    load failed). The values then change without a new generation, so a
+    generation-based ETag would answer 304 forever.
+    """
+    generation = get_data_generation()
+    if generation <= 0:
+        return None
+    return f'"filters-{module}-{field}-{generation}"'
+
+
 async def get_filter_options(module: str, field: str) -> list[str]:
     """
     Get distinct values for a filter field.
@@ -2260,7 +3475,11 @@ async def get_filter_options(module: str, field: str) -> list[str]:
     Used for auto-populating multi-select dropdowns.
     Returns sorted list of unique values.
 
+    Values come from filter_dictionary (083, refreshed with the materialized
+    views) and are kept in process per dataset generation.
+
     Limited to MAX_FILTER_OPTIONS to prevent memory issues and DoS.
+    Returned lists are shared with the cache and must not be mutated.
     """
     # Maximum options to return (prevents memory issues, DoS attacks)
     MAX_FILTER_OPTIONS = 5000
@@ -2269,30 +3488,47 @@ async def get_filter_options(module: str, field: str) -> list[str]:
         raise ValueError(f"Unknown module: {module}")
 
     config = MODULE_CONFIG[module]
-    table = config["table"]
 
     # Validate field is a valid filter field for this module
     valid_fields = config.get("filter_fields", [])
     if field not in valid_fields:
         raise ValueError(f"Invalid filter field '{field}' for module '{module}'")
 
-    # Validate identifier for defense-in-depth (already checked against filter_fields)
-    validate_identifier(field, ALLOWED_COLUMNS, "column")
+    key = (get_data_generation(), module, field)
+    found, cached = _filter_options_cache.get(key)
+    if found:
+        return cached
+
+    async def _load():
+        # Distinct non-empty values, already as text (index-only scan on
+        # (module, field, value))
+        rows = await fetch_all(
+            f"""
+            SELECT value
+            FROM filter_dictionary
+            WHERE module = $1 AND field = $2
+            ORDER BY value
+            LIMIT {MAX_FILTER_OPTIONS}
+            """,
+            module, field,
+        )
+        values = [row["value"] for row in rows]
+        _filter_options_cache.set(key, values)
+        return values
+
+    return await _filter_options_flight.do(key, _load)
 
-    # Query distinct values (excluding NULL and empty strings)
-    # Cast to text to handle both string and numeric columns uniformly
-    # Limited to prevent DoS/memory issues
-    query = f"""
-        SELECT DISTINCT "{field}"::text AS value
-        FROM {table}
-        WHERE "{field}" IS NOT NULL
-          AND "{field}"::text != ''
-        ORDER BY "{field}"::text
-        LIMIT {MAX_FILTER_OPTIONS}
-    """
 
-    rows = await fetch_all(query)
-    return [row["value"] for row in rows]
+def get_facet_sources() -> dict[str, tuple[str, str, list[str]]]:
+    """Facet index sources: (source table, primary field, filter fields) per module."""
+    sources = {}
+    for module, config in MODULE_CONFIG.items():
+        fields = config.get("filter_fields", [])
+        for f in [config["primary_field"], *fields]:
+            validate_identifier(f, ALLOWED_COLUMNS, "column")
+        if fields:
+            sources[module] = (config["table"], config["primary_field"], fields)
+    return sources
 
 
 async def get_cascading_filter_options(
@@ -2310,6 +3546,8 @@ async def get_cascading_filter_options(
     Returns: {"field_name": [{"value": "...", "count": 123}, ...], ...}
     """
     MAX_FILTER_OPTIONS = 5000
+    # Limit values per key to prevent expensive IN clauses
+    MAX_VALUES_PER_FILTER = 100
 
     if module not in MODULE_CONFIG:
         raise ValueError(f"Unknown module: {module}")
@@ -2326,6 +3564,11 @@ async def get_cascading_filter_options(
         if key not in filter_fields:
             raise ValueError(f"Invalid filter field '{key}' for module '{module}'")
 
+    # In-memory bitmaps for the current generation (FACET_INDEX=true)
+    facet_index = get_facet_index(module)
+    if facet_index is not None:
+        return facet_index.options(active_filters, MAX_FILTER_OPTIONS, MAX_VALUES_PER_FILTER)
+
     primary_field = config["primary_field"]
     validate_identifier(primary_field, ALLOWED_COLUMNS, "column")
 
@@ -2338,12 +3581,10 @@ async def get_cascading_filter_options(
         param_idx = 1
 
         # Apply filters from ALL OTHER fields (not this one) — bidirectional
-        MAX_VALUES_PER_FILTER = 100
         for other_field, values in active_filters.items():
             if other_field == field or not values:
                 continue
             validate_identifier(other_field, ALLOWED_COLUMNS, "column")
-            # Limit values per key to prevent expensive IN clauses
             safe_values = values[:MAX_VALUES_PER_FILTER]
             placeholders = ", ".join([f"${param_idx + i}" for i in range(len(safe_values))])
             where_clauses.append(f'"{other_field}"::text IN ({placeholders})')
@@ -2459,17 +3700,19 @@ async def get_module_autocomplete(
     # Parse search input: strip quotes/wildcards for Typesense
     parsed = parse_search_query(search)
 
-    # ── Fire ALL Typesense searches in parallel ──────────────────────────
-    # Previously sequential (~220ms), now parallel (~50ms)
+    # ── Fire ALL Typesense searches in one /multi_search request ─────────
+    # Previously sequential (~220ms), then parallel (~50ms, 5 HTTP calls),
+    # now a single round trip
 
-    tasks: list[asyncio.Task] = []
-    task_labels: list[str] = []
+    searches: list[dict] = []
+    search_labels: list[str] = []
 
     # Task: primary field search
     if collection:
         query_by = f"{primary_field},{primary_field}_lower" if primary_field != "kostensoort" else "kostensoort,kostensoort_lower"
         sort_field = "totaal" if module == "apparaat" else "bedrag"
         primary_params = {
+            "collection": collection,
             "q": parsed.raw,
             "query_by": query_by,
             "prefix": "true",
@@ -2478,13 +3721,14 @@ async def get_module_autocomplete(
             "group_by": primary_field,
             "group_limit": "1",
         }
-        tasks.append(asyncio.create_task(_typesense_search(collection, primary_params)))
-        task_labels.append("primary")
+        searches.append(primary_params)
+        search_labels.append("primary")
 
     # Tasks: field match searches (up to 3 fields)
     if collection and search_fields:
         for field in search_fields[:3]:
             field_params = {
+                "collection": collection,
                 "q": parsed.raw,
                 "query_by": field,
                 "prefix": "true",
@@ -2492,31 +3736,26 @@ async def get_module_autocomplete(
                 "group_by": field,
                 "group_limit": "1",
             }
-            tasks.append(asyncio.create_task(_typesense_search(collection, field_params)))
-            task_labels.append(f"field:{field}")
+            searches.append(field_params)
+            search_labels.append(f"field:{field}")
 
     # Task: recipients collection search
     recipients_params = {
+        "collection": "recipients",
         "q": parsed.raw,
         "query_by": "name,name_lower",
         "prefix": "true",
         "per_page": str(limit * 20),
         "sort_by": "totaal:desc",
     }
-    tasks.append(asyncio.create_task(_typesense_search("recipients", recipients_params)))
-    task_labels.append("recipients")
-
-    # Await all Typesense calls at once
-    results = await asyncio.gather(*tasks, return_exceptions=True)
-
-    # Build label→result map (skip exceptions)
-    result_map: dict[str, dict] = {}
-    for label, result in zip(task_labels, results):
-        if isinstance(result, Exception):
-            logger.warning(f"Autocomplete Typesense call '{label}' failed: {result}")
-            result_map[label] = {}
-        else:
-            result_map[label] = result
+    searches.append(recipients_params)
+    search_labels.append("recipients")
+
+    # One round trip; failed sub-searches come back as empty results
+    results = await typesense_multi_search(searches, operation="autocomplete")
+
+    # Build label→result map
+    result_map: dict[str, dict] = dict(zip(search_labels, results))
 
     # ── Process results sequentially ─────────────────────────────────────
 
@@ -2548,20 +3787,21 @@ async def get_module_autocomplete(
     # FALLBACK: If Typesense returned nothing, try PostgreSQL directly
     if not current_module_results and module in MODULE_CONFIG:
         config = MODULE_CONFIG[module]
-        view = config.get("aggregated_table") or config.get("table")
+        # Recipient rollup for entity modules: one row (and name) per recipient
+        view = config.get("recipient_table") or config.get("aggregated_table") or config.get("table")
         primary = config.get("primary_field", "ontvanger")
         _, pattern = build_search_condition(primary, 1, search)
         query = f"""
             SELECT {primary} as name, totaal
             FROM {view}
-            WHERE {primary} ~* $1
+            WHERE {primary} ILIKE $2 AND {primary} ~* $1
             ORDER BY totaal DESC
             LIMIT {limit}
         """
         try:
             pool = await get_pool()
             async with pool.acquire() as conn:
-                rows = await conn.fetch(query, pattern)
+                rows = await conn.fetch(query, pattern, build_search_prefilter(search))
                 for row in rows:
                     name = row["name"]
                     current_module_results.append({
@@ -2684,7 +3924,7 @@ async def get_integraal_autocomplete(
         # Note: Typesense returns all fields by default, no need for include_fields
     }
 
-    data = await _typesense_search("recipients", params)
+    data = await typesense_search("recipients", params, operation="autocomplete")
 
     results = []
     for hit in data.get("hits", []):
@@ -2716,6 +3956,46 @@ async def get_integraal_autocomplete(
 # Module Stats (for dynamic search placeholder)
 # =============================================================================
 
+# Stats of all modules from module_stats (086), loaded once per data generation.
+# Stale-while-revalidate: after a generation change the previous stats are
+# served while one background load fetches the new ones, so the placeholder
+# only waits for the database on the very first request. A failed background
+# load is retried after _MODULE_STATS_RETRY_SECONDS, not on every request.
+_MODULE_STATS_RETRY_SECONDS = 30.0
+_module_stats: dict[str, tuple[int, int]] = {}
+_module_stats_generation: int | None = None
+_module_stats_flight = create_singleflight("module_stats")
+_module_stats_task: asyncio.Task | None = None
+_module_stats_failed_at: float | None = None
+
+
+async def _load_module_stats() -> None:
+    """Load module_stats into memory (generation taken before the query)."""
+    global _module_stats, _module_stats_generation
+    generation = get_data_generation()
+
+    async def _load():
+        rows = await fetch_all("SELECT module, entity_count, total FROM module_stats")
+        return {r["module"]: (int(r["entity_count"] or 0), int(r["total"] or 0)) for r in rows}
+
+    _module_stats = await _module_stats_flight.do(generation, _load)
+    _module_stats_generation = generation
+
+
+async def _revalidate_module_stats() -> None:
+    global _module_stats_failed_at
+    try:
+        await _load_module_stats()
+    except Exception as e:
+        _module_stats_failed_at = time.monotonic()
+        logger.error(
+            f"Module stats reload failed: {type(e).__name__}: {e} "
+            f"(retry in {_MODULE_STATS_RETRY_SECONDS:.0f}s)"
+        )
+        return
+    _module_stats_failed_at = None
+
+
 async def get_module_stats(module: str) -> dict:
     """
     Get statistics for a module: count of unique entities and total amount.
@@ -2723,6 +4003,9 @@ async def get_module_stats(module: str) -> dict:
     Used for dynamic search bar placeholder:
     "Doorzoek X ontvangers (€Y miljard) in [module]"
 
+    Served from memory (see _module_stats); only a cold start waits for the
+    database.
+
     Returns:
         {
             "count": int,  # Number of unique entities
@@ -2730,43 +4013,23 @@ async def get_module_stats(module: str) -> dict:
             "total_formatted": str,  # "1.474 miljard" or "156 miljoen"
         }
     """
-    if module == "integraal":
-        # Universal search: unique recipients across all modules
-        query = """
-            SELECT
-                COUNT(*) AS count,
-                SUM(totaal) AS total
-            FROM universal_search
-        """
-        row = await fetch_all(query)
-        row = row[0] if row else {"count": 0, "total": 0}
-    elif module in MODULE_CONFIG:
-        config = MODULE_CONFIG[module]
-        table = config.get("aggregated_table") or config["table"]
-
-        # Entity-level modules (028): views have multiple rows per recipient,
-        # so use COUNT(DISTINCT ontvanger_key) for unique recipient count
-        if config.get("entity_field"):
-            query = f"""
-                SELECT
-                    COUNT(DISTINCT ontvanger_key) AS count,
-                    SUM(totaal) AS total
-                FROM {table}
-            """
-        else:
-            query = f"""
-                SELECT
-                    COUNT(*) AS count,
-                    SUM(totaal) AS total
-                FROM {table}
-            """
-        row = await fetch_all(query)
-        row = row[0] if row else {"count": 0, "total": 0}
-    else:
+    global _module_stats_task
+    if module != "integraal" and module not in MODULE_CONFIG:
         return {"count": 0, "total": 0, "total_formatted": "0"}
 
-    count = int(row["count"] or 0)
-    total = int(row["total"] or 0)
+    if _module_stats_generation is None:
+        await _load_module_stats()
+    elif _module_stats_generation != get_data_generation():
+        backing_off = (
+            _module_stats_failed_at is not None
+            and time.monotonic() - _module_stats_failed_at < _MODULE_STATS_RETRY_SECONDS
+        )
+        if not backing_off and (_module_stats_task is None or _module_stats_task.done()):
+            _module_stats_task = asyncio.get_running_loop().create_task(
+                _revalidate_module_stats(), name="module-stats-reload",
+            )
+
+    count, total = _module_stats.get(module, (0, 0))
 
     # Format total in Dutch style: "X miljard" or "X miljoen"
     if total >= 1_000_000_000_000:
@@ -0,0 +1,295 @@
+"""
+Rate limiting: token bucket per (tier, client IP).
+
+Each tier allows `per_minute` requests per minute with bursts up to the same
+number (bucket capacity = one minute of requests, refilled continuously).
+
+Backends (RATE_LIMIT_BACKEND):
+
+- memory: buckets in process. Bounded by RATE_LIMIT_MAX_KEYS (least recently
+  seen client dropped first); idle buckets expire through a timer wheel of
+  one-second slots, so cleanup is amortized O(1) per request instead of a
+  periodic scan of every bucket. Limits apply per worker/replica.
+- redis: buckets in a Redis-protocol store (Redis, Valkey, ...), shared by
+  all workers and replicas. One Lua script per request refills, takes a
+  token and sets the expiry atomically, using the server clock. Needs the
+  optional redis package. Locally, any Redis-protocol server works as a
+  stand-in (docker run --rm -p 6379:6379 valkey/valkey, then
+  RATE_LIMIT_REDIS_URL=redis://localhost:6379/0); the script itself also runs
+  on fakeredis with Lua support (pip install "fakeredis[lua]").
+  If the store is unreachable, requests are allowed (fail open) and the error
+  is logged at most once per minute.
+"""
+import logging
+import math
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+from app.config import get_settings
+
+try:
+    import redis.asyncio as redis_asyncio
+except ImportError:  # Optional dependency (requirements.txt), redis backend unavailable
+    redis_asyncio = None
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RateLimitTier:
+    """Requests per minute for one class of endpoints."""
+    name: str
+    per_minute: int
+
+    @property
+    def capacity(self) -> float:
+        return float(self.per_minute)
+
+    @property
+    def refill_per_second(self) -> float:
+        return self.per_minute / 60.0
+
+    @property
+    def idle_seconds(self) -> float:
+        """After this long without requests a bucket is full again (= a new bucket)."""
+        return self.capacity / self.refill_per_second
+
+
+@dataclass
+class RateLimitResult:
+    allowed: bool
+    retry_after: int = 0  # Seconds until the next token (when not allowed)
+
+
+def _retry_after(tokens: float, tier: RateLimitTier) -> int:
+    return max(1, math.ceil((1.0 - tokens) / tier.refill_per_second))
+
+
+# =============================================================================
+# In-process backend
+# =============================================================================
+
+class MemoryRateLimiter:
+    """
+    Token buckets in a bounded LRU, expired through a timer wheel.
+
+    Wheel: one slot per second, WHEEL_SLOTS slots. A bucket is put in the
+    slot of its expiry time on every hit and remembers that slot; entries in
+    other slots (bucket hit again since) are stale and skipped when their
+    slot comes around. Expiries further away than the wheel span are
+    re-queued until due.
+    """
+
+    WHEEL_SLOTS = 128
+
+    def __init__(self, max_keys: int):
+        self.max_keys = max_keys
+        # key -> [tokens, last_refill, expires_at, wheel tick]
+        self.buckets: OrderedDict[str, list] = OrderedDict()
+        self.wheel: list[list[str]] = [[] for _ in range(self.WHEEL_SLOTS)]
+        self.wheel_tick = int(time.monotonic())
+        self.expired = 0
+        self.evicted = 0
+        self.rejected = 0
+
+    def _schedule(self, key: str, bucket: list) -> None:
+        tick = max(int(bucket[2]), self.wheel_tick + 1)
+        tick = min(tick, self.wheel_tick + self.WHEEL_SLOTS - 1)
+        bucket[3] = tick
+        self.wheel[tick % self.WHEEL_SLOTS].append(key)
+
+    def _advance(self, now: float) -> None:
+        """Expire the buckets of every slot passed since the last call."""
+        target = int(now)
+        if target - self.wheel_tick >= self.WHEEL_SLOTS:
+            self.wheel_tick = target - self.WHEEL_SLOTS
+        while self.wheel_tick < target:
+            self.wheel_tick += 1
+            index = self.wheel_tick % self.WHEEL_SLOTS
+            slot = self.wheel[index]
+            if not slot:
+                continue
+            self.wheel[index] = []
+            for key in slot:
+                bucket = self.buckets.get(key)
+                # Gone, or re-queued by a later hit (tick ≤ now: also after a jump)
+                if bucket is None or bucket[3] % self.WHEEL_SLOTS != index or bucket[3] > self.wheel_tick:
+                    continue
+                if bucket[2] <= now:
+                    del self.buckets[key]
+                    self.expired += 1
+                else:
+                    self._schedule(key, bucket)  # Not due yet (beyond the wheel span)
+
+    async def hit(self, key: str, tier: RateLimitTier) -> RateLimitResult:
+        now = time.monotonic()
+        self._advance(now)
+
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            bucket = [tier.capacity, now, 0.0, -1]
+            self.buckets[key] = bucket
+            if len(self.buckets) > self.max_keys:
+                self.buckets.popitem(last=False)
+                self.evicted += 1
+        else:
+            self.buckets.move_to_end(key)
+            # Refill tokens based on elapsed time
+            bucket[0] = min(tier.capacity, bucket[0] + (now - bucket[1]) * tier.refill_per_second)
+            bucket[1] = now
+
+        if bucket[0] < 1.0:
+            self.rejected += 1
+            return RateLimitResult(allowed=False, retry_after=_retry_after(bucket[0], tier))
+
+        # Consume a token; the bucket is full again (and can go) after idle_seconds
+        bucket[0] -= 1.0
+        bucket[2] = now + tier.idle_seconds
+        self._schedule(key, bucket)
+        return RateLimitResult(allowed=True)
+
+    async def close(self) -> None:
+        pass
+
+    def stats(self) -> dict:
+        return {
+            "backend": "memory",
+            "keys": len(self.buckets),
+            "max_keys": self.max_keys,
+            "expired": self.expired,
+            "evicted": self.evicted,
+            "rejected": self.rejected,
+        }
+
+
+# =============================================================================
+# Shared backend (Redis protocol)
+# =============================================================================
+
+# KEYS[1] bucket hash; ARGV: capacity, refill per second.
+# Returns {allowed (0/1), retry_after seconds}. Server clock (TIME), so all
+# replicas refill against the same time.
+_TOKEN_BUCKET_LUA = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1])
+local ts = tonumber(state[2])
+if tokens == nil or ts == nil then
+    tokens = capacity
+else
+    tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+end
+
+local allowed = 0
+local retry_after = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+else
+    retry_after = math.max(1, math.ceil((1 - tokens) / rate))
+end
+
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil(capacity / rate * 1000))
+return {allowed, retry_after}
+"""
+
+# Seconds between repeated "store unreachable" log lines
+_ERROR_LOG_INTERVAL = 60.0
+
+
+class RedisRateLimiter:
+    """Token buckets in a Redis-protocol store, one atomic script call per hit."""
+
+    def __init__(self, url: str, key_prefix: str = "rl:"):
+        self.client = redis_asyncio.from_url(url, socket_timeout=0.5, socket_connect_timeout=0.5)
+        self.script = self.client.register_script(_TOKEN_BUCKET_LUA)
+        self.key_prefix = key_prefix
+        self.errors = 0
+        self.rejected = 0
+        self._last_error_log = 0.0
+
+    async def hit(self, key: str, tier: RateLimitTier) -> RateLimitResult:
+        try:
+            allowed, retry_after = await self.script(
+                keys=[self.key_prefix + key],
+                args=[tier.capacity, tier.refill_per_second],
+            )
+        except Exception as e:
+            # Fail open: a limiter outage must not take the API down
+            self.errors += 1
+            now = time.monotonic()
+            if now - self._last_error_log > _ERROR_LOG_INTERVAL:
+                self._last_error_log = now
+                logger.error(f"Rate limit store unavailable, allowing requests: {type(e).__name__}: {e}")
+            return RateLimitResult(allowed=True)
+
+        if not allowed:
+            self.rejected += 1
+            return RateLimitResult(allowed=False, retry_after=int(retry_after))
+        return RateLimitResult(allowed=True)
+
+    async def close(self) -> None:
+        await self.client.aclose()
+
+    def stats(self) -> dict:
+        return {"backend": "redis", "errors": self.errors, "rejected": self.rejected}
+
+
+# =============================================================================
+# Configuration
+# =============================================================================
+
+_limiter: MemoryRateLimiter | RedisRateLimiter | None = None
+
+
+def get_rate_limit_tiers() -> dict[str, RateLimitTier]:
+    """Tiers from settings: public endpoints (no BFF secret) and everything else."""
+    settings = get_settings()
+    return {
+        "public": RateLimitTier("public", settings.rate_limit_public_per_minute),
+        "authenticated": RateLimitTier("authenticated", settings.rate_limit_authenticated_per_minute),
+    }
+
+
+def get_rate_limiter() -> MemoryRateLimiter | RedisRateLimiter:
+    """The configured limiter (created on first use)."""
+    global _limiter
+    if _limiter is None:
+        settings = get_settings()
+        if settings.rate_limit_backend == "redis":
+            if redis_asyncio is None:
+                logger.warning("RATE_LIMIT_BACKEND=redis but redis is not installed, using memory")
+            elif not settings.rate_limit_redis_url:
+                logger.warning("RATE_LIMIT_BACKEND=redis but RATE_LIMIT_REDIS_URL is not set, using memory")
+            else:
+                _limiter = RedisRateLimiter(settings.rate_limit_redis_url)
+        elif settings.rate_limit_backend != "memory":
+            logger.warning(f"Unknown RATE_LIMIT_BACKEND '{settings.rate_limit_backend}', using memory")
+        if _limiter is None:
+            _limiter = MemoryRateLimiter(settings.rate_limit_max_keys)
+    return _limiter
+
+
+async def close_rate_limiter() -> None:
+    """Close the store connection. Call on application shutdown."""
+    global _limiter
+    if _limiter is not None:
+        await _limiter.close()
+        _limiter = None
+
+
+def get_rate_limit_stats() -> Optional[dict]:
+    """Limiter state for /api/v1/health/cache (None before the first request)."""
+    if _limiter is None:
+        return None
+    return {
+        **_limiter.stats(),
+        "tiers": {name: tier.per_minute for name, tier in get_rate_limit_tiers().items()},
+    }
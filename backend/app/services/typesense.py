@@ -0,0 +1,341 @@
+"""
+Typesense client — the single call path for all Typesense searches.
+
+Used by modules.py (hybrid search, module autocomplete), search.py (global
+search bar) and public.py (homepage widget). Every caller treats an empty
+result as "fall back to PostgreSQL", so this module never raises: errors,
+timeouts and an open circuit all return empty results.
+
+Resilience:
+- Per-operation timeouts: "autocomplete" gives up fast, "search" (hybrid key
+  lookup) waits longer because its fallback is a slow regex scan.
+- Circuit breaker: after N consecutive failures, skip Typesense entirely for
+  a cooldown period instead of making every request wait for the timeout.
+- Hedged requests (optional): if no response after TYPESENSE_HEDGE_AFTER_MS,
+  send a duplicate and use whichever answers first. Searches are read-only,
+  so duplicates are safe.
+- Identical concurrent searches are coalesced (single-flight).
+"""
+import asyncio
+import logging
+import time
+import httpx
+
+from app.config import get_settings
+from app.services.cache import create_singleflight
+from app.services.http_client import get_http_client, get_http_pool_stats
+
+logger = logging.getLogger(__name__)
+
+OPERATIONS = ("autocomplete", "search")
+
+
+def _empty_result() -> dict:
+    return {"hits": [], "grouped_hits": []}
+
+
+# =============================================================================
+# Circuit Breaker
+# =============================================================================
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+
+    closed → (threshold consecutive failures) → open → (reset_seconds) →
+    half_open: one probe request is let through; success closes the circuit,
+    failure re-opens it for another reset period.
+
+    Not thread-safe — designed for a single asyncio event loop.
+    """
+
+    def __init__(self, failure_threshold: int, reset_seconds: float):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self._consecutive_failures = 0
+        self._opened_at: float | None = None
+        self._probe_in_flight = False
+        self.opened_count = 0
+        self.short_circuited = 0
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        if time.monotonic() - self._opened_at >= self.reset_seconds:
+            return "half_open"
+        return "open"
+
+    def allow(self) -> bool:
+        """Whether a request may be sent now."""
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "half_open" and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return True
+        self.short_circuited += 1
+        return False
+
+    def record_success(self) -> None:
+        if self._opened_at is not None:
+            logger.info("Typesense circuit closed (probe succeeded)")
+        self._consecutive_failures = 0
+        self._opened_at = None
+        self._probe_in_flight = False
+
+    def release_probe(self) -> None:
+        """Let another request probe (the current probe ended without a verdict)."""
+        self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        self._consecutive_failures += 1
+        if self._probe_in_flight or (
+            self._opened_at is None and self._consecutive_failures >= self.failure_threshold
+        ):
+            self._opened_at = time.monotonic()
+            self._probe_in_flight = False
+            self.opened_count += 1
+            logger.warning(
+                f"Typesense circuit open after {self._consecutive_failures} consecutive failures, "
+                f"falling back to PostgreSQL for {self.reset_seconds:.0f}s"
+            )
+
+    def stats(self) -> dict:
+        return {
+            "state": self.state,
+            "consecutive_failures": self._consecutive_failures,
+            "failure_threshold": self.failure_threshold,
+            "reset_seconds": self.reset_seconds,
+            "opened_count": self.opened_count,
+            "short_circuited": self.short_circuited,
+        }
+
+
+_breaker = CircuitBreaker(
+    failure_threshold=get_settings().typesense_breaker_failure_threshold,
+    reset_seconds=get_settings().typesense_breaker_reset_seconds,
+)
+
+# Identical concurrent searches (same request body) share one HTTP call —
+# autocomplete keystrokes and hybrid key lookups repeat across users.
+_flight = create_singleflight("typesense")
+
+# Request counters per operation (for /api/v1/health/typesense)
+_counters: dict[str, dict[str, int]] = {
+    op: {"requests": 0, "errors": 0, "timeouts": 0} for op in OPERATIONS
+}
+_hedge_counters = {"sent": 0, "won": 0}
+_in_flight = 0
+_peak_in_flight = 0
+
+
+# =============================================================================
+# Transport
+# =============================================================================
+
+def _timeout(operation: str) -> httpx.Timeout:
+    settings = get_settings()
+    read = (
+        settings.typesense_autocomplete_timeout_seconds
+        if operation == "autocomplete"
+        else settings.typesense_search_timeout_seconds
+    )
+    return httpx.Timeout(read, connect=settings.typesense_connect_timeout_seconds)
+
+
+async def _send(method: str, url: str, operation: str, **kwargs) -> httpx.Response:
+    """Send one request, tracking in-flight count."""
+    global _in_flight, _peak_in_flight
+    client = await get_http_client()
+    _in_flight += 1
+    _peak_in_flight = max(_peak_in_flight, _in_flight)
+    try:
+        return await client.request(method, url, timeout=_timeout(operation), **kwargs)
+    finally:
+        _in_flight -= 1
+
+
+async def _send_hedged(method: str, url: str, operation: str, **kwargs) -> httpx.Response:
+    """
+    Send a request; if it has not answered within the hedge delay, send a
+    duplicate and return whichever succeeds first (the other is cancelled).
+    """
+    hedge_after = get_settings().typesense_hedge_after_ms / 1000
+    if hedge_after <= 0:
+        return await _send(method, url, operation, **kwargs)
+
+    first = asyncio.ensure_future(_send(method, url, operation, **kwargs))
+    tasks = {first}
+    try:
+        done, _ = await asyncio.wait(tasks, timeout=hedge_after)
+        if not done:
+            _hedge_counters["sent"] += 1
+            tasks.add(asyncio.ensure_future(_send(method, url, operation, **kwargs)))
+
+        error: BaseException | None = None
+        pending = set(tasks)
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    if task is not first:
+                        _hedge_counters["won"] += 1
+                    return task.result()
+                error = error or task.exception()
+        raise error
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+
+
+async def _request(method: str, path: str, operation: str, **kwargs) -> dict | None:
+    """
+    Execute a Typesense request through the circuit breaker.
+
+    Returns parsed JSON, or None on any failure (caller returns empty results).
+    """
+    settings = get_settings()
+    if not settings.typesense_host or not settings.typesense_api_key:
+        logger.warning("Typesense not configured, falling back to empty results")
+        return None
+
+    if not _breaker.allow():
+        return None
+
+    url = f"{settings.typesense_protocol}://{settings.typesense_host}:{settings.typesense_port}{path}"
+    counters = _counters[operation]
+    counters["requests"] += 1
+
+    try:
+        response = await _send_hedged(
+            method, url, operation,
+            headers={"X-TYPESENSE-API-KEY": settings.typesense_api_key},
+            **kwargs,
+        )
+    except httpx.TimeoutException:
+        counters["timeouts"] += 1
+        _breaker.record_failure()
+        logger.warning(f"Typesense {operation} timeout ({path})")
+        return None
+    except httpx.RequestError as e:
+        counters["errors"] += 1
+        _breaker.record_failure()
+        logger.error(f"Typesense request error: {type(e).__name__}: {e}")
+        return None
+    except asyncio.CancelledError:
+        # Cancelled (shutdown): neither success nor failure, but free the probe slot
+        _breaker.release_probe()
+        raise
+    except Exception as e:
+        # Anything else (e.g. RuntimeError from a closed client): still a failure,
+        # so a half-open probe is released instead of blocking the breaker
+        counters["errors"] += 1
+        _breaker.record_failure()
+        logger.error(f"Typesense request failed: {type(e).__name__}: {e}")
+        return None
+
+    if response.status_code != 200:
+        counters["errors"] += 1
+        # 5xx/429 = Typesense unhealthy; 4xx = bad request (e.g. unknown collection)
+        if response.status_code >= 500 or response.status_code == 429:
+            _breaker.record_failure()
+        else:
+            _breaker.record_success()
+        logger.warning(f"Typesense returned {response.status_code} for {path}")
+        return None
+
+    _breaker.record_success()
+    try:
+        return response.json()
+    except ValueError as json_err:
+        counters["errors"] += 1
+        logger.error(f"Typesense returned invalid JSON: {json_err}")
+        return None
+
+
+# =============================================================================
+# Public API
+# =============================================================================
+
+async def typesense_search(collection: str, params: dict, operation: str = "search") -> dict:
+    """
+    Execute search against a Typesense collection.
+
+    Returns empty results on any error (network, timeout, non-200, open circuit)
+    so callers degrade to their PostgreSQL fallback. Coalesced per operation +
+    collection + params (an autocomplete never waits on a search timeout);
+    the returned dict is shared and must not be mutated.
+
+    Args:
+        collection: Typesense collection name
+        params: Search parameters (q, query_by, ...)
+        operation: "autocomplete" or "search" (selects the timeout)
+    """
+    key = ("search", operation, collection, tuple(sorted(params.items())))
+
+    async def _load() -> dict:
+        data = await _request("GET", f"/collections/{collection}/documents/search", operation, params=params)
+        return data if data is not None else _empty_result()
+
+    return await _flight.do(key, _load)
+
+
+async def typesense_multi_search(searches: list[dict], operation: str = "search") -> list[dict]:
+    """
+    Execute several searches in ONE Typesense round trip (POST /multi_search).
+
+    Each search is a params dict plus a "collection" key, e.g.
+    {"collection": "publiek", "q": "coa", "query_by": "regeling", ...}.
+
+    Returns one result per search, in order. Failed sub-searches (and a failed
+    request as a whole) yield empty results, like typesense_search().
+    Coalesced per operation + identical batch; returned dicts must not be mutated.
+    """
+    if not searches:
+        return []
+    key = ("multi_search", operation) + tuple(tuple(sorted(s.items())) for s in searches)
+
+    async def _load() -> list[dict]:
+        output = [_empty_result() for _ in searches]
+        data = await _request("POST", "/multi_search", operation, json={"searches": searches})
+        if data is None:
+            return output
+
+        # Errors are reported per sub-search (HTTP status is still 200)
+        for i, result in enumerate(data.get("results", [])[:len(searches)]):
+            if "error" in result:
+                search = searches[i]
+                logger.warning(
+                    f"Typesense multi_search failed for {search.get('collection')}/{search.get('query_by')}: "
+                    f"{result.get('code')} {result['error']}"
+                )
+            else:
+                output[i] = result
+        return output
+
+    return await _flight.do(key, _load)
+
+
+def get_typesense_stats() -> dict:
+    """Client statistics: pool utilization, breaker state, per-operation counters."""
+    settings = get_settings()
+    return {
+        "pool": get_http_pool_stats(),
+        "in_flight": _in_flight,
+        "peak_in_flight": _peak_in_flight,
+        "circuit_breaker": _breaker.stats(),
+        "operations": {
+            op: {
+                **counters,
+                "timeout_seconds": _timeout(op).read,
+            }
+            for op, counters in _counters.items()
+        },
+        "hedging": {
+            "enabled": settings.typesense_hedge_after_ms > 0,
+            "hedge_after_ms": settings.typesense_hedge_after_ms,
+            **_hedge_counters,
+        },
+    }
@@ -0,0 +1,4 @@
+import os
+
+# Settings require DATABASE_URL; the contract tests never connect
+os.environ.setdefault("DATABASE_URL", "postgresql://test@localhost/test")
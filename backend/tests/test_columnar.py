@@ -0,0 +1,166 @@
+"""
+Columnar engine (app/services/columnar.py) against hand-computed results.
+
+The expectations are what _get_from_aggregated_view returns for the same
+rows: ORDER BY sort, key (both DESC for a descending sort), count and totals
+over the filters only, the random threshold as a page-only condition.
+
+Run: cd backend && pytest tests
+"""
+from types import SimpleNamespace
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from app.services import modules  # noqa: E402
+from app.services.columnar import ColumnarTable  # noqa: E402
+
+YEARS = [2016, 2017]
+
+# In row-key order, like the load query (ORDER BY key).
+# primary_rank = rank under ORDER BY primary (database collation), key.
+RECORDS = [
+    {"key": "k1", "primary_value": "Beta", "primary_rank": 1, "y2016": 100, "y2017": 0, "totaal": 100,
+     "row_count": 2, "years_with_data": 1, "random_order": 0.5, "extra_regeling": "A", "extra_regeling_count": 1},
+    {"key": "k2", "primary_value": "alpha", "primary_rank": 0, "y2016": 50, "y2017": 50, "totaal": 100,
+     "row_count": 4, "years_with_data": 2, "random_order": 0.1, "extra_regeling": None, "extra_regeling_count": 1},
+    {"key": "k3", "primary_value": "Gamma", "primary_rank": 4, "y2016": 0, "y2017": 300, "totaal": 300,
+     "row_count": 6, "years_with_data": 1, "random_order": 0.9, "extra_regeling": "A", "extra_regeling_count": 3},
+    {"key": "k4", "primary_value": "delta", "primary_rank": 3, "y2016": 10, "y2017": None, "totaal": 10,
+     "row_count": 1, "years_with_data": 1, "random_order": 0.3, "extra_regeling": "B", "extra_regeling_count": 1},
+    {"key": "k5", "primary_value": "Beta", "primary_rank": 2, "y2016": 0, "y2017": 100, "totaal": 100,
+     "row_count": 1, "years_with_data": 1, "random_order": 0.7, "extra_regeling": None, "extra_regeling_count": None},
+]
+
+
+@pytest.fixture
+def table() -> ColumnarTable:
+    table = ColumnarTable("test", generation=1, years=YEARS, view_columns=["regeling"])
+    table.append(RECORDS[:3])  # Two batches, like the cursor load
+    table.append(RECORDS[3:])
+    table.finish()
+    return table
+
+
+def _keys(table: ColumnarTable, **kwargs) -> list[str]:
+    params = {"limit": 10, "offset": 0, **kwargs}
+    indices, _, _ = table.query(**params)
+    return [table.keys[i] for i in indices.tolist()]
+
+
+@pytest.mark.parametrize("sort_field,descending,expected", [
+    # Ties (totaal 100: k1, k2, k5) are broken by key, in the sort direction
+    ("totaal", True, ["k3", "k5", "k2", "k1", "k4"]),
+    ("totaal", False, ["k4", "k1", "k2", "k5", "k3"]),
+    ("y2017", True, ["k3", "k5", "k2", "k4", "k1"]),
+    ("primary", False, ["k2", "k1", "k5", "k4", "k3"]),
+    ("primary", True, ["k3", "k4", "k5", "k1", "k2"]),
+    ("random_order", False, ["k2", "k4", "k1", "k5", "k3"]),
+])
+def test_order_and_tie_breaking(table, sort_field, descending, expected):
+    assert _keys(table, sort_field=sort_field, descending=descending) == expected
+
+
+def test_pages_are_slices_of_the_full_order(table):
+    assert _keys(table, sort_field="totaal", descending=True, limit=2, offset=1) == ["k5", "k2"]
+    assert _keys(table, sort_field="totaal", descending=True, limit=2, offset=4) == ["k4"]
+    assert _keys(table, sort_field="totaal", descending=True, limit=2, offset=6) == []
+
+
+def test_filters_count_and_totals(table):
+    indices, total, totals = table.query(
+        sort_field="totaal", descending=True, limit=1, offset=0,
+        jaar=2016, min_bedrag=50, with_totals=True,
+    )
+    assert [table.keys[i] for i in indices.tolist()] == ["k2"]
+    assert total == 2  # k1, k2: not limited by the page
+    assert totals == {"years": {2016: 150, 2017: 50}, "totaal": 200}
+
+    assert _keys(table, sort_field="totaal", descending=True, min_years=2) == ["k2"]
+    assert _keys(table, sort_field="totaal", descending=True, max_bedrag=10) == ["k4"]
+
+
+def test_random_threshold_is_page_only(table):
+    indices, total, totals = table.query(
+        sort_field="random_order", descending=False, limit=10, offset=0,
+        random_threshold=0.4, with_totals=True,
+    )
+    assert [table.keys[i] for i in indices.tolist()] == ["k1", "k5", "k3"]
+    assert total == 5
+    assert totals["totaal"] == 610
+
+
+def test_rows(table):
+    assert table.rows(np.array([2, 4]), ["regeling"]) == [
+        {
+            "primary_value": "Gamma",
+            "years": {2016: 0, 2017: 300},
+            "totaal": 300,
+            "row_count": 6,
+            "extra_columns": {"regeling": "A"},
+            "extra_column_counts": {"regeling": 3},
+        },
+        {
+            "primary_value": "Beta",
+            "years": {2016: 0, 2017: 100},
+            "totaal": 100,
+            "row_count": 1,
+            "extra_columns": {"regeling": None},
+            "extra_column_counts": {"regeling": 1},
+        },
+    ]
+    assert table.rows(np.array([3])) == [
+        {"primary_value": "delta", "years": {2016: 10, 2017: 0}, "totaal": 10, "row_count": 1},
+    ]
+
+
+# =============================================================================
+# modules._get_from_columnar
+# =============================================================================
+
+@pytest.fixture
+def browse(monkeypatch, table):
+    monkeypatch.setattr(modules, "get_columnar_table", lambda module: table)
+
+    def _browse(sort_by="totaal", sort_order="desc", limit=10, offset=0, **filters):
+        return modules._get_from_columnar(
+            "test", filters.get("jaar"), filters.get("min_bedrag"), filters.get("max_bedrag"),
+            sort_by, sort_order, limit, offset, filters.get("min_years"), filters.get("columns"),
+        )
+    return _browse
+
+
+def test_random_first_page_uses_shared_threshold(monkeypatch, browse):
+    monkeypatch.setattr(modules, "random", SimpleNamespace(random=lambda: 0.5))
+    assert modules._random_threshold(0) == 0.45
+    assert modules._random_threshold(25) is None
+
+    rows, total, _, next_cursor = browse(sort_by="random")
+    assert [r["primary_value"] for r in rows] == ["Beta", "Beta", "Gamma"]  # random_order > 0.45
+    assert total == 5
+    assert next_cursor is None
+
+    # Later pages: OFFSET over the full random order, sort_order is ignored
+    rows, _, _, _ = browse(sort_by="random", sort_order="desc", limit=2, offset=1)
+    assert [r["primary_value"] for r in rows] == ["delta", "Beta"]
+
+
+def test_year_sort_and_cursor(browse):
+    rows, total, totals, next_cursor = browse(sort_by="y2017", limit=2)
+    assert [r["primary_value"] for r in rows] == ["Gamma", "Beta"]
+    assert totals is None
+    assert modules._decode_cursor(next_cursor, "y2017", "desc", numeric_sort=True, key_count=1) == [100.0, "k5"]
+
+
+@pytest.mark.parametrize("sort_by", ["y2015", "y", "relevance", "totaal; DROP TABLE x"])
+def test_invalid_sort_by_rejected(browse, sort_by):
+    with pytest.raises(ValueError):
+        browse(sort_by=sort_by)
+    with pytest.raises(ValueError):
+        modules._sort_year(sort_by)
+
+
+def test_sort_year():
+    assert modules._sort_year("y2024") == 2024
+    assert modules._sort_year("primary") is None
@@ -0,0 +1,120 @@
+"""
+GenerationReloader (app/services/cache.py): background loads per dataset
+generation for the columnar engine and the facet index.
+
+Run: cd backend && pytest tests
+"""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.services import cache
+from app.services.cache import GenerationReloader
+
+
+@pytest.fixture(autouse=True)
+def generation(monkeypatch):
+    """Generation 1, listeners registered by the test are dropped afterwards."""
+    monkeypatch.setattr(cache, "_data_generation", 1)
+    monkeypatch.setattr(cache, "_generation_listeners", [])
+    monkeypatch.setattr(cache, "_caches", [])
+
+
+class Loader:
+    """Load function whose loads can be held until release()."""
+
+    def __init__(self):
+        self.calls = []
+        self.gate = asyncio.Event()
+        self.gate.set()
+        self.fail = set()
+
+    async def __call__(self, name, source, generation):
+        self.calls.append((name, generation))
+        await self.gate.wait()
+        if name in self.fail:
+            raise RuntimeError("load failed")
+        return SimpleNamespace(generation=generation, stats=lambda: {"source": source})
+
+
+async def _settle(reloader: GenerationReloader) -> None:
+    while reloader._task is not None and not reloader._task.done():
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_loads_current_generation():
+    loader = Loader()
+    reloader = GenerationReloader("test-reload", "Test", loader)
+    assert reloader.get("a") is None
+
+    reloader.start({"a": "source-a", "b": "source-b"})
+    await _settle(reloader)
+
+    assert reloader.get("a").generation == 1
+    stats = reloader.stats()
+    assert stats["enabled"] and not stats["loading"]
+    assert stats["tables"]["b"] == {"source": "source-b", "current": True}
+
+
+@pytest.mark.asyncio
+async def test_generation_change_hides_stale_and_reloads():
+    loader = Loader()
+    reloader = GenerationReloader("test-reload", "Test", loader)
+    reloader.start({"a": "source-a"})
+    await _settle(reloader)
+
+    loader.gate.clear()
+    cache.set_data_generation(2)
+    assert reloader.get("a") is None  # Stale until the reload finishes
+    assert reloader.stats()["tables"]["a"]["current"] is False
+
+    loader.gate.set()
+    await _settle(reloader)
+    assert reloader.get("a").generation == 2
+
+
+@pytest.mark.asyncio
+async def test_change_during_load_reruns_and_never_publishes_older():
+    loader = Loader()
+    loader.gate.clear()
+    reloader = GenerationReloader("test-reload", "Test", loader)
+    reloader.start({"a": "source-a"})
+    await asyncio.sleep(0)
+
+    cache.set_data_generation(2)  # While generation 1 is loading
+    cache.set_data_generation(3)
+    assert reloader.stats()["loading"]
+
+    loader.gate.set()
+    await _settle(reloader)
+
+    assert loader.calls == [("a", 1), ("a", 3)]
+    assert set(reloader.loaded) == {"a"}
+    assert reloader.get("a").generation == 3
+
+
+@pytest.mark.asyncio
+async def test_failed_source_does_not_block_others():
+    loader = Loader()
+    loader.fail.add("a")
+    reloader = GenerationReloader("test-reload", "Test", loader)
+    reloader.start({"a": "source-a", "b": "source-b"})
+    await _settle(reloader)
+
+    assert reloader.get("a") is None
+    assert reloader.get("b").generation == 1
+
+
+@pytest.mark.asyncio
+async def test_stop_cancels_running_load():
+    loader = Loader()
+    loader.gate.clear()
+    reloader = GenerationReloader("test-reload", "Test", loader)
+    reloader.start({"a": "source-a"})
+    await asyncio.sleep(0)
+
+    await reloader.stop()
+    assert not reloader.stats()["loading"]
+    assert reloader.get("a") is None
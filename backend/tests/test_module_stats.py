@@ -0,0 +1,93 @@
+"""
+Module stats for the search placeholder (modules.get_module_stats):
+stale-while-revalidate per data generation, with a backoff after a failed
+background reload.
+
+Run: cd backend && pytest tests
+"""
+from types import SimpleNamespace
+
+import pytest
+
+from app.services import modules
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+class FakeStatsTable:
+    """Stand-in for fetch_all on module_stats (raises while .error is set)."""
+
+    def __init__(self):
+        self.calls = 0
+        self.entity_count = 5
+        self.error: Exception | None = None
+
+    async def __call__(self, query, *args):
+        self.calls += 1
+        if self.error is not None:
+            raise self.error
+        return [{"module": "instrumenten", "entity_count": self.entity_count, "total": 2_000_000}]
+
+
+@pytest.fixture
+def env(monkeypatch):
+    clock = FakeClock()
+    table = FakeStatsTable()
+    generation = [1]
+    monkeypatch.setattr(modules, "time", SimpleNamespace(monotonic=clock.monotonic))
+    monkeypatch.setattr(modules, "fetch_all", table)
+    monkeypatch.setattr(modules, "get_data_generation", lambda: generation[0])
+    monkeypatch.setattr(modules, "_module_stats", {})
+    monkeypatch.setattr(modules, "_module_stats_generation", None)
+    monkeypatch.setattr(modules, "_module_stats_task", None)
+    monkeypatch.setattr(modules, "_module_stats_failed_at", None)
+    return SimpleNamespace(clock=clock, table=table, generation=generation)
+
+
+async def _stats() -> dict:
+    result = await modules.get_module_stats("instrumenten")
+    if modules._module_stats_task is not None:
+        await modules._module_stats_task
+    return result
+
+
+@pytest.mark.asyncio
+async def test_serves_stale_stats_while_reloading(env):
+    assert (await _stats())["count"] == 5
+
+    env.generation[0] = 2
+    env.table.entity_count = 7
+    assert (await _stats())["count"] == 5  # Previous generation, reload in the background
+    assert (await _stats())["count"] == 7
+    assert env.table.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_reload_backs_off(env):
+    await _stats()
+    env.generation[0] = 2
+    env.table.error = RuntimeError('relation "module_stats" does not exist')
+
+    assert (await _stats())["count"] == 5
+    assert env.table.calls == 2
+
+    # Within the backoff: no new query per request
+    env.clock.now += modules._MODULE_STATS_RETRY_SECONDS - 1
+    for _ in range(3):
+        assert (await _stats())["count"] == 5
+    assert env.table.calls == 2
+
+    # After the backoff: one retry, which succeeds
+    env.clock.now += 1
+    env.table.error = None
+    env.table.entity_count = 7
+    await _stats()
+    assert env.table.calls == 3
+    assert modules._module_stats_failed_at is None
+    assert (await _stats())["count"] == 7
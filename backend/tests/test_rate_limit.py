@@ -0,0 +1,262 @@
+"""
+Rate limiter backends (app/services/rate_limit.py).
+
+Memory backend: token bucket, Retry-After, timer wheel expiry and LRU
+eviction, on a fake clock. Redis backend: the Lua token bucket on fakeredis
+(pip install "fakeredis[lua]"; skipped without it), shared by two limiter
+instances like two replicas, and fail-open when the store is unreachable.
+Middleware: buckets are keyed on the proxy-appended client IP.
+
+Run: cd backend && pytest tests
+"""
+from types import SimpleNamespace
+
+import pytest
+
+from app import main
+from app.services import rate_limit
+from app.services.rate_limit import MemoryRateLimiter, RateLimitTier, RedisRateLimiter
+
+PER_SECOND = RateLimitTier("test", 60)  # 1 token per second, burst 60
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    fake = FakeClock()
+    monkeypatch.setattr(rate_limit, "time", SimpleNamespace(monotonic=fake.monotonic))
+    return fake
+
+
+async def _hits(limiter, key: str, tier: RateLimitTier, n: int) -> list:
+    return [await limiter.hit(key, tier) for _ in range(n)]
+
+
+# =============================================================================
+# Memory backend
+# =============================================================================
+
+@pytest.mark.asyncio
+async def test_burst_then_refill(clock):
+    limiter = MemoryRateLimiter(max_keys=100)
+
+    results = await _hits(limiter, "a", PER_SECOND, 61)
+    assert all(r.allowed for r in results[:60])
+    assert not results[60].allowed
+    assert results[60].retry_after == 1
+
+    clock.now += 0.5
+    assert not (await limiter.hit("a", PER_SECOND)).allowed
+    clock.now += 0.5
+    assert (await limiter.hit("a", PER_SECOND)).allowed
+    assert not (await limiter.hit("a", PER_SECOND)).allowed
+    assert limiter.stats()["rejected"] == 3
+
+
+@pytest.mark.asyncio
+async def test_retry_after_follows_refill_rate(clock):
+    limiter = MemoryRateLimiter(max_keys=100)
+    slow = RateLimitTier("slow", 6)  # one token per 10 seconds
+
+    results = await _hits(limiter, "a", slow, 7)
+    assert results[6].retry_after == 10
+
+    clock.now += 4
+    assert (await limiter.hit("a", slow)).retry_after == 6
+
+
+@pytest.mark.asyncio
+async def test_keys_are_independent(clock):
+    limiter = MemoryRateLimiter(max_keys=100)
+    await _hits(limiter, "a", PER_SECOND, 60)
+
+    assert not (await limiter.hit("a", PER_SECOND)).allowed
+    assert (await limiter.hit("b", PER_SECOND)).allowed
+
+
+@pytest.mark.asyncio
+async def test_idle_bucket_expires(clock):
+    limiter = MemoryRateLimiter(max_keys=100)
+    await limiter.hit("a", PER_SECOND)
+
+    clock.now += PER_SECOND.idle_seconds + 1
+    await limiter.hit("b", PER_SECOND)  # Any request advances the wheel
+
+    assert "a" not in limiter.buckets
+    assert limiter.stats()["expired"] == 1
+
+
+@pytest.mark.asyncio
+async def test_hit_again_is_not_expired_by_stale_slot(clock):
+    limiter = MemoryRateLimiter(max_keys=100)
+    await limiter.hit("a", PER_SECOND)
+    clock.now += 30
+    await limiter.hit("a", PER_SECOND)  # Re-queued 30 s later; first slot is stale
+
+    clock.now += 31  # Past the first expiry, not the second
+    await limiter.hit("b", PER_SECOND)
+    assert "a" in limiter.buckets
+
+    clock.now += 30
+    await limiter.hit("b", PER_SECOND)
+    assert "a" not in limiter.buckets
+    assert limiter.stats()["expired"] == 1
+
+
+@pytest.mark.asyncio
+async def test_expiry_after_jump_beyond_wheel_span(clock):
+    limiter = MemoryRateLimiter(max_keys=100)
+    for key in ("a", "b", "c"):
+        await limiter.hit(key, PER_SECOND)
+
+    clock.now += MemoryRateLimiter.WHEEL_SLOTS * 10  # No requests for a long time
+    await limiter.hit("d", PER_SECOND)
+
+    assert set(limiter.buckets) == {"d"}
+    assert limiter.stats()["expired"] == 3
+
+
+@pytest.mark.asyncio
+async def test_expired_bucket_starts_full(clock):
+    limiter = MemoryRateLimiter(max_keys=100)
+    await _hits(limiter, "a", PER_SECOND, 60)
+
+    clock.now += PER_SECOND.idle_seconds + 1
+    results = await _hits(limiter, "a", PER_SECOND, 60)
+    assert all(r.allowed for r in results)
+
+
+@pytest.mark.asyncio
+async def test_least_recently_seen_key_is_evicted(clock):
+    limiter = MemoryRateLimiter(max_keys=2)
+    await limiter.hit("a", PER_SECOND)
+    await limiter.hit("b", PER_SECOND)
+    await limiter.hit("a", PER_SECOND)  # a is now the most recent
+    await limiter.hit("c", PER_SECOND)
+
+    assert set(limiter.buckets) == {"a", "c"}
+    assert limiter.stats()["evicted"] == 1
+
+    # Evicted keys leave stale wheel entries behind: expiry must skip them
+    clock.now += PER_SECOND.idle_seconds + 1
+    await limiter.hit("d", PER_SECOND)
+    assert set(limiter.buckets) == {"d"}
+    assert limiter.stats()["expired"] == 2
+
+
+# =============================================================================
+# Redis backend
+# =============================================================================
+
+@pytest.fixture
+def shared_store(monkeypatch):
+    """Every RedisRateLimiter created in the test talks to one fake server."""
+    pytest.importorskip("redis")
+    fakeredis = pytest.importorskip("fakeredis")
+    pytest.importorskip("lupa")  # Lua scripting (fakeredis[lua])
+
+    server = fakeredis.FakeServer()
+    monkeypatch.setattr(
+        rate_limit.redis_asyncio, "from_url",
+        lambda url, **kwargs: fakeredis.FakeAsyncRedis(server=server),
+    )
+    return server
+
+
+@pytest.mark.asyncio
+async def test_limit_is_shared_across_instances(shared_store):
+    replica_a = RedisRateLimiter("redis://stand-in")
+    replica_b = RedisRateLimiter("redis://stand-in")
+    tier = RateLimitTier("public", 10)
+
+    results = [
+        await (replica_a if i % 2 else replica_b).hit("public:198.51.100.7", tier)
+        for i in range(11)
+    ]
+    assert all(r.allowed for r in results[:10])
+    assert not results[10].allowed
+    assert results[10].retry_after == 6  # One token per 6 seconds
+
+    # Other clients have their own bucket
+    assert (await replica_a.hit("public:198.51.100.8", tier)).allowed
+    assert replica_a.stats()["rejected"] + replica_b.stats()["rejected"] == 1
+
+    # Idle buckets expire in the store
+    ttl = await replica_a.client.pttl("rl:public:198.51.100.7")
+    assert 0 < ttl <= tier.idle_seconds * 1000
+
+    await replica_a.close()
+    await replica_b.close()
+
+
+@pytest.mark.asyncio
+async def test_unreachable_store_fails_open():
+    pytest.importorskip("redis")
+    limiter = RedisRateLimiter("redis://127.0.0.1:1/0")  # Nothing listens on port 1
+    tier = RateLimitTier("public", 1)
+
+    results = await _hits(limiter, "public:198.51.100.7", tier, 3)
+    assert all(r.allowed for r in results)
+    assert limiter.stats()["errors"] == 3
+
+    await limiter.close()
+
+
+# =============================================================================
+# Middleware: client IP
+# =============================================================================
+
+def _scope(*forwarded: str, client=("192.0.2.1", 51234)) -> dict:
+    headers = [(b"x-forwarded-for", value.encode()) for value in forwarded]
+    return {"type": "http", "headers": headers, "client": client}
+
+
+def _middleware(trusted_proxies: int) -> main.RateLimitMiddleware:
+    middleware = main.RateLimitMiddleware(app=None)
+    middleware.trusted_proxies = trusted_proxies
+    return middleware
+
+
+@pytest.mark.parametrize("trusted_proxies,forwarded,expected", [
+    (1, ["203.0.113.9"], "203.0.113.9"),
+    # Client-sent entries (left of the proxy's) are ignored
+    (1, ["10.0.0.1, 203.0.113.9"], "203.0.113.9"),
+    (1, ["10.0.0.1", "203.0.113.9"], "203.0.113.9"),  # Repeated header
+    (2, ["10.0.0.1, 203.0.113.9, 198.51.100.2"], "203.0.113.9"),
+    # Fewer entries than proxies, no header, proxies not trusted: connecting address
+    (2, ["203.0.113.9"], "192.0.2.1"),
+    (1, [], "192.0.2.1"),
+    (0, ["203.0.113.9"], "192.0.2.1"),
+])
+def test_client_ip(trusted_proxies, forwarded, expected):
+    assert _middleware(trusted_proxies)._get_client_ip(_scope(*forwarded)) == expected
+
+
+@pytest.mark.asyncio
+async def test_spoofed_forwarded_for_shares_one_bucket(monkeypatch, clock):
+    limiter = MemoryRateLimiter(max_keys=100)
+    monkeypatch.setattr(main, "get_rate_limiter", lambda: limiter)
+    sent = []
+
+    async def app(scope, receive, send):
+        sent.append(scope["path"])
+
+    async def send(message):
+        pass
+
+    middleware = main.RateLimitMiddleware(app)
+    middleware.trusted_proxies = 1
+    tier = middleware.tiers["public"]
+    for i in range(tier.per_minute + 5):
+        scope = {**_scope(f"10.0.{i // 256}.{i % 256}, 203.0.113.9"), "path": "/api/v1/public/search", "method": "GET"}
+        await middleware(scope, None, send)
+
+    assert len(sent) == tier.per_minute
+    assert limiter.stats()["rejected"] == 5
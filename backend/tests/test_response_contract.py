@@ -0,0 +1,190 @@
+"""
+Contract: the orjson fast path (app/api/responses.py) returns the same bytes
+as FastAPI serializing the response model.
+
+Payloads have the shapes the service layer returns (app/services/modules.py).
+When a service function starts returning a new field or value type, add it
+here.
+
+Run: cd backend && pytest tests
+"""
+from decimal import Decimal
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api import responses
+from app.api.responses import FastJSONResponse, model_response
+from app.api.v1 import modules as modules_api
+from app.api.v1.modules import (
+    AutocompleteResponse,
+    BatchDetailsResponse,
+    DetailResponse,
+    ModuleResponse,
+)
+from app.services.modules import YEARS
+
+pytestmark = pytest.mark.skipif(responses.orjson is None, reason="orjson not installed")
+
+
+def _years(*amounts: int) -> dict[int, int]:
+    return {year: amounts[i] if i < len(amounts) else 0 for i, year in enumerate(YEARS)}
+
+
+MODULE_ROWS = [
+    # Default browsing with extra columns
+    {
+        "primary_value": "Stichting Rijksmuseum",
+        "years": _years(1_250_000, 0, 3_400_000_000, -12),
+        "totaal": 3_401_249_988,
+        "row_count": 42,
+        "extra_columns": {"regeling": "Erfgoedwet", "artikel": None},
+        "extra_column_counts": {"regeling": 3, "artikel": 1},
+        "data_available_from": 2016,
+        "data_available_to": 2024,
+    },
+    # Search: matched field, secondary match, no extra columns
+    {
+        "primary_value": 'Gemeente \'s-Hertogenbosch "Bossche" Bröderie  \x1f',
+        "years": _years(),
+        "totaal": 0,
+        "row_count": 1,
+        "matched_field": "regeling",
+        "matched_value": "Specifieke uitkering € sport",
+        "is_secondary_match": True,
+    },
+    # Integraal: module badges, extra_columns None
+    {
+        "primary_value": "ProRail B.V.",
+        "years": _years(*range(9)),
+        "totaal": 36,
+        "row_count": 7,
+        "modules": ["Financiële Instrumenten", "Inkoopuitgaven"],
+        "data_available_from": 2017,
+        "data_available_to": 2024,
+        "extra_columns": None,
+    },
+]
+
+MODULE_META = {
+    "total": 12345,
+    "limit": 25,
+    "offset": 0,
+    "query": "rijksmuseum",
+    "elapsed_ms": 12.35,
+    "years": YEARS,
+    "next_cursor": None,
+    "totals": {"years": _years(5, 6), "totaal": 11},
+}
+
+DETAIL_ROWS = [
+    {"group_by": "regeling", "group_value": "Subsidieregeling ß", "years": _years(10, 20), "totaal": 30, "row_count": 2},
+    {"group_by": "regeling", "group_value": None, "years": _years(), "totaal": 0, "row_count": 0},
+]
+
+CASES = [
+    pytest.param(ModuleResponse, {
+        "success": True,
+        "module": "instrumenten",
+        "primary_field": "ontvanger",
+        "data": MODULE_ROWS,
+        "meta": MODULE_META,
+    }, id="module"),
+    pytest.param(ModuleResponse, {
+        "success": True,
+        "module": "apparaat",
+        "primary_field": "kostensoort",
+        "data": [],
+        "meta": {**MODULE_META, "elapsed_ms": 3.0, "query": None, "next_cursor": "eyJ0IjoxfQ"},
+    }, id="module-empty"),
+    pytest.param(DetailResponse, {
+        "success": True,
+        "module": "instrumenten",
+        "primary_value": "Stichting Rijksmuseum",
+        "details": DETAIL_ROWS,
+    }, id="details"),
+    pytest.param(BatchDetailsResponse, {
+        "success": True,
+        "module": "instrumenten",
+        "results": {
+            "Stichting Rijksmuseum": {"details": DETAIL_ROWS, "grouping_counts": {"regeling": 2, "artikel": 1}},
+            "Onbekend": {"details": [], "grouping_counts": {}},
+        },
+    }, id="details-batch"),
+    pytest.param(BatchDetailsResponse, {
+        "success": True,
+        "module": "integraal",
+        # Integraal: no grouping_counts key (model default)
+        "results": {"ProRail B.V.": {"details": DETAIL_ROWS}},
+    }, id="details-batch-integraal"),
+    pytest.param(AutocompleteResponse, {
+        "success": True,
+        "current_module": [
+            {"name": "ProRail B.V.", "totaal": 987654321, "modules": [], "match_type": "prefix"},
+            {"name": "Prorail", "totaal": 0, "modules": ["Inkoopuitgaven"], "match_type": None},
+        ],
+        # Extra keys from the service layer are not part of the response
+        "field_matches": [{"value": "Spoorwegen", "field": "regeling", "score": 3}],
+        "other_modules": [{"name": "ProRail", "modules": ["Provinciale subsidieregisters"]}, {"name": "Pro"}],
+    }, id="autocomplete"),
+]
+
+
+def _contract_app(model, data) -> FastAPI:
+    """Same route twice: model path (as before) and fast path."""
+    app = FastAPI()
+
+    @app.get("/model", response_model=model)
+    async def model_path():
+        return model.model_validate(data)
+
+    @app.get("/fast", response_model=model)
+    async def fast_path():
+        return model_response(model, data)
+
+    return app
+
+
+@pytest.mark.parametrize("model,data", CASES)
+def test_fast_path_bytes_match_response_model(model, data):
+    assert isinstance(model_response(model, data), FastJSONResponse)
+
+    client = TestClient(_contract_app(model, data))
+    expected = client.get("/model")
+    actual = client.get("/fast")
+
+    assert actual.status_code == expected.status_code == 200
+    assert actual.headers["content-type"] == expected.headers["content-type"]
+    assert actual.content == expected.content
+
+
+def test_unserializable_value_falls_back_to_model():
+    data = {
+        "module": "instrumenten",
+        "primary_value": "x",
+        "details": [{**DETAIL_ROWS[0], "totaal": Decimal("30")}],
+    }
+    result = model_response(DetailResponse, data)
+    assert isinstance(result, DetailResponse)
+    assert result.details[0].totaal == 30
+
+
+def test_disabled_uses_model(monkeypatch):
+    monkeypatch.setattr(responses, "orjson", None)
+    data = {"module": "instrumenten", "primary_value": "x", "details": DETAIL_ROWS}
+    assert isinstance(model_response(DetailResponse, data), DetailResponse)
+
+
+def test_openapi_schema_keeps_response_models():
+    app = FastAPI()
+    app.include_router(modules_api.router, prefix="/api/v1/modules")
+    paths = app.openapi()["paths"]
+
+    def schema_ref(path: str, method: str) -> str:
+        return paths[path][method]["responses"]["200"]["content"]["application/json"]["schema"]["$ref"]
+
+    assert schema_ref("/api/v1/modules/{module}", "get").endswith("/ModuleResponse")
+    assert schema_ref("/api/v1/modules/{module}/autocomplete", "get").endswith("/AutocompleteResponse")
+    assert schema_ref("/api/v1/modules/{module}/{primary_value}/details", "get").endswith("/DetailResponse")
+    assert schema_ref("/api/v1/modules/{module}/details/batch", "post").endswith("/BatchDetailsResponse")
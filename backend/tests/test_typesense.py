@@ -0,0 +1,113 @@
+"""
+Typesense circuit breaker (app/services/typesense.py).
+
+The breaker on a fake clock, and _request() with a failing transport: every
+failure mode must return None and leave the breaker able to probe again.
+
+Run: cd backend && pytest tests
+"""
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from app.services import http_client, typesense
+from app.services.typesense import CircuitBreaker
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    fake = FakeClock()
+    monkeypatch.setattr(typesense, "time", SimpleNamespace(monotonic=fake.monotonic))
+    return fake
+
+
+@pytest.fixture
+def breaker(monkeypatch, clock) -> CircuitBreaker:
+    """Fresh breaker (threshold 2, reset 30 s) and a configured Typesense host."""
+    fresh = CircuitBreaker(failure_threshold=2, reset_seconds=30)
+    settings = typesense.get_settings().model_copy(update={
+        "typesense_host": "typesense.test",
+        "typesense_api_key": "test",
+        "typesense_hedge_after_ms": 0,
+    })
+    monkeypatch.setattr(typesense, "_breaker", fresh)
+    monkeypatch.setattr(typesense, "get_settings", lambda: settings)
+    return fresh
+
+
+def _failing_send(error: BaseException):
+    async def _send_hedged(*args, **kwargs):
+        raise error
+    return _send_hedged
+
+
+def test_opens_after_threshold_and_probes_after_reset(clock):
+    breaker = CircuitBreaker(failure_threshold=2, reset_seconds=30)
+    breaker.record_failure()
+    assert breaker.state == "closed"
+    breaker.record_failure()
+    assert breaker.state == "open"
+    assert not breaker.allow()
+
+    clock.now += 30
+    assert breaker.state == "half_open"
+    assert breaker.allow()
+    assert not breaker.allow()  # One probe at a time
+
+    breaker.record_success()
+    assert breaker.state == "closed"
+    assert breaker.allow()
+
+
+def test_failed_probe_reopens(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_seconds=30)
+    breaker.record_failure()
+    clock.now += 30
+    assert breaker.allow()
+
+    breaker.record_failure()
+    assert breaker.state == "open"
+    assert breaker.opened_count == 2
+
+    clock.now += 30
+    assert breaker.allow()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("error", [
+    httpx.ConnectError("refused"),
+    httpx.ReadTimeout("slow"),
+    RuntimeError("Cannot send a request, as the client has been closed."),
+], ids=["request-error", "timeout", "unexpected"])
+async def test_failed_probe_releases_breaker(monkeypatch, clock, breaker, error):
+    monkeypatch.setattr(typesense, "_send_hedged", _failing_send(error))
+    for _ in range(breaker.failure_threshold):
+        assert await typesense._request("GET", "/health", "search") is None
+    assert breaker.state == "open"
+
+    clock.now += breaker.reset_seconds
+    assert await typesense._request("GET", "/health", "search") is None  # The probe
+    assert breaker.state == "open"
+    assert not breaker._probe_in_flight
+
+    clock.now += breaker.reset_seconds
+    assert breaker.allow()
+
+
+def test_pool_stats_survive_httpcore_changes(monkeypatch):
+    # A pool whose connections no longer have the expected methods
+    pool = SimpleNamespace(connections=[object()], _requests=[])
+    monkeypatch.setattr(http_client, "_http_client", SimpleNamespace(_transport=SimpleNamespace(_pool=pool)))
+
+    stats = http_client.get_http_pool_stats()
+    assert stats["connections"] is None
+    assert stats["max_connections"] == http_client.get_settings().typesense_max_connections
@@ -3,6 +3,7 @@
 -- Description: Single function to refresh all materialized views
 -- Created: 2026-01-26
 -- Usage: SELECT refresh_all_views();
+-- NOTE: Superseded by 077-data-generation.sql (also bumps data_generation)
 -- =====================================================
 
 CREATE OR REPLACE FUNCTION refresh_all_views()
@@ -0,0 +1,72 @@
+-- Migration 077: Dataset generation tracking
+--
+-- The API caches table pages, stats and filter options in-process. Those
+-- caches need a signal that the materialized views were refreshed.
+--
+-- data_generation holds a single monotonically increasing counter.
+-- bump_data_generation() increments it and sends pg_notify on channel
+-- 'data_generation' (payload = new generation). Notifications are delivered
+-- at COMMIT, so listeners only see the bump once the refreshed data is visible.
+--
+-- Every backend replica LISTENs on the channel (see app/services/generation.py)
+-- and also polls the table as a fallback for missed notifications.
+--
+-- Execute on Supabase BEFORE deploying code.
+
+CREATE TABLE IF NOT EXISTS data_generation (
+  id INT PRIMARY KEY DEFAULT 1 CHECK (id = 1),  -- single-row table
+  generation BIGINT NOT NULL DEFAULT 1,
+  refreshed_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+INSERT INTO data_generation (id, generation) VALUES (1, 1)
+ON CONFLICT (id) DO NOTHING;
+
+-- RLS: backend-only, like the API views (031). No policies: only the backend
+-- role (table owner) reads it. DROP POLICY removes the public read policy of
+-- an earlier run of this migration.
+ALTER TABLE data_generation ENABLE ROW LEVEL SECURITY;
+DROP POLICY IF EXISTS "Public read" ON data_generation;
+REVOKE ALL ON data_generation FROM anon, authenticated;
+
+-- Increment generation + notify all listening API replicas
+CREATE OR REPLACE FUNCTION bump_data_generation()
+RETURNS BIGINT AS $$
+DECLARE
+    new_generation BIGINT;
+BEGIN
+    UPDATE data_generation
+    SET generation = generation + 1,
+        refreshed_at = now()
+    WHERE id = 1
+    RETURNING generation INTO new_generation;
+
+    PERFORM pg_notify('data_generation', new_generation::text);
+    RETURN new_generation;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Recreate refresh_all_views() (010) so it also bumps the generation
+CREATE OR REPLACE FUNCTION refresh_all_views()
+RETURNS TEXT AS $$
+BEGIN
+    -- Refresh aggregated views (for API performance)
+    REFRESH MATERIALIZED VIEW instrumenten_aggregated;
+    REFRESH MATERIALIZED VIEW apparaat_aggregated;
+    REFRESH MATERIALIZED VIEW inkoop_aggregated;
+    REFRESH MATERIALIZED VIEW provincie_aggregated;
+    REFRESH MATERIALIZED VIEW gemeente_aggregated;
+    REFRESH MATERIALIZED VIEW publiek_aggregated;
+
+    -- Refresh cross-module search view (with entity resolution)
+    REFRESH MATERIALIZED VIEW CONCURRENTLY universal_search;
+
+    -- Invalidate API caches
+    PERFORM bump_data_generation();
+
+    RETURN 'All views refreshed successfully';
+END;
+$$ LANGUAGE plpgsql;
+
+-- Verify
+SELECT generation, refreshed_at FROM data_generation;
@@ -0,0 +1,106 @@
+-- Migration 078: Keyset pagination indexes
+--
+-- The API pages browse views with a cursor (last sort value + unique key):
+--   WHERE (totaal, ontvanger_key) < ($1, $2)
+--   ORDER BY totaal DESC, ontvanger_key DESC
+--   LIMIT 25
+-- A composite (sort column, key) B-tree index turns every page into an index
+-- seek, at any depth. DESC order is served by scanning the index backwards.
+--
+-- Key columns (unique per view row):
+--   instrumenten/provincie/gemeente/publiek_aggregated: ontvanger_key
+--     (per-entity views 028: ontvanger_key + entity column)
+--   inkoop_aggregated: leverancier_key
+--   apparaat_aggregated: kostensoort
+--   universal_search: ontvanger_key
+--
+-- Year-column sorts get indexes on the two largest views only (instrumenten,
+-- universal_search); the smaller views sort in memory fast enough.
+--
+-- Indexes survive REFRESH MATERIALIZED VIEW, but must be recreated if a view
+-- is dropped and recreated by a later migration.
+--
+-- Execute on Supabase BEFORE deploying code (CONCURRENTLY: no table lock,
+-- run statements one by one outside a transaction).
+
+
+-- =====================================================
+-- universal_search (integraal)
+-- =====================================================
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_universal_search_totaal_key
+ON universal_search (totaal, ontvanger_key);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_universal_search_ontvanger_key
+ON universal_search (ontvanger, ontvanger_key);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_universal_search_record_count_key
+ON universal_search (record_count, ontvanger_key);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_universal_search_2016_key
+ON universal_search ("2016", ontvanger_key);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_universal_search_2017_key
+ON universal_search ("2017", ontvanger_key);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_universal_search_2018_key
+ON universal_search ("2018", ontvanger_key);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_universal_search_2019_key
+ON universal_search ("2019", ontvanger_key);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_universal_search_2020_key
+ON universal_search ("2020", ontvanger_key);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_universal_search_2021_key
+ON universal_search ("2021", ontvanger_key);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_universal_search_2022_key
+ON universal_search ("2022", ontvanger_key);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_universal_search_2023_key
+ON universal_search ("2023", ontvanger_key);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_universal_search_2024_key
+ON universal_search ("2024", ontvanger_key);
+
+-- =====================================================
+-- instrumenten_aggregated
+-- =====================================================
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_instrumenten_agg_totaal_key
+ON instrumenten_aggregated (totaal, ontvanger_key);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_instrumenten_agg_ontvanger_key
+ON instrumenten_aggregated (ontvanger, ontvanger_key);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_instrumenten_agg_2016_key
+ON instrumenten_aggregated ("2016", ontvanger_key);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_instrumenten_agg_2017_key
+ON instrumenten_aggregated ("2017", ontvanger_key);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_instrumenten_agg_2018_key
+ON instrumenten_aggregated ("2018", ontvanger_key);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_instrumenten_agg_2019_key
+ON instrumenten_aggregated ("2019", ontvanger_key);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_instrumenten_agg_2020_key
+ON instrumenten_aggregated ("2020", ontvanger_key);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_instrumenten_agg_2021_key
+ON instrumenten_aggregated ("2021", ontvanger_key);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_instrumenten_agg_2022_key
+ON instrumenten_aggregated ("2022", ontvanger_key);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_instrumenten_agg_2023_key
+ON instrumenten_aggregated ("2023", ontvanger_key);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_instrumenten_agg_2024_key
+ON instrumenten_aggregated ("2024", ontvanger_key);
+
+-- =====================================================
+-- inkoop_aggregated
+-- =====================================================
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_inkoop_agg_totaal_key
+ON inkoop_aggregated (totaal, leverancier_key);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_inkoop_agg_leverancier_key
+ON inkoop_aggregated (leverancier, leverancier_key);
+
+-- =====================================================
+-- apparaat_aggregated
+-- =====================================================
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_apparaat_agg_totaal_key
+ON apparaat_aggregated (totaal, kostensoort);
+
+-- =====================================================
+-- Per-entity views (entity filter active: WHERE entity IN (...))
+-- =====================================================
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_provincie_agg_totaal_key
+ON provincie_aggregated (totaal, ontvanger_key, provincie);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_gemeente_agg_totaal_key
+ON gemeente_aggregated (totaal, ontvanger_key, gemeente);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_publiek_agg_totaal_key
+ON publiek_aggregated (totaal, ontvanger_key, source);
+
+-- Verify
+SELECT tablename, indexname FROM pg_indexes WHERE indexname LIKE '%_key' ORDER BY 1, 2;
@@ -0,0 +1,221 @@
+-- Migration 079: Recipient-level rollups for entity modules
+--
+-- provincie/gemeente/publiek_aggregated (028) have one row per
+-- (recipient, entity). The default table view (no entity filter) needs one
+-- row per recipient, so the API wrapped the view in a GROUP BY ontvanger_key
+-- subquery with nine SUMs, MODE() per view column and COUNT(DISTINCT) on
+-- EVERY request — including the COUNT(*) and totals queries.
+--
+-- These rollups store that result. Columns and expressions are identical to
+-- the former API subquery:
+--   - entity column: MODE() + COUNT(DISTINCT entity) AS <entity>_count
+--   - other view columns: MODE() + MAX(<col>_count)
+--   - years_with_data recomputed from the summed years
+-- random_order is a fresh RANDOM() per recipient (was MIN over entities).
+--
+-- Built FROM the per-entity views, so refresh order matters: refresh
+-- <module>_aggregated first, then <module>_recipient_aggregated
+-- (refresh-all-views.sql, and refresh_all_views() as recreated below).
+-- Re-running 028 (DROP ... CASCADE) drops these rollups too: run 079 again
+-- afterwards.
+--
+-- Entity-filtered requests keep querying the per-entity views directly.
+--
+-- Execute on Supabase BEFORE deploying code.
+
+
+-- =====================================================
+-- provincie_recipient_aggregated
+-- =====================================================
+DROP MATERIALIZED VIEW IF EXISTS provincie_recipient_aggregated;
+
+CREATE MATERIALIZED VIEW provincie_recipient_aggregated AS
+SELECT
+    ontvanger_key,
+    MIN(ontvanger) AS ontvanger,
+    MODE() WITHIN GROUP (ORDER BY provincie) AS provincie,
+    COUNT(DISTINCT provincie) AS provincie_count,
+    MODE() WITHIN GROUP (ORDER BY omschrijving) AS omschrijving,
+    MAX(omschrijving_count) AS omschrijving_count,
+    SUM("2016") AS "2016",
+    SUM("2017") AS "2017",
+    SUM("2018") AS "2018",
+    SUM("2019") AS "2019",
+    SUM("2020") AS "2020",
+    SUM("2021") AS "2021",
+    SUM("2022") AS "2022",
+    SUM("2023") AS "2023",
+    SUM("2024") AS "2024",
+    SUM(totaal) AS totaal,
+    SUM(row_count) AS row_count,
+    (CASE WHEN SUM("2016") > 0 THEN 1 ELSE 0 END +
+     CASE WHEN SUM("2017") > 0 THEN 1 ELSE 0 END +
+     CASE WHEN SUM("2018") > 0 THEN 1 ELSE 0 END +
+     CASE WHEN SUM("2019") > 0 THEN 1 ELSE 0 END +
+     CASE WHEN SUM("2020") > 0 THEN 1 ELSE 0 END +
+     CASE WHEN SUM("2021") > 0 THEN 1 ELSE 0 END +
+     CASE WHEN SUM("2022") > 0 THEN 1 ELSE 0 END +
+     CASE WHEN SUM("2023") > 0 THEN 1 ELSE 0 END +
+     CASE WHEN SUM("2024") > 0 THEN 1 ELSE 0 END) AS years_with_data,
+    RANDOM() AS random_order
+FROM provincie_aggregated
+GROUP BY ontvanger_key;
+
+CREATE UNIQUE INDEX idx_provincie_ragg_key ON provincie_recipient_aggregated (ontvanger_key);
+CREATE INDEX idx_provincie_ragg_lower_ontvanger ON provincie_recipient_aggregated (LOWER(ontvanger));
+CREATE INDEX idx_provincie_ragg_ontvanger_trgm ON provincie_recipient_aggregated USING gin (ontvanger gin_trgm_ops);
+CREATE INDEX idx_provincie_ragg_random ON provincie_recipient_aggregated (random_order);
+CREATE INDEX idx_provincie_ragg_years ON provincie_recipient_aggregated (years_with_data);
+-- Keyset pagination (078): (sort, key)
+CREATE INDEX idx_provincie_ragg_totaal_key ON provincie_recipient_aggregated (totaal, ontvanger_key);
+CREATE INDEX idx_provincie_ragg_ontvanger_key ON provincie_recipient_aggregated (ontvanger, ontvanger_key);
+
+-- Backend-only, like the other API views (031)
+REVOKE SELECT ON provincie_recipient_aggregated FROM anon, authenticated;
+
+ANALYZE provincie_recipient_aggregated;
+
+-- =====================================================
+-- gemeente_recipient_aggregated
+-- =====================================================
+DROP MATERIALIZED VIEW IF EXISTS gemeente_recipient_aggregated;
+
+CREATE MATERIALIZED VIEW gemeente_recipient_aggregated AS
+SELECT
+    ontvanger_key,
+    MIN(ontvanger) AS ontvanger,
+    MODE() WITHIN GROUP (ORDER BY gemeente) AS gemeente,
+    COUNT(DISTINCT gemeente) AS gemeente_count,
+    MODE() WITHIN GROUP (ORDER BY omschrijving) AS omschrijving,
+    MAX(omschrijving_count) AS omschrijving_count,
+    SUM("2016") AS "2016",
+    SUM("2017") AS "2017",
+    SUM("2018") AS "2018",
+    SUM("2019") AS "2019",
+    SUM("2020") AS "2020",
+    SUM("2021") AS "2021",
+    SUM("2022") AS "2022",
+    SUM("2023") AS "2023",
+    SUM("2024") AS "2024",
+    SUM(totaal) AS totaal,
+    SUM(row_count) AS row_count,
+    (CASE WHEN SUM("2016") > 0 THEN 1 ELSE 0 END +
+     CASE WHEN SUM("2017") > 0 THEN 1 ELSE 0 END +
+     CASE WHEN SUM("2018") > 0 THEN 1 ELSE 0 END +
+     CASE WHEN SUM("2019") > 0 THEN 1 ELSE 0 END +
+     CASE WHEN SUM("2020") > 0 THEN 1 ELSE 0 END +
+     CASE WHEN SUM("2021") > 0 THEN 1 ELSE 0 END +
+     CASE WHEN SUM("2022") > 0 THEN 1 ELSE 0 END +
+     CASE WHEN SUM("2023") > 0 THEN 1 ELSE 0 END +
+     CASE WHEN SUM("2024") > 0 THEN 1 ELSE 0 END) AS years_with_data,
+    RANDOM() AS random_order
+FROM gemeente_aggregated
+GROUP BY ontvanger_key;
+
+CREATE UNIQUE INDEX idx_gemeente_ragg_key ON gemeente_recipient_aggregated (ontvanger_key);
+CREATE INDEX idx_gemeente_ragg_lower_ontvanger ON gemeente_recipient_aggregated (LOWER(ontvanger));
+CREATE INDEX idx_gemeente_ragg_ontvanger_trgm ON gemeente_recipient_aggregated USING gin (ontvanger gin_trgm_ops);
+CREATE INDEX idx_gemeente_ragg_random ON gemeente_recipient_aggregated (random_order);
+CREATE INDEX idx_gemeente_ragg_years ON gemeente_recipient_aggregated (years_with_data);
+-- Keyset pagination (078): (sort, key)
+CREATE INDEX idx_gemeente_ragg_totaal_key ON gemeente_recipient_aggregated (totaal, ontvanger_key);
+CREATE INDEX idx_gemeente_ragg_ontvanger_key ON gemeente_recipient_aggregated (ontvanger, ontvanger_key);
+
+-- Backend-only, like the other API views (031)
+REVOKE SELECT ON gemeente_recipient_aggregated FROM anon, authenticated;
+
+ANALYZE gemeente_recipient_aggregated;
+
+-- =====================================================
+-- publiek_recipient_aggregated
+-- =====================================================
+DROP MATERIALIZED VIEW IF EXISTS publiek_recipient_aggregated;
+
+CREATE MATERIALIZED VIEW publiek_recipient_aggregated AS
+SELECT
+    ontvanger_key,
+    MIN(ontvanger) AS ontvanger,
+    MODE() WITHIN GROUP (ORDER BY source) AS source,
+    COUNT(DISTINCT source) AS source_count,
+    SUM("2016") AS "2016",
+    SUM("2017") AS "2017",
+    SUM("2018") AS "2018",
+    SUM("2019") AS "2019",
+    SUM("2020") AS "2020",
+    SUM("2021") AS "2021",
+    SUM("2022") AS "2022",
+    SUM("2023") AS "2023",
+    SUM("2024") AS "2024",
+    SUM(totaal) AS totaal,
+    SUM(row_count) AS row_count,
+    (CASE WHEN SUM("2016") > 0 THEN 1 ELSE 0 END +
+     CASE WHEN SUM("2017") > 0 THEN 1 ELSE 0 END +
+     CASE WHEN SUM("2018") > 0 THEN 1 ELSE 0 END +
+     CASE WHEN SUM("2019") > 0 THEN 1 ELSE 0 END +
+     CASE WHEN SUM("2020") > 0 THEN 1 ELSE 0 END +
+     CASE WHEN SUM("2021") > 0 THEN 1 ELSE 0 END +
+     CASE WHEN SUM("2022") > 0 THEN 1 ELSE 0 END +
+     CASE WHEN SUM("2023") > 0 THEN 1 ELSE 0 END +
+     CASE WHEN SUM("2024") > 0 THEN 1 ELSE 0 END) AS years_with_data,
+    RANDOM() AS random_order
+FROM publiek_aggregated
+GROUP BY ontvanger_key;
+
+CREATE UNIQUE INDEX idx_publiek_ragg_key ON publiek_recipient_aggregated (ontvanger_key);
+CREATE INDEX idx_publiek_ragg_lower_ontvanger ON publiek_recipient_aggregated (LOWER(ontvanger));
+CREATE INDEX idx_publiek_ragg_ontvanger_trgm ON publiek_recipient_aggregated USING gin (ontvanger gin_trgm_ops);
+CREATE INDEX idx_publiek_ragg_random ON publiek_recipient_aggregated (random_order);
+CREATE INDEX idx_publiek_ragg_years ON publiek_recipient_aggregated (years_with_data);
+-- Keyset pagination (078): (sort, key)
+CREATE INDEX idx_publiek_ragg_totaal_key ON publiek_recipient_aggregated (totaal, ontvanger_key);
+CREATE INDEX idx_publiek_ragg_ontvanger_key ON publiek_recipient_aggregated (ontvanger, ontvanger_key);
+
+-- Backend-only, like the other API views (031)
+REVOKE SELECT ON publiek_recipient_aggregated FROM anon, authenticated;
+
+ANALYZE publiek_recipient_aggregated;
+
+-- Recreate refresh_all_views() (077) so it also refreshes the recipient rollups
+-- before bump_data_generation(): otherwise the API caches stale data under
+-- the new generation
+CREATE OR REPLACE FUNCTION refresh_all_views()
+RETURNS TEXT AS $$
+BEGIN
+    -- Refresh aggregated views (for API performance)
+    REFRESH MATERIALIZED VIEW instrumenten_aggregated;
+    REFRESH MATERIALIZED VIEW apparaat_aggregated;
+    REFRESH MATERIALIZED VIEW inkoop_aggregated;
+    REFRESH MATERIALIZED VIEW provincie_aggregated;
+    REFRESH MATERIALIZED VIEW gemeente_aggregated;
+    REFRESH MATERIALIZED VIEW publiek_aggregated;
+
+    -- Recipient-level rollups (079), built from the per-entity views above
+    REFRESH MATERIALIZED VIEW provincie_recipient_aggregated;
+    REFRESH MATERIALIZED VIEW gemeente_recipient_aggregated;
+    REFRESH MATERIALIZED VIEW publiek_recipient_aggregated;
+
+    -- Refresh cross-module search view (with entity resolution)
+    REFRESH MATERIALIZED VIEW CONCURRENTLY universal_search;
+
+    -- Invalidate API caches (after ALL refreshes)
+    PERFORM bump_data_generation();
+
+    RETURN 'All views refreshed successfully';
+END;
+$$ LANGUAGE plpgsql;
+
+-- Verify: one row per recipient, totals match the per-entity views
+SELECT 'provincie' AS module,
+    (SELECT COUNT(*) FROM provincie_recipient_aggregated) AS rollup_rows,
+    (SELECT COUNT(DISTINCT ontvanger_key) FROM provincie_aggregated) AS recipients,
+    (SELECT SUM(totaal) FROM provincie_recipient_aggregated) = (SELECT SUM(totaal) FROM provincie_aggregated) AS totals_match
+UNION ALL
+SELECT 'gemeente',
+    (SELECT COUNT(*) FROM gemeente_recipient_aggregated),
+    (SELECT COUNT(DISTINCT ontvanger_key) FROM gemeente_aggregated),
+    (SELECT SUM(totaal) FROM gemeente_recipient_aggregated) = (SELECT SUM(totaal) FROM gemeente_aggregated)
+UNION ALL
+SELECT 'publiek',
+    (SELECT COUNT(*) FROM publiek_recipient_aggregated),
+    (SELECT COUNT(DISTINCT ontvanger_key) FROM publiek_aggregated),
+    (SELECT SUM(totaal) FROM publiek_recipient_aggregated) = (SELECT SUM(totaal) FROM publiek_aggregated);
@@ -0,0 +1,70 @@
+-- Migration 080: Trigram indexes for the ILIKE prefilter of regex searches
+--
+-- The PostgreSQL search paths (regex fallback when Typesense returns nothing,
+-- source-table search, "Ook in" enrichment, autocomplete fallback, detail-row
+-- search scoping) match whole words with a \y regex:
+--   regeling ~* '\ysubsidie\y'
+-- The planner cannot turn that into a reliable index scan, so on instrumenten
+-- (674K rows) every fallback was a sequential scan over up to 7 columns.
+--
+-- The API now writes each regex condition as an indexable prefilter plus the
+-- exact recheck (same results: every word match is also a substring match):
+--   (regeling ILIKE '%subsidie%' AND regeling ~* '\ysubsidie\y')
+-- A pg_trgm GIN index answers the ILIKE (BitmapOr across search fields); the
+-- regex only runs on the candidate rows.
+--
+-- 017 already indexed the secondary search fields, 014/028/079 the primary
+-- column of the aggregated views and 009 universal_search.ontvanger. This
+-- adds the remaining search_fields of the source tables (mostly the primary
+-- column). Search terms shorter than 3 characters have no trigrams and still
+-- scan; Typesense handles those in normal operation.
+--
+-- A Dutch tsvector was considered and not used: stemming changes what matches
+-- (politie/politiek), while the search contract is an exact word match.
+--
+-- Execute on Supabase BEFORE deploying code (CONCURRENTLY: no table lock,
+-- run statements one by one outside a transaction).
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- =====================================================
+-- Source tables: primary and remaining search fields
+-- =====================================================
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_instrumenten_ontvanger_trgm
+ON instrumenten USING gin (ontvanger gin_trgm_ops);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_apparaat_kostensoort_trgm
+ON apparaat USING gin (kostensoort gin_trgm_ops);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_inkoop_leverancier_trgm
+ON inkoop USING gin (leverancier gin_trgm_ops);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_inkoop_ministerie_trgm
+ON inkoop USING gin (ministerie gin_trgm_ops);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_inkoop_categorie_trgm
+ON inkoop USING gin (categorie gin_trgm_ops);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_provincie_ontvanger_trgm
+ON provincie USING gin (ontvanger gin_trgm_ops);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_provincie_omschrijving_trgm
+ON provincie USING gin (omschrijving gin_trgm_ops);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_gemeente_ontvanger_trgm
+ON gemeente USING gin (ontvanger gin_trgm_ops);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_publiek_ontvanger_trgm
+ON publiek USING gin (ontvanger gin_trgm_ops);
+
+-- =====================================================
+-- VERIFY
+-- =====================================================
+-- 1. All trigram indexes (source tables + views)
+SELECT tablename, indexname, pg_size_pretty(pg_relation_size(indexname::regclass)) AS size
+FROM pg_indexes
+WHERE indexname LIKE '%trgm%'
+ORDER BY tablename, indexname;
+
+-- 2. Plan should show Bitmap Index Scan on the trgm indexes, regex in Filter
+EXPLAIN ANALYZE
+SELECT COUNT(*) FROM instrumenten
+WHERE (ontvanger ILIKE '%prorail%' AND ontvanger ~* '\yprorail\y')
+   OR (regeling ILIKE '%prorail%' AND regeling ~* '\yprorail\y');
@@ -0,0 +1,147 @@
+-- Migration 081: Match context for the "Ook in" column
+--
+-- For search results that matched on the recipient name, the API shows where
+-- else the search term occurs ("Ook in: Regeling ..."). That used to be a
+-- CROSS JOIN LATERAL over up to 1000 recipients into the source table, with a
+-- regex CASE ladder over every secondary search field of every source row.
+--
+-- search_match_context stores each distinct (primary value, field, value)
+-- once. Source rows repeat the same regeling/artikel/... many times per
+-- recipient, so the lookup scans far fewer rows:
+--   SELECT DISTINCT ON (primary_value) primary_value, field, value
+--   FROM search_match_context
+--   WHERE module = 'instrumenten' AND primary_value = ANY($keys)
+--     AND field = ANY($fields) AND value ILIKE '%term%' AND value ~* '\yterm\y'
+--   ORDER BY primary_value, array_position($fields, field)
+--
+-- Columns:
+--   module         source table name (instrumenten, apparaat, ...)
+--   primary_value  raw primary column (ontvanger / kostensoort / leverancier),
+--                  as stored in Typesense
+--   field          secondary search field name (search_fields in MODULE_CONFIG
+--                  minus the primary field)
+--   value          field value (text, non-empty)
+--
+-- Refresh after the source tables change (refresh-all-views.sql, and
+-- refresh_all_views() as recreated below). If the search_fields in
+-- MODULE_CONFIG change, update the field lists below.
+--
+-- Execute on Supabase BEFORE deploying code.
+
+DROP MATERIALIZED VIEW IF EXISTS search_match_context;
+
+CREATE MATERIALIZED VIEW search_match_context AS
+SELECT DISTINCT 'instrumenten'::text AS module, t.ontvanger AS primary_value, v.field, v.value
+FROM instrumenten t
+CROSS JOIN LATERAL (VALUES
+    ('regeling', t.regeling::text),
+    ('instrument', t.instrument::text),
+    ('begrotingsnaam', t.begrotingsnaam::text),
+    ('artikel', t.artikel::text),
+    ('artikelonderdeel', t.artikelonderdeel::text),
+    ('detail', t.detail::text)
+) AS v(field, value)
+WHERE t.ontvanger IS NOT NULL AND v.value IS NOT NULL AND v.value <> ''
+
+UNION ALL
+
+SELECT DISTINCT 'apparaat'::text, t.kostensoort, v.field, v.value
+FROM apparaat t
+CROSS JOIN LATERAL (VALUES
+    ('begrotingsnaam', t.begrotingsnaam::text),
+    ('artikel', t.artikel::text),
+    ('detail', t.detail::text)
+) AS v(field, value)
+WHERE t.kostensoort IS NOT NULL AND v.value IS NOT NULL AND v.value <> ''
+
+UNION ALL
+
+SELECT DISTINCT 'inkoop'::text, t.leverancier, v.field, v.value
+FROM inkoop t
+CROSS JOIN LATERAL (VALUES
+    ('ministerie', t.ministerie::text),
+    ('categorie', t.categorie::text)
+) AS v(field, value)
+WHERE t.leverancier IS NOT NULL AND v.value IS NOT NULL AND v.value <> ''
+
+UNION ALL
+
+SELECT DISTINCT 'provincie'::text, t.ontvanger, v.field, v.value
+FROM provincie t
+CROSS JOIN LATERAL (VALUES
+    ('omschrijving', t.omschrijving::text)
+) AS v(field, value)
+WHERE t.ontvanger IS NOT NULL AND v.value IS NOT NULL AND v.value <> ''
+
+UNION ALL
+
+SELECT DISTINCT 'gemeente'::text, t.ontvanger, v.field, v.value
+FROM gemeente t
+CROSS JOIN LATERAL (VALUES
+    ('omschrijving', t.omschrijving::text),
+    ('regeling', t.regeling::text),
+    ('beleidsterrein', t.beleidsterrein::text)
+) AS v(field, value)
+WHERE t.ontvanger IS NOT NULL AND v.value IS NOT NULL AND v.value <> ''
+
+UNION ALL
+
+SELECT DISTINCT 'publiek'::text, t.ontvanger, v.field, v.value
+FROM publiek t
+CROSS JOIN LATERAL (VALUES
+    ('omschrijving', t.omschrijving::text),
+    ('regeling', t.regeling::text),
+    ('trefwoorden', t.trefwoorden::text),
+    ('sectoren', t.sectoren::text)
+) AS v(field, value)
+WHERE t.ontvanger IS NOT NULL AND v.value IS NOT NULL AND v.value <> '';
+
+-- Lookup by recipient (the key list comes from Typesense)
+CREATE INDEX idx_search_match_context_key ON search_match_context (module, primary_value);
+-- Regex fallback prefilter when the key list is long
+CREATE INDEX idx_search_match_context_value_trgm ON search_match_context USING gin (value gin_trgm_ops);
+
+-- Backend-only, like the other API views (031)
+REVOKE SELECT ON search_match_context FROM anon, authenticated;
+
+ANALYZE search_match_context;
+
+-- Recreate refresh_all_views() (079) so it also refreshes search_match_context
+-- before bump_data_generation(): otherwise the API caches stale data under
+-- the new generation
+CREATE OR REPLACE FUNCTION refresh_all_views()
+RETURNS TEXT AS $$
+BEGIN
+    -- Refresh aggregated views (for API performance)
+    REFRESH MATERIALIZED VIEW instrumenten_aggregated;
+    REFRESH MATERIALIZED VIEW apparaat_aggregated;
+    REFRESH MATERIALIZED VIEW inkoop_aggregated;
+    REFRESH MATERIALIZED VIEW provincie_aggregated;
+    REFRESH MATERIALIZED VIEW gemeente_aggregated;
+    REFRESH MATERIALIZED VIEW publiek_aggregated;
+
+    -- Recipient-level rollups (079), built from the per-entity views above
+    REFRESH MATERIALIZED VIEW provincie_recipient_aggregated;
+    REFRESH MATERIALIZED VIEW gemeente_recipient_aggregated;
+    REFRESH MATERIALIZED VIEW publiek_recipient_aggregated;
+
+    -- "Ook in" match context (081), built from the source tables
+    REFRESH MATERIALIZED VIEW search_match_context;
+
+    -- Refresh cross-module search view (with entity resolution)
+    REFRESH MATERIALIZED VIEW CONCURRENTLY universal_search;
+
+    -- Invalidate API caches (after ALL refreshes)
+    PERFORM bump_data_generation();
+
+    RETURN 'All views refreshed successfully';
+END;
+$$ LANGUAGE plpgsql;
+
+-- =====================================================
+-- VERIFY
+-- =====================================================
+SELECT module, field, COUNT(*) AS values, COUNT(DISTINCT primary_value) AS recipients
+FROM search_match_context
+GROUP BY module, field
+ORDER BY module, field;
@@ -0,0 +1,127 @@
+-- Migration 082: Stored recipient key column on the source tables
+--
+-- Row expansion (details, grouping counts, batch expansion) filtered the
+-- source tables with
+--   WHERE normalize_recipient(ontvanger) = normalize_recipient($1)
+-- which needs the functional indexes from 020 and re-evaluates the PL/pgSQL
+-- normalization for every candidate row (index recheck, bitmap heap scans).
+--
+-- Each source table now stores the key once per row:
+--   instrumenten.ontvanger_key   = normalize_recipient(ontvanger)
+--   apparaat.kostensoort_key     = normalize_recipient(kostensoort)
+--   inkoop.leverancier_key       = normalize_recipient(leverancier)
+--   provincie/gemeente/publiek.ontvanger_key = normalize_recipient(ontvanger)
+-- (same names as the key columns of the aggregated views). The API computes
+-- the key in Python (normalize_recipient_python) and binds it as a plain
+-- equality parameter:
+--   WHERE ontvanger_key = $1
+--
+-- The columns are GENERATED ALWAYS ... STORED instead of trigger-maintained:
+-- PostgreSQL keeps them in sync on INSERT/UPDATE the same way, and COPY
+-- without a column list skips generated columns, so the CSV imports in the
+-- runbook (\COPY tablename FROM ...) keep working unchanged. A trigger-filled
+-- column would be part of the COPY column list and break those imports.
+--
+-- If normalize_recipient() is ever redefined, recompute the keys:
+--   UPDATE instrumenten SET ontvanger = ontvanger;  (per table)
+--
+-- Composite indexes per table: (key, year) for year-scoped details and
+-- (key, default group field) for the default expansion grouping.
+--
+-- Execute on Supabase BEFORE deploying code. ADD COLUMN rewrites each table
+-- (instrumenten: 674K rows, ~1 min, table locked meanwhile); run during a
+-- data update window. The indexes are CONCURRENTLY: run those statements one
+-- by one outside a transaction.
+
+-- =====================================================
+-- 1. Key columns
+-- =====================================================
+ALTER TABLE instrumenten
+  ADD COLUMN IF NOT EXISTS ontvanger_key TEXT GENERATED ALWAYS AS (normalize_recipient(ontvanger)) STORED;
+
+ALTER TABLE apparaat
+  ADD COLUMN IF NOT EXISTS kostensoort_key TEXT GENERATED ALWAYS AS (normalize_recipient(kostensoort)) STORED;
+
+ALTER TABLE inkoop
+  ADD COLUMN IF NOT EXISTS leverancier_key TEXT GENERATED ALWAYS AS (normalize_recipient(leverancier)) STORED;
+
+ALTER TABLE provincie
+  ADD COLUMN IF NOT EXISTS ontvanger_key TEXT GENERATED ALWAYS AS (normalize_recipient(ontvanger)) STORED;
+
+ALTER TABLE gemeente
+  ADD COLUMN IF NOT EXISTS ontvanger_key TEXT GENERATED ALWAYS AS (normalize_recipient(ontvanger)) STORED;
+
+ALTER TABLE publiek
+  ADD COLUMN IF NOT EXISTS ontvanger_key TEXT GENERATED ALWAYS AS (normalize_recipient(ontvanger)) STORED;
+
+-- =====================================================
+-- 2. Composite indexes: (key, year) and (key, group field)
+-- =====================================================
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_instrumenten_ontvanger_key_jaar
+ON instrumenten (ontvanger_key, begrotingsjaar);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_instrumenten_ontvanger_key_regeling
+ON instrumenten (ontvanger_key, regeling);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_apparaat_kostensoort_key_jaar
+ON apparaat (kostensoort_key, begrotingsjaar);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_apparaat_kostensoort_key_begrotingsnaam
+ON apparaat (kostensoort_key, begrotingsnaam);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_inkoop_leverancier_key_jaar
+ON inkoop (leverancier_key, jaar);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_inkoop_leverancier_key_ministerie
+ON inkoop (leverancier_key, ministerie);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_provincie_ontvanger_key_jaar
+ON provincie (ontvanger_key, jaar);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_provincie_ontvanger_key_provincie
+ON provincie (ontvanger_key, provincie);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_gemeente_ontvanger_key_jaar
+ON gemeente (ontvanger_key, jaar);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_gemeente_ontvanger_key_gemeente
+ON gemeente (ontvanger_key, gemeente);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_publiek_ontvanger_key_jaar
+ON publiek (ontvanger_key, jaar);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_publiek_ontvanger_key_source
+ON publiek (ontvanger_key, source);
+
+ANALYZE instrumenten;
+ANALYZE apparaat;
+ANALYZE inkoop;
+ANALYZE provincie;
+ANALYZE gemeente;
+ANALYZE publiek;
+
+-- =====================================================
+-- 3. Optional, after deploying: the functional indexes from 020 are no
+--    longer used by the API (materialized view refreshes scan anyway)
+-- =====================================================
+-- DROP INDEX CONCURRENTLY IF EXISTS idx_instrumenten_ontvanger_normalized;
+-- DROP INDEX CONCURRENTLY IF EXISTS idx_instrumenten_ontvanger_normalized_jaar;
+-- DROP INDEX CONCURRENTLY IF EXISTS idx_inkoop_leverancier_normalized;
+-- DROP INDEX CONCURRENTLY IF EXISTS idx_inkoop_leverancier_normalized_jaar;
+-- DROP INDEX CONCURRENTLY IF EXISTS idx_provincie_ontvanger_normalized;
+-- DROP INDEX CONCURRENTLY IF EXISTS idx_provincie_ontvanger_normalized_jaar;
+-- DROP INDEX CONCURRENTLY IF EXISTS idx_gemeente_ontvanger_normalized;
+-- DROP INDEX CONCURRENTLY IF EXISTS idx_gemeente_ontvanger_normalized_jaar;
+-- DROP INDEX CONCURRENTLY IF EXISTS idx_publiek_ontvanger_normalized;
+-- DROP INDEX CONCURRENTLY IF EXISTS idx_publiek_ontvanger_normalized_jaar;
+
+-- =====================================================
+-- VERIFY
+-- =====================================================
+-- 1. Keys are filled (expect 0 rows where the primary value is set but the key is not)
+SELECT 'instrumenten' AS tbl, COUNT(*) FROM instrumenten WHERE ontvanger IS NOT NULL AND ontvanger_key IS NULL
+UNION ALL SELECT 'apparaat', COUNT(*) FROM apparaat WHERE kostensoort IS NOT NULL AND kostensoort_key IS NULL
+UNION ALL SELECT 'inkoop', COUNT(*) FROM inkoop WHERE leverancier IS NOT NULL AND leverancier_key IS NULL
+UNION ALL SELECT 'provincie', COUNT(*) FROM provincie WHERE ontvanger IS NOT NULL AND ontvanger_key IS NULL
+UNION ALL SELECT 'gemeente', COUNT(*) FROM gemeente WHERE ontvanger IS NOT NULL AND ontvanger_key IS NULL
+UNION ALL SELECT 'publiek', COUNT(*) FROM publiek WHERE ontvanger IS NOT NULL AND ontvanger_key IS NULL;
+
+-- 2. Plan should show Index Scan on idx_instrumenten_ontvanger_key_jaar
+EXPLAIN ANALYZE
+SELECT regeling, SUM(bedrag) FROM instrumenten
+WHERE ontvanger_key = 'PRORAIL' AND begrotingsjaar = 2024
+GROUP BY regeling;
@@ -0,0 +1,153 @@
+-- Migration 083: Filter value dictionary for the filter dropdowns
+--
+-- GET /modules/{module}/filters/{field} ran
+--   SELECT DISTINCT field::text FROM <source table>
+--   WHERE field IS NOT NULL AND field::text != '' ORDER BY field::text LIMIT 5000
+-- on every dropdown open. The ::text cast keeps the planner off the field
+-- indexes, so each call sorted the whole column (instrumenten: 674K rows).
+--
+-- filter_dictionary holds every distinct (module, field, value) of the
+-- filter_fields in MODULE_CONFIG, with:
+--   row_count        source rows with this value
+--   recipient_count  distinct primary values (ontvanger/kostensoort/leverancier)
+-- The API reads one (module, field) slice ordered by value (index-only scan),
+-- keeps it in process until the dataset generation changes, and serves it
+-- with a strong ETag per generation (304 on revalidation).
+--
+-- Refresh after the source tables change (refresh-all-views.sql, and
+-- refresh_all_views() as recreated below). If the filter_fields in
+-- MODULE_CONFIG change, update the field lists below.
+--
+-- Execute on Supabase BEFORE deploying code.
+
+DROP MATERIALIZED VIEW IF EXISTS filter_dictionary;
+
+CREATE MATERIALIZED VIEW filter_dictionary AS
+SELECT 'instrumenten'::text AS module, v.field, v.value,
+       COUNT(*) AS row_count, COUNT(DISTINCT t.ontvanger) AS recipient_count
+FROM instrumenten t
+CROSS JOIN LATERAL (VALUES
+    ('begrotingsnaam', t.begrotingsnaam::text),
+    ('artikel', t.artikel::text),
+    ('artikelonderdeel', t.artikelonderdeel::text),
+    ('instrument', t.instrument::text),
+    ('regeling', t.regeling::text)
+) AS v(field, value)
+WHERE v.value IS NOT NULL AND v.value <> ''
+GROUP BY v.field, v.value
+
+UNION ALL
+
+SELECT 'apparaat'::text, v.field, v.value, COUNT(*), COUNT(DISTINCT t.kostensoort)
+FROM apparaat t
+CROSS JOIN LATERAL (VALUES
+    ('begrotingsnaam', t.begrotingsnaam::text),
+    ('artikel', t.artikel::text),
+    ('detail', t.detail::text),
+    ('kostensoort', t.kostensoort::text)
+) AS v(field, value)
+WHERE v.value IS NOT NULL AND v.value <> ''
+GROUP BY v.field, v.value
+
+UNION ALL
+
+SELECT 'inkoop'::text, v.field, v.value, COUNT(*), COUNT(DISTINCT t.leverancier)
+FROM inkoop t
+CROSS JOIN LATERAL (VALUES
+    ('ministerie', t.ministerie::text),
+    ('categorie', t.categorie::text),
+    ('staffel', t.staffel::text)
+) AS v(field, value)
+WHERE v.value IS NOT NULL AND v.value <> ''
+GROUP BY v.field, v.value
+
+UNION ALL
+
+SELECT 'provincie'::text, v.field, v.value, COUNT(*), COUNT(DISTINCT t.ontvanger)
+FROM provincie t
+CROSS JOIN LATERAL (VALUES
+    ('provincie', t.provincie::text),
+    ('omschrijving', t.omschrijving::text)
+) AS v(field, value)
+WHERE v.value IS NOT NULL AND v.value <> ''
+GROUP BY v.field, v.value
+
+UNION ALL
+
+SELECT 'gemeente'::text, v.field, v.value, COUNT(*), COUNT(DISTINCT t.ontvanger)
+FROM gemeente t
+CROSS JOIN LATERAL (VALUES
+    ('gemeente', t.gemeente::text),
+    ('beleidsterrein', t.beleidsterrein::text),
+    ('regeling', t.regeling::text),
+    ('omschrijving', t.omschrijving::text)
+) AS v(field, value)
+WHERE v.value IS NOT NULL AND v.value <> ''
+GROUP BY v.field, v.value
+
+UNION ALL
+
+SELECT 'publiek'::text, v.field, v.value, COUNT(*), COUNT(DISTINCT t.ontvanger)
+FROM publiek t
+CROSS JOIN LATERAL (VALUES
+    ('source', t.source::text),
+    ('regeling', t.regeling::text),
+    ('trefwoorden', t.trefwoorden::text),
+    ('sectoren', t.sectoren::text),
+    ('provincie', t.provincie::text),
+    ('onderdeel', t.onderdeel::text),
+    ('staffel', t.staffel::text)
+) AS v(field, value)
+WHERE v.value IS NOT NULL AND v.value <> ''
+GROUP BY v.field, v.value;
+
+-- Dropdown lookup: WHERE module = $1 AND field = $2 ORDER BY value (index-only scan)
+CREATE UNIQUE INDEX idx_filter_dictionary_key ON filter_dictionary (module, field, value);
+
+-- Backend-only, like the other API views (031)
+REVOKE SELECT ON filter_dictionary FROM anon, authenticated;
+
+ANALYZE filter_dictionary;
+
+-- Recreate refresh_all_views() (081) so it also refreshes filter_dictionary
+-- before bump_data_generation(): otherwise the API caches stale data under
+-- the new generation
+CREATE OR REPLACE FUNCTION refresh_all_views()
+RETURNS TEXT AS $$
+BEGIN
+    -- Refresh aggregated views (for API performance)
+    REFRESH MATERIALIZED VIEW instrumenten_aggregated;
+    REFRESH MATERIALIZED VIEW apparaat_aggregated;
+    REFRESH MATERIALIZED VIEW inkoop_aggregated;
+    REFRESH MATERIALIZED VIEW provincie_aggregated;
+    REFRESH MATERIALIZED VIEW gemeente_aggregated;
+    REFRESH MATERIALIZED VIEW publiek_aggregated;
+
+    -- Recipient-level rollups (079), built from the per-entity views above
+    REFRESH MATERIALIZED VIEW provincie_recipient_aggregated;
+    REFRESH MATERIALIZED VIEW gemeente_recipient_aggregated;
+    REFRESH MATERIALIZED VIEW publiek_recipient_aggregated;
+
+    -- "Ook in" match context (081), built from the source tables
+    REFRESH MATERIALIZED VIEW search_match_context;
+
+    -- Filter dropdown values (083), built from the source tables
+    REFRESH MATERIALIZED VIEW CONCURRENTLY filter_dictionary;
+
+    -- Refresh cross-module search view (with entity resolution)
+    REFRESH MATERIALIZED VIEW CONCURRENTLY universal_search;
+
+    -- Invalidate API caches (after ALL refreshes)
+    PERFORM bump_data_generation();
+
+    RETURN 'All views refreshed successfully';
+END;
+$$ LANGUAGE plpgsql;
+
+-- =====================================================
+-- VERIFY
+-- =====================================================
+SELECT module, field, COUNT(*) AS values, SUM(row_count) AS rows
+FROM filter_dictionary
+GROUP BY module, field
+ORDER BY module, field;
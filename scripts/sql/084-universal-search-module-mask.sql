@@ -0,0 +1,176 @@
+-- Migration 084: Module membership bitmask on universal_search
+--
+-- The integraal "Modules per ontvanger" filter added one clause per selected
+-- module:
+--   sources ILIKE '%instrumenten%' AND sources ILIKE '%inkoop%' ...
+-- a substring match on the display string that no index can serve, and the
+-- API split the sources string of every result row to build the badges.
+--
+-- module_mask stores the same membership as one SMALLINT (BIT_OR per source):
+--   1  Financiële instrumenten          (instrumenten)
+--   2  Gemeentelijke subsidieregisters  (gemeente)
+--   4  Inkoopuitgaven                   (inkoop)
+--   8  Provinciale subsidieregisters    (provincie)
+--   16 Publiek                          (publiek)
+-- Bits follow the alphabetical order of the display names, so decoding bits
+-- low to high gives the same order as STRING_AGG(... ORDER BY source).
+-- Keep in sync with INTEGRAAL_MODULE_BITS in backend/app/services/modules.py.
+--
+-- "In all selected modules" is (module_mask & required) = required. There are
+-- only 31 possible masks, so the API binds the list of masks that contain the
+-- required bits instead:
+--   WHERE module_mask = ANY($1::smallint[])
+-- which the B-tree index on module_mask serves.
+--
+-- Must DROP + recreate since materialized views don't support ALTER ADD COLUMN.
+-- Definition is 029 plus module_mask; all indexes (029, 078, the 009 trigram
+-- index) and the privilege revoke (031) are recreated below.
+--
+-- Execute on Supabase BEFORE deploying code.
+
+DROP MATERIALIZED VIEW IF EXISTS universal_search CASCADE;
+
+CREATE MATERIALIZED VIEW universal_search AS
+WITH combined_data AS (
+    SELECT
+        UPPER(ontvanger) AS ontvanger_key,
+        ontvanger AS ontvanger_display,
+        'Financiële instrumenten' AS source,
+        1 AS source_bit,
+        begrotingsjaar AS jaar,
+        COALESCE(bedrag, 0)::BIGINT * 1000 AS bedrag_euros
+    FROM instrumenten
+    WHERE ontvanger IS NOT NULL AND ontvanger != ''
+      AND begrotingsjaar BETWEEN 2016 AND 2024
+
+    UNION ALL
+
+    SELECT
+        UPPER(leverancier) AS ontvanger_key,
+        leverancier AS ontvanger_display,
+        'Inkoopuitgaven' AS source,
+        4 AS source_bit,
+        jaar,
+        COALESCE(totaal_avg, 0)::BIGINT AS bedrag_euros
+    FROM inkoop
+    WHERE leverancier IS NOT NULL AND leverancier != ''
+      AND jaar BETWEEN 2016 AND 2024
+
+    UNION ALL
+
+    SELECT
+        UPPER(ontvanger) AS ontvanger_key,
+        ontvanger AS ontvanger_display,
+        'Publiek' AS source,
+        16 AS source_bit,
+        jaar,
+        COALESCE(bedrag, 0)::BIGINT AS bedrag_euros
+    FROM publiek
+    WHERE ontvanger IS NOT NULL AND ontvanger != ''
+      AND jaar BETWEEN 2016 AND 2024
+
+    UNION ALL
+
+    SELECT
+        UPPER(ontvanger) AS ontvanger_key,
+        ontvanger AS ontvanger_display,
+        'Gemeentelijke subsidieregisters' AS source,
+        2 AS source_bit,
+        jaar,
+        COALESCE(bedrag, 0)::BIGINT AS bedrag_euros
+    FROM gemeente
+    WHERE ontvanger IS NOT NULL AND ontvanger != ''
+      AND jaar BETWEEN 2016 AND 2024
+
+    UNION ALL
+
+    SELECT
+        UPPER(ontvanger) AS ontvanger_key,
+        ontvanger AS ontvanger_display,
+        'Provinciale subsidieregisters' AS source,
+        8 AS source_bit,
+        jaar,
+        COALESCE(bedrag, 0)::BIGINT AS bedrag_euros
+    FROM provincie
+    WHERE ontvanger IS NOT NULL AND ontvanger != ''
+      AND jaar BETWEEN 2016 AND 2024
+)
+SELECT
+    ontvanger_key,
+    MIN(ontvanger_display) AS ontvanger,
+    STRING_AGG(DISTINCT source, ', ' ORDER BY source) AS sources,
+    BIT_OR(source_bit)::SMALLINT AS module_mask,
+    COUNT(DISTINCT source) AS source_count,
+    COUNT(*) AS record_count,
+    COALESCE(SUM(CASE WHEN jaar = 2016 THEN bedrag_euros END), 0) AS "2016",
+    COALESCE(SUM(CASE WHEN jaar = 2017 THEN bedrag_euros END), 0) AS "2017",
+    COALESCE(SUM(CASE WHEN jaar = 2018 THEN bedrag_euros END), 0) AS "2018",
+    COALESCE(SUM(CASE WHEN jaar = 2019 THEN bedrag_euros END), 0) AS "2019",
+    COALESCE(SUM(CASE WHEN jaar = 2020 THEN bedrag_euros END), 0) AS "2020",
+    COALESCE(SUM(CASE WHEN jaar = 2021 THEN bedrag_euros END), 0) AS "2021",
+    COALESCE(SUM(CASE WHEN jaar = 2022 THEN bedrag_euros END), 0) AS "2022",
+    COALESCE(SUM(CASE WHEN jaar = 2023 THEN bedrag_euros END), 0) AS "2023",
+    COALESCE(SUM(CASE WHEN jaar = 2024 THEN bedrag_euros END), 0) AS "2024",
+    COALESCE(SUM(bedrag_euros), 0) AS totaal,
+    (CASE WHEN SUM(CASE WHEN jaar = 2016 THEN bedrag_euros END) <> 0 THEN 1 ELSE 0 END
+   + CASE WHEN SUM(CASE WHEN jaar = 2017 THEN bedrag_euros END) <> 0 THEN 1 ELSE 0 END
+   + CASE WHEN SUM(CASE WHEN jaar = 2018 THEN bedrag_euros END) <> 0 THEN 1 ELSE 0 END
+   + CASE WHEN SUM(CASE WHEN jaar = 2019 THEN bedrag_euros END) <> 0 THEN 1 ELSE 0 END
+   + CASE WHEN SUM(CASE WHEN jaar = 2020 THEN bedrag_euros END) <> 0 THEN 1 ELSE 0 END
+   + CASE WHEN SUM(CASE WHEN jaar = 2021 THEN bedrag_euros END) <> 0 THEN 1 ELSE 0 END
+   + CASE WHEN SUM(CASE WHEN jaar = 2022 THEN bedrag_euros END) <> 0 THEN 1 ELSE 0 END
+   + CASE WHEN SUM(CASE WHEN jaar = 2023 THEN bedrag_euros END) <> 0 THEN 1 ELSE 0 END
+   + CASE WHEN SUM(CASE WHEN jaar = 2024 THEN bedrag_euros END) <> 0 THEN 1 ELSE 0 END) AS years_with_data,
+    RANDOM() AS random_order
+FROM combined_data
+GROUP BY ontvanger_key;
+
+-- =====================================================
+-- Indexes (029 + 078 keyset + 009 trigram + module_mask)
+-- =====================================================
+CREATE UNIQUE INDEX idx_universal_search_key ON universal_search(ontvanger_key);
+CREATE INDEX idx_universal_search_ontvanger ON universal_search(ontvanger);
+CREATE INDEX idx_universal_search_ontvanger_trgm ON universal_search USING gin (ontvanger gin_trgm_ops);
+CREATE INDEX idx_universal_search_sources ON universal_search(sources);
+CREATE INDEX idx_universal_search_module_mask ON universal_search(module_mask);
+CREATE INDEX idx_universal_search_totaal ON universal_search(totaal DESC);
+CREATE INDEX idx_universal_search_random ON universal_search(random_order);
+CREATE INDEX idx_universal_search_years ON universal_search(years_with_data);
+CREATE INDEX idx_universal_search_years_random ON universal_search(years_with_data, random_order);
+CREATE INDEX idx_universal_search_record_count ON universal_search(record_count);
+
+CREATE INDEX idx_universal_search_totaal_key ON universal_search (totaal, ontvanger_key);
+CREATE INDEX idx_universal_search_ontvanger_key ON universal_search (ontvanger, ontvanger_key);
+CREATE INDEX idx_universal_search_record_count_key ON universal_search (record_count, ontvanger_key);
+CREATE INDEX idx_universal_search_2016_key ON universal_search ("2016", ontvanger_key);
+CREATE INDEX idx_universal_search_2017_key ON universal_search ("2017", ontvanger_key);
+CREATE INDEX idx_universal_search_2018_key ON universal_search ("2018", ontvanger_key);
+CREATE INDEX idx_universal_search_2019_key ON universal_search ("2019", ontvanger_key);
+CREATE INDEX idx_universal_search_2020_key ON universal_search ("2020", ontvanger_key);
+CREATE INDEX idx_universal_search_2021_key ON universal_search ("2021", ontvanger_key);
+CREATE INDEX idx_universal_search_2022_key ON universal_search ("2022", ontvanger_key);
+CREATE INDEX idx_universal_search_2023_key ON universal_search ("2023", ontvanger_key);
+CREATE INDEX idx_universal_search_2024_key ON universal_search ("2024", ontvanger_key);
+
+-- Backend-only (031): recreated views get the default grants again
+REVOKE SELECT ON universal_search FROM anon, authenticated;
+
+ANALYZE universal_search;
+
+-- =====================================================
+-- VERIFY
+-- =====================================================
+-- 1. Mask matches the sources string (expect 0)
+SELECT COUNT(*) AS mismatches
+FROM universal_search
+WHERE ((module_mask & 1) <> 0) <> (sources LIKE '%Financiële instrumenten%')
+   OR ((module_mask & 2) <> 0) <> (sources LIKE '%Gemeentelijke subsidieregisters%')
+   OR ((module_mask & 4) <> 0) <> (sources LIKE '%Inkoopuitgaven%')
+   OR ((module_mask & 8) <> 0) <> (sources LIKE '%Provinciale subsidieregisters%')
+   OR ((module_mask & 16) <> 0) <> (sources LIKE '%Publiek%');
+
+-- 2. Recipients per module combination
+SELECT module_mask, sources, COUNT(*) AS recipients
+FROM universal_search
+GROUP BY module_mask, sources
+ORDER BY recipients DESC;
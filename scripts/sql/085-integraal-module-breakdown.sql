@@ -0,0 +1,136 @@
+-- Migration 085: Per-module breakdown per recipient for integraal details
+--
+-- Expanding an integraal row ran five queries in parallel, one SUM per module
+-- view (instrumenten_aggregated, inkoop_aggregated and the 079 recipient
+-- rollups), each on its own pool connection.
+--
+-- integraal_module_breakdown stores those five results per recipient key:
+--   recipient_key   normalize_recipient() key, same as the *_key columns of
+--                   the module views (not universal_search.ontvanger_key,
+--                   which is UPPER() only)
+--   instrumenten, inkoop, provincie, gemeente, publiek
+--                   NUMERIC[11]: "2016".."2024", totaal, row_count of that
+--                   module's view row, unrounded (the API truncates them
+--                   like the module table rows); NULL when the recipient is
+--                   not in the module
+-- One row fetch (unique index on recipient_key) answers the breakdown,
+-- including the jaar filter (module shown only when its year value > 0). A
+-- page of rows is expanded with recipient_key = ANY($1).
+--
+-- Built FROM the module views: refresh AFTER instrumenten_aggregated,
+-- inkoop_aggregated and the *_recipient_aggregated rollups
+-- (refresh-all-views.sql, and refresh_all_views() as recreated below).
+-- Re-running 028/079 (DROP ... CASCADE) drops this view too: run 085 again
+-- afterwards.
+--
+-- Execute on Supabase BEFORE deploying code.
+
+DROP MATERIALIZED VIEW IF EXISTS integraal_module_breakdown;
+
+CREATE MATERIALIZED VIEW integraal_module_breakdown AS
+WITH module_rows AS (
+    SELECT ontvanger_key AS recipient_key, 'instrumenten' AS module,
+           ARRAY["2016", "2017", "2018", "2019", "2020", "2021", "2022", "2023", "2024",
+                 totaal, row_count]::NUMERIC[] AS vec
+    FROM instrumenten_aggregated
+
+    UNION ALL
+
+    SELECT leverancier_key, 'inkoop',
+           ARRAY["2016", "2017", "2018", "2019", "2020", "2021", "2022", "2023", "2024",
+                 totaal, row_count]::NUMERIC[]
+    FROM inkoop_aggregated
+
+    UNION ALL
+
+    SELECT ontvanger_key, 'provincie',
+           ARRAY["2016", "2017", "2018", "2019", "2020", "2021", "2022", "2023", "2024",
+                 totaal, row_count]::NUMERIC[]
+    FROM provincie_recipient_aggregated
+
+    UNION ALL
+
+    SELECT ontvanger_key, 'gemeente',
+           ARRAY["2016", "2017", "2018", "2019", "2020", "2021", "2022", "2023", "2024",
+                 totaal, row_count]::NUMERIC[]
+    FROM gemeente_recipient_aggregated
+
+    UNION ALL
+
+    SELECT ontvanger_key, 'publiek',
+           ARRAY["2016", "2017", "2018", "2019", "2020", "2021", "2022", "2023", "2024",
+                 totaal, row_count]::NUMERIC[]
+    FROM publiek_recipient_aggregated
+)
+-- Keys are unique per view, so MAX() picks the module's only row
+SELECT
+    recipient_key,
+    MAX(vec) FILTER (WHERE module = 'instrumenten') AS instrumenten,
+    MAX(vec) FILTER (WHERE module = 'inkoop') AS inkoop,
+    MAX(vec) FILTER (WHERE module = 'provincie') AS provincie,
+    MAX(vec) FILTER (WHERE module = 'gemeente') AS gemeente,
+    MAX(vec) FILTER (WHERE module = 'publiek') AS publiek
+FROM module_rows
+WHERE recipient_key IS NOT NULL
+GROUP BY recipient_key;
+
+-- Lookup by key (single row and page expansion); unique for REFRESH CONCURRENTLY
+CREATE UNIQUE INDEX idx_integraal_module_breakdown_key ON integraal_module_breakdown (recipient_key);
+
+-- Backend-only, like the other API views
+REVOKE SELECT ON integraal_module_breakdown FROM anon, authenticated;
+
+ANALYZE integraal_module_breakdown;
+
+-- Recreate refresh_all_views() (083) so it also refreshes integraal_module_breakdown
+-- before bump_data_generation(): otherwise the API caches stale data under
+-- the new generation
+CREATE OR REPLACE FUNCTION refresh_all_views()
+RETURNS TEXT AS $$
+BEGIN
+    -- Refresh aggregated views (for API performance)
+    REFRESH MATERIALIZED VIEW instrumenten_aggregated;
+    REFRESH MATERIALIZED VIEW apparaat_aggregated;
+    REFRESH MATERIALIZED VIEW inkoop_aggregated;
+    REFRESH MATERIALIZED VIEW provincie_aggregated;
+    REFRESH MATERIALIZED VIEW gemeente_aggregated;
+    REFRESH MATERIALIZED VIEW publiek_aggregated;
+
+    -- Recipient-level rollups (079), built from the per-entity views above
+    REFRESH MATERIALIZED VIEW provincie_recipient_aggregated;
+    REFRESH MATERIALIZED VIEW gemeente_recipient_aggregated;
+    REFRESH MATERIALIZED VIEW publiek_recipient_aggregated;
+
+    -- Integraal module breakdown (085), built from the views and rollups above
+    REFRESH MATERIALIZED VIEW CONCURRENTLY integraal_module_breakdown;
+
+    -- "Ook in" match context (081), built from the source tables
+    REFRESH MATERIALIZED VIEW search_match_context;
+
+    -- Filter dropdown values (083), built from the source tables
+    REFRESH MATERIALIZED VIEW CONCURRENTLY filter_dictionary;
+
+    -- Refresh cross-module search view (with entity resolution)
+    REFRESH MATERIALIZED VIEW CONCURRENTLY universal_search;
+
+    -- Invalidate API caches (after ALL refreshes)
+    PERFORM bump_data_generation();
+
+    RETURN 'All views refreshed successfully';
+END;
+$$ LANGUAGE plpgsql;
+
+-- =====================================================
+-- VERIFY
+-- =====================================================
+-- 1. Recipients per module
+SELECT COUNT(*) AS recipients,
+       COUNT(instrumenten) AS instrumenten, COUNT(inkoop) AS inkoop,
+       COUNT(provincie) AS provincie, COUNT(gemeente) AS gemeente, COUNT(publiek) AS publiek
+FROM integraal_module_breakdown;
+
+-- 2. Same totaal as the module view (expect 0)
+SELECT COUNT(*) AS mismatches
+FROM integraal_module_breakdown b
+JOIN instrumenten_aggregated a ON a.ontvanger_key = b.recipient_key
+WHERE b.instrumenten[10] <> a.totaal;
@@ -0,0 +1,95 @@
+-- Migration 086: Precomputed module statistics for the search placeholder
+--
+-- GET /modules/{module}/stats ("Doorzoek X ontvangers (€Y miljard)") ran
+--   SELECT COUNT(*), SUM(totaal) FROM <module view>
+-- on every page load: a full scan of the module's view, or of all of
+-- universal_search (451K rows) for integraal. The numbers only change when
+-- the views are refreshed.
+--
+-- module_stats holds one row per module (the API modules, incl. integraal):
+--   module        module name as in the API path
+--   entity_count  rows of the module's table view (unique recipients,
+--                 kostensoorten for apparaat)
+--   total         SUM(totaal) of that view
+-- Same tables as the former query: instrumenten/apparaat/inkoop_aggregated,
+-- the 079 recipient rollups, universal_search.
+--
+-- The API reads all rows once per data generation and serves them from
+-- memory; after a refresh it keeps serving the previous numbers while one
+-- background load picks up the new ones (stale-while-revalidate).
+--
+-- Built FROM the other views: refresh LAST, after universal_search and before
+-- bump_data_generation() (refresh-all-views.sql, and refresh_all_views() as
+-- recreated below).
+--
+-- Execute on Supabase BEFORE deploying code.
+
+DROP MATERIALIZED VIEW IF EXISTS module_stats;
+
+CREATE MATERIALIZED VIEW module_stats AS
+SELECT 'instrumenten'::text AS module, COUNT(*) AS entity_count, COALESCE(SUM(totaal), 0)::BIGINT AS total
+FROM instrumenten_aggregated
+UNION ALL
+SELECT 'apparaat', COUNT(*), COALESCE(SUM(totaal), 0)::BIGINT FROM apparaat_aggregated
+UNION ALL
+SELECT 'inkoop', COUNT(*), COALESCE(SUM(totaal), 0)::BIGINT FROM inkoop_aggregated
+UNION ALL
+SELECT 'provincie', COUNT(*), COALESCE(SUM(totaal), 0)::BIGINT FROM provincie_recipient_aggregated
+UNION ALL
+SELECT 'gemeente', COUNT(*), COALESCE(SUM(totaal), 0)::BIGINT FROM gemeente_recipient_aggregated
+UNION ALL
+SELECT 'publiek', COUNT(*), COALESCE(SUM(totaal), 0)::BIGINT FROM publiek_recipient_aggregated
+UNION ALL
+SELECT 'integraal', COUNT(*), COALESCE(SUM(totaal), 0)::BIGINT FROM universal_search;
+
+-- Unique for REFRESH CONCURRENTLY
+CREATE UNIQUE INDEX idx_module_stats_module ON module_stats (module);
+
+-- Backend-only, like the other API views
+REVOKE SELECT ON module_stats FROM anon, authenticated;
+
+-- Recreate refresh_all_views() (085) so it also refreshes module_stats
+-- before bump_data_generation(): otherwise the API caches stale data under
+-- the new generation
+CREATE OR REPLACE FUNCTION refresh_all_views()
+RETURNS TEXT AS $$
+BEGIN
+    -- Refresh aggregated views (for API performance)
+    REFRESH MATERIALIZED VIEW instrumenten_aggregated;
+    REFRESH MATERIALIZED VIEW apparaat_aggregated;
+    REFRESH MATERIALIZED VIEW inkoop_aggregated;
+    REFRESH MATERIALIZED VIEW provincie_aggregated;
+    REFRESH MATERIALIZED VIEW gemeente_aggregated;
+    REFRESH MATERIALIZED VIEW publiek_aggregated;
+
+    -- Recipient-level rollups (079), built from the per-entity views above
+    REFRESH MATERIALIZED VIEW provincie_recipient_aggregated;
+    REFRESH MATERIALIZED VIEW gemeente_recipient_aggregated;
+    REFRESH MATERIALIZED VIEW publiek_recipient_aggregated;
+
+    -- Integraal module breakdown (085), built from the views and rollups above
+    REFRESH MATERIALIZED VIEW CONCURRENTLY integraal_module_breakdown;
+
+    -- "Ook in" match context (081), built from the source tables
+    REFRESH MATERIALIZED VIEW search_match_context;
+
+    -- Filter dropdown values (083), built from the source tables
+    REFRESH MATERIALIZED VIEW CONCURRENTLY filter_dictionary;
+
+    -- Refresh cross-module search view (with entity resolution)
+    REFRESH MATERIALIZED VIEW CONCURRENTLY universal_search;
+
+    -- Module stats (086), built from all views above: refresh last
+    REFRESH MATERIALIZED VIEW CONCURRENTLY module_stats;
+
+    -- Invalidate API caches (after ALL refreshes)
+    PERFORM bump_data_generation();
+
+    RETURN 'All views refreshed successfully';
+END;
+$$ LANGUAGE plpgsql;
+
+-- =====================================================
+-- VERIFY
+-- =====================================================
+SELECT module, entity_count, total FROM module_stats ORDER BY module;
@@ -3,6 +3,12 @@
 -- Description: Run this after any data import/update
 -- Created: 2026-01-26
 -- Updated: 2026-01-29 - Added note about random_order regeneration
+-- Updated: 2026-10-17 - Bump data_generation to invalidate API caches (077)
+-- Updated: 2026-10-17 - Recipient rollups for entity modules (079)
+-- Updated: 2026-10-17 - "Ook in" match context (081)
+-- Updated: 2026-10-17 - Filter dropdown values (083)
+-- Updated: 2026-10-17 - Integraal module breakdown (085)
+-- Updated: 2026-10-17 - Module stats for the search placeholder (086)
 -- Usage: Run in Supabase SQL Editor after data changes
 -- =====================================================
 
@@ -29,10 +35,40 @@ ANALYZE gemeente_aggregated;
 REFRESH MATERIALIZED VIEW publiek_aggregated;
 ANALYZE publiek_aggregated;
 
+-- Recipient-level rollups (079): built from the per-entity views above,
+-- so they must be refreshed AFTER them
+REFRESH MATERIALIZED VIEW provincie_recipient_aggregated;
+ANALYZE provincie_recipient_aggregated;
+
+REFRESH MATERIALIZED VIEW gemeente_recipient_aggregated;
+ANALYZE gemeente_recipient_aggregated;
+
+REFRESH MATERIALIZED VIEW publiek_recipient_aggregated;
+ANALYZE publiek_recipient_aggregated;
+
+-- Integraal module breakdown (085): built from instrumenten_aggregated,
+-- inkoop_aggregated and the rollups above, so it must be refreshed AFTER them
+REFRESH MATERIALIZED VIEW CONCURRENTLY integraal_module_breakdown;
+ANALYZE integraal_module_breakdown;
+
+-- "Ook in" match context (081), built from the source tables
+REFRESH MATERIALIZED VIEW search_match_context;
+ANALYZE search_match_context;
+
+-- Filter dropdown values (083), built from the source tables
+REFRESH MATERIALIZED VIEW CONCURRENTLY filter_dictionary;
+ANALYZE filter_dictionary;
+
 -- Refresh cross-module search view
 REFRESH MATERIALIZED VIEW CONCURRENTLY universal_search;
 ANALYZE universal_search;
 
+-- Module stats (086): built from all views above, so it must be refreshed LAST
+REFRESH MATERIALIZED VIEW CONCURRENTLY module_stats;
+
+-- Invalidate API caches on all replicas (must run AFTER all refreshes)
+SELECT bump_data_generation();
+
 -- Verify row counts
 SELECT 'instrumenten_aggregated' as view_name, COUNT(*) as rows FROM instrumenten_aggregated
 UNION ALL SELECT 'apparaat_aggregated', COUNT(*) FROM apparaat_aggregated
@@ -40,5 +76,12 @@ UNION ALL SELECT 'inkoop_aggregated', COUNT(*) FROM inkoop_aggregated
 UNION ALL SELECT 'provincie_aggregated', COUNT(*) FROM provincie_aggregated
 UNION ALL SELECT 'gemeente_aggregated', COUNT(*) FROM gemeente_aggregated
 UNION ALL SELECT 'publiek_aggregated', COUNT(*) FROM publiek_aggregated
+UNION ALL SELECT 'provincie_recipient_aggregated', COUNT(*) FROM provincie_recipient_aggregated
+UNION ALL SELECT 'gemeente_recipient_aggregated', COUNT(*) FROM gemeente_recipient_aggregated
+UNION ALL SELECT 'publiek_recipient_aggregated', COUNT(*) FROM publiek_recipient_aggregated
+UNION ALL SELECT 'integraal_module_breakdown', COUNT(*) FROM integraal_module_breakdown
+UNION ALL SELECT 'search_match_context', COUNT(*) FROM search_match_context
+UNION ALL SELECT 'filter_dictionary', COUNT(*) FROM filter_dictionary
 UNION ALL SELECT 'universal_search', COUNT(*) FROM universal_search
+UNION ALL SELECT 'module_stats', COUNT(*) FROM module_stats
 ORDER BY view_name;
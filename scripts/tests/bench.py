@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+API throughput benchmark — requests/sec on /api/v1/modules/{module}
+===================================================================
+Runs N concurrent clients against one endpoint for a fixed time and reports
+requests/sec and latency percentiles. Used to compare backend versions
+(e.g. middleware changes): run it against the old and the new build on the
+same machine and database, same arguments.
+
+Usage:
+  BFF_SECRET=<secret> API_BASE=http://localhost:8000 python3 scripts/tests/bench.py
+  python3 scripts/tests/bench.py --module integraal --concurrency 32 --duration 30
+  python3 scripts/tests/bench.py --query "limit=25&sort_by=totaal"
+
+Environment variables (same as lib.sh):
+  API_BASE    - Backend URL (default: http://localhost:8000)
+  BFF_SECRET  - Sent as X-BFF-Secret (required when the backend has one)
+
+All requests come from one client IP, so start the benchmarked backend with
+a rate limit above the expected throughput, e.g.
+RATE_LIMIT_AUTHENTICATED_PER_MINUTE=1000000. 429 responses are counted
+separately and excluded from the latency figures.
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+try:
+    import httpx
+except ImportError:
+    print("Missing dependencies. Install with:")
+    print("  pip install httpx")
+    sys.exit(1)
+
+API_BASE = os.environ.get("API_BASE", "http://localhost:8000")
+BFF_SECRET = os.environ.get("BFF_SECRET", "")
+
+
+async def worker(client: httpx.AsyncClient, url: str, deadline: float, stats: dict) -> None:
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        try:
+            response = await client.get(url)
+        except httpx.HTTPError:
+            stats["errors"] += 1
+            continue
+        elapsed = time.perf_counter() - start
+        if response.status_code == 429:
+            stats["rate_limited"] += 1
+        elif response.status_code == 200:
+            stats["latencies"].append(elapsed)
+        else:
+            stats["errors"] += 1
+            stats["statuses"][response.status_code] = stats["statuses"].get(response.status_code, 0) + 1
+
+
+def percentile(values: list[float], p: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * p))]
+
+
+async def run(args: argparse.Namespace) -> None:
+    url = f"{API_BASE.rstrip('/')}/api/v1/modules/{args.module}"
+    if args.query:
+        url += f"?{args.query}"
+    headers = {"X-BFF-Secret": BFF_SECRET} if BFF_SECRET else {}
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+
+    async with httpx.AsyncClient(headers=headers, limits=limits, timeout=30.0) as client:
+        # Warm-up: connections, caches, first-request costs
+        warmup = await client.get(url)
+        if warmup.status_code != 200:
+            print(f"Warm-up request failed: HTTP {warmup.status_code} {warmup.text[:200]}")
+            sys.exit(1)
+
+        stats = {"latencies": [], "errors": 0, "rate_limited": 0, "statuses": {}}
+        start = time.perf_counter()
+        deadline = start + args.duration
+        await asyncio.gather(*(worker(client, url, deadline, stats) for _ in range(args.concurrency)))
+        wall = time.perf_counter() - start
+
+    latencies = stats["latencies"]
+    print(f"URL:          {url}")
+    print(f"Concurrency:  {args.concurrency}, duration {wall:.1f}s")
+    print(f"Requests:     {len(latencies)} ok, {stats['rate_limited']} rate limited, {stats['errors']} errors")
+    if stats["statuses"]:
+        print(f"Other status: {stats['statuses']}")
+    print(f"Throughput:   {len(latencies) / wall:.1f} req/s")
+    print(
+        f"Latency:      p50 {percentile(latencies, 0.50) * 1000:.1f}ms, "
+        f"p95 {percentile(latencies, 0.95) * 1000:.1f}ms, "
+        f"p99 {percentile(latencies, 0.99) * 1000:.1f}ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Requests/sec on /api/v1/modules/{module}")
+    parser.add_argument("--module", default="instrumenten", help="Module path segment (default: instrumenten)")
+    parser.add_argument("--query", default="", help="Query string without '?' (default: none)")
+    parser.add_argument("--concurrency", type=int, default=16, help="Concurrent clients (default: 16)")
+    parser.add_argument("--duration", type=float, default=15.0, help="Seconds to run (default: 15)")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()